@@ -0,0 +1,50 @@
+import hashlib
+import inspect
+import pickle
+
+import pytest
+
+pytest.importorskip("aiocache")
+
+from zodiac_core.cache.decorators import _compile_key_builder, _normalize_key_part
+
+
+def _legacy_key_builder(fn, args, kwargs):
+    """Reference: the per-call default key builder before it was precompiled."""
+    base = f"{fn.__module__}:{fn.__qualname__}"
+    inspect.signature(fn)
+    normalized_args = tuple(_normalize_key_part(arg) for arg in args)
+    normalized_kwargs = tuple((key, _normalize_key_part(value)) for key, value in sorted(kwargs.items()))
+    raw = pickle.dumps((normalized_args, normalized_kwargs))
+    return f"{base}:{hashlib.sha256(raw).hexdigest()[:16]}"
+
+
+async def get_user(tenant: str, user_id: int, *, include_deleted: bool = False):
+    return None
+
+
+ARGS = ("acme", 42)
+KWARGS = {"include_deleted": True}
+TUPLE_ARGS = ("acme", (42, "profile", None))
+
+
+class TestCacheKeyBuilderBenchmarks:
+    """Default @cached key building: legacy per-call path vs precompiled builder."""
+
+    @pytest.mark.benchmark(group="cache-key-scalar")
+    def test_key_builder_legacy_scalar(self, benchmark):
+        benchmark(_legacy_key_builder, get_user, ARGS, KWARGS)
+
+    @pytest.mark.benchmark(group="cache-key-scalar")
+    def test_key_builder_compiled_scalar(self, benchmark):
+        builder = _compile_key_builder(get_user)
+        benchmark(builder, get_user, ARGS, KWARGS)
+
+    @pytest.mark.benchmark(group="cache-key-tuple")
+    def test_key_builder_legacy_tuple(self, benchmark):
+        benchmark(_legacy_key_builder, get_user, TUPLE_ARGS, {})
+
+    @pytest.mark.benchmark(group="cache-key-tuple")
+    def test_key_builder_compiled_tuple(self, benchmark):
+        builder = _compile_key_builder(get_user)
+        benchmark(builder, get_user, TUPLE_ARGS, {})
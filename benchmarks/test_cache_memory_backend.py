@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiocache")
+
+from aiocache import SimpleMemoryCache
+
+from zodiac_core.cache.backends import ZodiacMemoryCache
+
+KEYS = [f"key:{i}" for i in range(10_000)]
+
+
+async def _fill_with_ttl(backend) -> None:
+    for key in KEYS:
+        await backend.set(key, key, ttl=300)
+    await backend.clear()
+    await backend.close()
+
+
+class TestCacheMemoryBackendBenchmarks:
+    """Writing 10k TTL entries: per-key call_later handles vs a single timer-wheel sweeper."""
+
+    @pytest.mark.benchmark(group="cache-memory-backend-set-ttl")
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            pytest.param(SimpleMemoryCache, id="aiocache-simple-memory"),
+            pytest.param(lambda: ZodiacMemoryCache(max_entries=20_000), id="zodiac-memory"),
+        ],
+    )
+    def test_set_with_ttl(self, benchmark, factory):
+        benchmark.pedantic(lambda: asyncio.run(_fill_with_ttl(factory())), rounds=5, iterations=1)
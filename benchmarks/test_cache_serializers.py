@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("aiocache")
+
+from aiocache.serializers import PickleSerializer
+
+from zodiac_core.cache.serializers import ZodiacSerializer
+
+from .conftest import BenchmarkUser
+
+PAYLOAD = {"items": [BenchmarkUser(id=i, name=f"User {i}", email=f"user{i}@example.com") for i in range(500)]}
+
+
+def _serializers():
+    candidates = [
+        ("pickle", lambda: PickleSerializer()),
+        ("json", lambda: ZodiacSerializer(compression=None)),
+        ("json-zlib", lambda: ZodiacSerializer(compression="zlib")),
+        ("orjson", lambda: ZodiacSerializer(format="orjson", compression=None)),
+        ("orjson-zstd", lambda: ZodiacSerializer(format="orjson", compression="zstd")),
+        ("msgpack", lambda: ZodiacSerializer(format="msgpack", compression=None)),
+    ]
+    params = []
+    for name, factory in candidates:
+        try:
+            params.append(pytest.param(factory(), id=name))
+        except ImportError:
+            params.append(pytest.param(None, id=name, marks=pytest.mark.skip(reason="optional codec not installed")))
+    return params
+
+
+class TestCacheSerializerBenchmarks:
+    """Cache serializers on 500 Pydantic models: dumps/loads latency and payload size (extra_info)."""
+
+    @pytest.mark.benchmark(group="cache-serializer-dumps")
+    @pytest.mark.parametrize("serializer", _serializers())
+    def test_serializer_dumps(self, benchmark, serializer):
+        payload = benchmark(serializer.dumps, PAYLOAD)
+        benchmark.extra_info["size_bytes"] = len(payload)
+
+    @pytest.mark.benchmark(group="cache-serializer-loads")
+    @pytest.mark.parametrize("serializer", _serializers())
+    def test_serializer_loads(self, benchmark, serializer):
+        payload = serializer.dumps(PAYLOAD)
+        benchmark.extra_info["size_bytes"] = len(payload)
+        assert benchmark(serializer.loads, payload) == PAYLOAD
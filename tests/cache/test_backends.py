@@ -0,0 +1,173 @@
+"""Tests for ZodiacMemoryCache (bounded LRU, timer-wheel expiry, aiocache API)."""
+
+import asyncio
+
+import pytest
+from aiocache.lock import RedLock
+from aiocache.serializers import PickleSerializer
+
+from zodiac_core.cache import ZodiacCache, cache
+from zodiac_core.cache.backends import ZodiacMemoryCache
+
+
+class TestZodiacMemoryCacheBounds:
+    """LRU eviction by entry count and by payload bytes."""
+
+    @pytest.mark.asyncio
+    async def test_max_entries_evicts_least_recently_used(self):
+        backend = ZodiacMemoryCache(max_entries=2)
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        assert await backend.get("a") == 1  # "b" is now least recently used
+        await backend.set("c", 3)
+        assert await backend.get("b") is None
+        assert await backend.get("a") == 1
+        assert await backend.get("c") == 3
+        assert backend.size == 2
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_accounts_serialized_size(self):
+        backend = ZodiacMemoryCache(serializer=PickleSerializer(), max_bytes=300)
+        for i in range(10):
+            await backend.set(f"k{i}", "x" * 50)
+        assert backend.bytes_used <= 300
+        assert await backend.get("k9") == "x" * 50
+        assert await backend.get("k0") is None
+
+    @pytest.mark.asyncio
+    async def test_oversized_value_is_not_kept(self):
+        backend = ZodiacMemoryCache(max_bytes=10)
+        await backend.set("big", b"x" * 11)
+        assert await backend.get("big") is None
+        assert backend.bytes_used == 0
+
+    @pytest.mark.asyncio
+    async def test_overwrite_and_delete_update_bytes(self):
+        backend = ZodiacMemoryCache()
+        await backend.set("k", b"12345")
+        await backend.set("k", b"12")
+        assert backend.bytes_used == 2
+        assert await backend.delete("k") == 1
+        assert backend.bytes_used == 0
+
+    def test_invalid_bounds_raise(self):
+        with pytest.raises(ValueError, match="max_entries"):
+            ZodiacMemoryCache(max_entries=0)
+        with pytest.raises(ValueError, match="max_bytes"):
+            ZodiacMemoryCache(max_bytes=0)
+        with pytest.raises(ValueError, match="sweep_interval"):
+            ZodiacMemoryCache(sweep_interval=0)
+
+
+class TestZodiacMemoryCacheExpiry:
+    """TTL entries are hidden once expired and reclaimed by one sweeper task."""
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_not_returned(self):
+        backend = ZodiacMemoryCache(sweep_interval=60)
+        await backend.set("k", "v", ttl=0.01)
+        await asyncio.sleep(0.02)
+        assert await backend.get("k") is None
+        assert await backend.exists("k") is False
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_single_sweeper_reclaims_expired_entries(self):
+        backend = ZodiacMemoryCache(sweep_interval=0.01)
+        for i in range(100):
+            await backend.set(f"k{i}", i, ttl=0.02)
+        await backend.set("forever", 1)
+        sweeper = backend._sweeper
+        assert sweeper is not None
+
+        await asyncio.sleep(0.1)
+        assert backend.size == 1
+        assert sweeper.done()  # stops once no TTL entries are left
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_sweep_skips_keys_whose_ttl_was_extended(self):
+        backend = ZodiacMemoryCache(sweep_interval=60)
+        await backend.set("k", "v", ttl=0.01)
+        await backend.expire("k", 60)
+        await asyncio.sleep(0.02)
+        assert backend._sweep(asyncio.get_running_loop().time() + 1) == 0
+        assert await backend.get("k") == "v"
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_wheel_stays_bounded_by_the_store(self):
+        backend = ZodiacMemoryCache(max_entries=100, sweep_interval=60)
+        for i in range(5000):
+            await backend.set(f"k{i}", i, ttl=3600)
+        for i in range(1000):
+            await backend.set("k4999", i, ttl=60 + i * 60)  # overwrite with a new deadline each time
+        await backend.expire("k4998", 120)
+        await backend.increment("k4997")
+        await backend.delete("k4996")
+
+        wheel_keys = [key for bucket in backend._wheel.values() for key in bucket]
+        assert backend.size == 99
+        assert sorted(wheel_keys) == sorted(backend._data)
+        assert all(backend._wheel.values())  # no empty buckets left behind
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_sweeper(self):
+        backend = ZodiacMemoryCache(sweep_interval=60)
+        await backend.set("k", "v", ttl=30)
+        sweeper = backend._sweeper
+        await backend.close()
+        await asyncio.sleep(0)
+        assert sweeper.cancelled()
+
+
+class TestZodiacMemoryCacheApi:
+    """aiocache operations used by ZodiacCache (add, increment, RedLock, clear)."""
+
+    @pytest.mark.asyncio
+    async def test_add_and_increment(self):
+        backend = ZodiacMemoryCache()
+        await backend.add("k", 1)
+        with pytest.raises(ValueError, match="already exists"):
+            await backend.add("k", 2)
+        assert await backend.increment("n") == 1
+        assert await backend.increment("n", 5) == 6
+
+    @pytest.mark.asyncio
+    async def test_redlock(self):
+        backend = ZodiacMemoryCache()
+        async with RedLock(backend, "res", lease=5):
+            assert await backend.exists("res-lock")
+        assert not await backend.exists("res-lock")
+
+    @pytest.mark.asyncio
+    async def test_clear_namespace(self):
+        backend = ZodiacMemoryCache(namespace="ns")
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.clear()
+        assert backend.size == 0
+        assert backend.bytes_used == 0
+
+    @pytest.mark.asyncio
+    async def test_drop_in_for_cache_setup(self):
+        cache.setup(
+            prefix="zmem",
+            cache="zodiac_core.cache.backends.ZodiacMemoryCache",
+            max_entries=10,
+            default_ttl=60,
+        )
+        assert isinstance(cache.cache.backend, ZodiacMemoryCache)
+
+        async def producer():
+            return "v"
+
+        assert await cache.cache.get_or_set("k", producer) == "v"
+        assert await cache.cache.get("k") == "v"
+
+    @pytest.mark.asyncio
+    async def test_tag_invalidation(self):
+        zc = ZodiacCache(ZodiacMemoryCache(serializer=PickleSerializer()), default_ttl=60)
+        await zc.invalidate_tags(["t"])
+        assert await zc.tag_versions(["t"]) == {"t": 1}
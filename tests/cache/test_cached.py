@@ -1,9 +1,15 @@
 """Tests for @cached decorator (key from fn+args, name, skip_cache_func, exceptions)."""
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from zodiac_core.cache import cache, cached
+from zodiac_core.cache import cache, cached, cached_batch, memoize_request
+from zodiac_core.cache import decorators as decorators_module
 from zodiac_core.cache.manager import ZODIAC_CACHE_NAMESPACE
+from zodiac_core.context import get_request_id, request_id_scope, request_memo_scope
 
 
 class TestCachedDecorator:
@@ -289,3 +295,356 @@ class TestCachedDecoratorSelfReceiver:
 
         with pytest.raises(TypeError, match="provide key_builder explicitly"):
             await Service().fetch(1)
+
+
+class TestCachedDecoratorStaleWhileRevalidate:
+    """@cached(stale_ttl=...) forwards to get_or_set."""
+
+    @pytest.mark.asyncio
+    async def test_cached_forwards_stale_ttl(self, monkeypatch):
+        cache.setup(prefix="deco_swr", default_ttl=300)
+        seen = {}
+        original = cache.cache.get_or_set
+
+        async def spy(key, producer, **kwargs):
+            seen.update(kwargs)
+            return await original(key, producer, **kwargs)
+
+        monkeypatch.setattr(cache.cache, "get_or_set", spy)
+
+        @cached(ttl=10, stale_ttl=30)
+        async def fetch(x: int):
+            return x
+
+        assert await fetch(1) == 1
+        assert seen["stale_ttl"] == 30
+        assert seen["ttl"] == 10
+
+
+class TestCachedBatchDecorator:
+    """@cached_batch caches per id and calls the loader once with missing ids."""
+
+    @pytest.mark.asyncio
+    async def test_cached_batch_only_loads_missing_ids(self):
+        cache.setup(prefix="deco_batch", default_ttl=300)
+        seen = []
+
+        @cached_batch(ttl=60)
+        async def get_users(user_ids: list, tenant: str = "t1"):
+            seen.append(list(user_ids))
+            return {user_id: f"{tenant}:{user_id}" for user_id in user_ids if user_id != 404}
+
+        assert await get_users([1, 2]) == {1: "t1:1", 2: "t1:2"}
+        assert await get_users([2, 3, 404, 3]) == {2: "t1:2", 3: "t1:3"}
+        assert seen == [[1, 2], [3, 404]]
+
+        # Extra arguments are part of the per-id key
+        assert await get_users([1], tenant="t2") == {1: "t2:1"}
+        assert seen[-1] == [1]
+
+    @pytest.mark.asyncio
+    async def test_cached_batch_custom_key_builder_and_skip(self):
+        cache.setup(prefix="deco_batch_custom", default_ttl=300)
+        calls = 0
+
+        @cached_batch(ttl=60, key_builder=lambda fn, item_id, args, kwargs: f"user:{item_id}")
+        async def get_users(user_ids: list):
+            nonlocal calls
+            calls += 1
+            return {user_id: None for user_id in user_ids}
+
+        assert await get_users([1]) == {1: None}
+        assert await get_users([1]) == {1: None}
+        assert calls == 2  # None is not stored by default
+        assert await cache.cache.exists("user:1") is False
+
+
+class TestCompiledKeyBuilder:
+    """Default key builder is compiled once per decorated function."""
+
+    def test_signature_inspected_only_at_compile_time(self, monkeypatch):
+        async def fetch(x: int, *, flag: bool = False):
+            return x
+
+        builder = decorators_module._compile_key_builder(fetch)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("inspect.signature must not run per call")
+
+        monkeypatch.setattr(decorators_module.inspect, "signature", fail)
+        assert builder(fetch, (1,), {"flag": True}) == builder(fetch, (1,), {"flag": True})
+
+    def test_scalar_fast_path_skips_pickle(self, monkeypatch):
+        async def fetch(*args, **kwargs):
+            return None
+
+        builder = decorators_module._compile_key_builder(fetch)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pickle must not run for scalar arguments")
+
+        monkeypatch.setattr(decorators_module.pickle, "dumps", fail)
+        key = builder(fetch, (1, "a", None, 2.5, b"x", True), {"k": "v"})
+        assert key.startswith(f"{fetch.__module__}:{fetch.__qualname__}:")
+
+    def test_scalar_keys_distinguish_types_and_kwarg_order(self):
+        async def fetch(*args, **kwargs):
+            return None
+
+        builder = decorators_module._compile_key_builder(fetch)
+        keys = {builder(fetch, (value,), {}) for value in (1, "1", True, 1.0, b"1", None)}
+        assert len(keys) == 6
+        assert builder(fetch, (), {"a": 1, "b": 2}) == builder(fetch, (), {"b": 2, "a": 1})
+
+    def test_default_key_builder_matches_compiled_builder(self):
+        async def fetch(x, y):
+            return None
+
+        compiled = decorators_module._compile_key_builder(fetch)
+        assert decorators_module._default_key_builder(fetch, (1, (2, "a")), {}) == compiled(fetch, (1, (2, "a")), {})
+
+
+class TestCachedDecoratorTags:
+    """@cached(tags=...) entries are invalidated by cache.invalidate_tags."""
+
+    @pytest.mark.asyncio
+    async def test_static_tags(self):
+        cache.setup(prefix="deco_tags", default_ttl=300)
+        calls = 0
+
+        @cached(ttl=60, tags="users")
+        async def fetch(x: int):
+            nonlocal calls
+            calls += 1
+            return x
+
+        await fetch(1)
+        await fetch(2)
+        await fetch(1)
+        assert calls == 2
+
+        await cache.invalidate_tags(["users"])
+        await fetch(1)
+        await fetch(2)
+        assert calls == 4
+
+    @pytest.mark.asyncio
+    async def test_callable_tags_receive_call_arguments(self):
+        cache.setup(prefix="deco_tags_fn", default_ttl=300)
+        calls = 0
+
+        @cached(ttl=60, tags=lambda user_id: ["users", f"user:{user_id}"])
+        async def fetch(user_id: int):
+            nonlocal calls
+            calls += 1
+            return user_id
+
+        await fetch(1)
+        await fetch(2)
+        await cache.invalidate_tags("user:1")
+        await fetch(1)
+        await fetch(2)
+        assert calls == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_on_named_cache(self):
+        cache.setup(prefix="deco_tags_named", name="other", default_ttl=300)
+        calls = 0
+
+        @cached(ttl=60, name="other", tags=["t"])
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return 1
+
+        await fetch()
+        await cache.invalidate_tags(["t"], name="other")
+        await fetch()
+        assert calls == 2
+
+
+class TestCachedDecoratorTTLJitter:
+    """@cached(ttl_jitter=...) forwards the policy; invalid policies fail at decoration time."""
+
+    @pytest.mark.asyncio
+    async def test_ttl_jitter_forwarded(self, monkeypatch):
+        cache.setup(prefix="deco_jitter", default_ttl=300)
+        seen = {}
+        original = cache.cache.get_or_set
+
+        async def recording_get_or_set(key, producer, **kwargs):
+            seen.update(kwargs)
+            return await original(key, producer, **kwargs)
+
+        monkeypatch.setattr(cache.cache, "get_or_set", recording_get_or_set)
+
+        @cached(ttl=60, ttl_jitter=(5, 10))
+        async def fetch(x: int):
+            return x
+
+        assert await fetch(1) == 1
+        assert seen["ttl_jitter"] == (5, 10)
+
+    def test_invalid_ttl_jitter_raises_at_decoration(self):
+        with pytest.raises(ValueError, match="ttl_jitter"):
+            cached(ttl=60, ttl_jitter=(10, 5))
+        with pytest.raises(ValueError, match="ttl_jitter"):
+            cached_batch(ttl=60, ttl_jitter=-1)
+
+
+class TestCachedDecoratorOffload:
+    """@cached(offload=...) runs sync functions off the event loop with context propagation."""
+
+    @pytest.mark.asyncio
+    async def test_sync_function_inline_by_default(self):
+        cache.setup(prefix="deco_inline", default_ttl=300)
+
+        @cached(ttl=60)
+        def fetch(x: int):
+            return threading.get_ident()
+
+        assert await fetch(1) == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_offload_to_default_executor_propagates_context(self):
+        cache.setup(prefix="deco_offload", default_ttl=300)
+
+        @cached(ttl=60, offload=True)
+        def fetch(x: int):
+            return threading.get_ident(), get_request_id()
+
+        with request_id_scope("req-1"):
+            thread_id, request_id = await fetch(1)
+        assert thread_id != threading.get_ident()
+        assert request_id == "req-1"
+        assert await fetch(1) == (thread_id, "req-1")  # cached
+
+    @pytest.mark.asyncio
+    async def test_offload_to_custom_executor(self):
+        cache.setup(prefix="deco_offload_pool", default_ttl=300)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-offload") as pool:
+
+            @cached(ttl=60, offload=pool)
+            def fetch(x: int):
+                return threading.current_thread().name
+
+            assert (await fetch(1)).startswith("cache-offload")
+
+    @pytest.mark.asyncio
+    async def test_offload_does_not_block_the_loop(self):
+        cache.setup(prefix="deco_offload_block", default_ttl=300)
+        started = threading.Event()
+        release = threading.Event()
+
+        @cached(ttl=60, offload=True)
+        def slow(x: int):
+            started.set()
+            # Only released if the event loop keeps running while this blocks.
+            return release.wait(timeout=1)
+
+        task = asyncio.create_task(slow(1))
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        release.set()
+        assert await task is True
+
+    def test_invalid_offload_raises(self):
+        with pytest.raises(TypeError, match="offload"):
+            cached(ttl=60, offload="threads")
+
+
+class TestRequestScopedMemo:
+    """@memoize_request and @cached(request_scope=True) memoize per request without the backend."""
+
+    @pytest.mark.asyncio
+    async def test_memoize_request_runs_once_per_request(self):
+        calls = 0
+
+        @memoize_request()
+        async def fetch(x: int):
+            nonlocal calls
+            calls += 1
+            return [x]
+
+        with request_memo_scope():
+            first = await fetch(1)
+            assert await fetch(1) is first  # same object, no serialization
+            await fetch(2)
+        assert calls == 2
+
+        with request_memo_scope():
+            await fetch(1)
+        assert calls == 3
+
+    @pytest.mark.asyncio
+    async def test_memoize_request_without_scope_always_runs(self):
+        calls = 0
+
+        @memoize_request()
+        def fetch(x: int):
+            nonlocal calls
+            calls += 1
+            return x
+
+        await fetch(1)
+        await fetch(1)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_computation(self):
+        calls = 0
+
+        @memoize_request()
+        async def fetch(x: int):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return x
+
+        with request_memo_scope():
+            assert await asyncio.gather(fetch(1), fetch(1), fetch(1)) == [1, 1, 1]
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_memoized(self):
+        calls = 0
+
+        @memoize_request()
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError("boom")
+            return "ok"
+
+        with request_memo_scope():
+            with pytest.raises(ValueError, match="boom"):
+                await flaky()
+            assert await flaky() == "ok"
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_request_scope_skips_backend_lookups(self, monkeypatch):
+        cache.setup(prefix="deco_request_scope", default_ttl=300)
+        lookups = 0
+        original = cache.cache.get_or_set
+
+        async def counting_get_or_set(*args, **kwargs):
+            nonlocal lookups
+            lookups += 1
+            return await original(*args, **kwargs)
+
+        monkeypatch.setattr(cache.cache, "get_or_set", counting_get_or_set)
+
+        @cached(ttl=60, request_scope=True)
+        async def fetch(x: int):
+            return x
+
+        with request_memo_scope():
+            for _ in range(3):
+                assert await fetch(1) == 1
+        assert lookups == 1
+
+        with request_memo_scope():
+            assert await fetch(1) == 1
+        assert lookups == 2
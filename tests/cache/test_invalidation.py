@@ -0,0 +1,210 @@
+"""Tests for the cross-process invalidation bus and its transports."""
+
+import asyncio
+import os
+import shutil
+import socket
+import tempfile
+
+import pytest
+import pytest_asyncio
+from aiocache import Cache
+
+from zodiac_core.cache import ZodiacCache, cache
+from zodiac_core.cache.invalidation import (
+    InvalidationBus,
+    InvalidationTransport,
+    RedisPubSubTransport,
+    UnixSocketTransport,
+)
+from zodiac_core.cache.local import LocalCache
+
+
+@pytest.fixture
+def bus_dir():
+    # Short path: Unix socket paths are limited to ~108 bytes.
+    directory = tempfile.mkdtemp(prefix="zcbus-")
+    yield directory
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+async def _eventually(predicate, timeout=1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not await predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+def _worker(namespace):
+    """A cache as one process would see it: its own L1 and in-process backend."""
+    return ZodiacCache(Cache(namespace=namespace), default_ttl=60, l1=LocalCache(max_entries=16), name="default")
+
+
+class _FakePubSub:
+    def __init__(self, broker):
+        self._broker = broker
+        self._queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self._broker.subscribers.append(self._queue)
+
+    async def listen(self):
+        while True:
+            yield await self._queue.get()
+
+    async def unsubscribe(self, channel):
+        self._broker.subscribers.remove(self._queue)
+
+    async def aclose(self):
+        pass
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.subscribers = []
+
+    def pubsub(self):
+        return _FakePubSub(self)
+
+    async def publish(self, channel, payload):
+        for queue in self.subscribers:  # like Redis, the publisher receives its own message too
+            queue.put_nowait({"type": "message", "data": payload})
+
+
+@pytest.mark.asyncio
+class TestInvalidationBus:
+    """Invalidations in one process reach the in-process layers of the others."""
+
+    @pytest_asyncio.fixture
+    async def workers(self, bus_dir):
+        a, b = _worker("bus_a"), _worker("bus_b")
+        buses = []
+        for zc in (a, b):
+            bus = InvalidationBus(UnixSocketTransport(bus_dir), lambda name, zc=zc: zc if name == "default" else None)
+            await bus.start()
+            zc._bus = bus
+            buses.append(bus)
+        yield a, b
+        for bus in buses:
+            await bus.close()
+
+    async def test_delete_is_applied_in_other_processes(self, workers):
+        a, b = workers
+        await a.set("k", "a")
+        await b.set("k", "b")
+
+        await a.delete("k")
+
+        async def dropped():
+            return "k" not in b.l1 and await b.backend.get("k") is None
+
+        await _eventually(dropped)
+
+    async def test_tag_invalidation_is_applied_in_other_processes(self, workers):
+        a, b = workers
+        key = await b.tagged_key("k", ["users"])
+        await b.set(key, "v")
+
+        await a.invalidate_tags("users")
+
+        async def invalidated():
+            return await b.tag_versions(["users"]) == {"users": 1}
+
+        await _eventually(invalidated)
+        assert await b.get(await b.tagged_key("k", ["users"])) is None
+
+    async def test_shared_backend_is_not_touched(self, bus_dir, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="shared"), l1=LocalCache(max_entries=4))
+        monkeypatch.setattr(zc, "_backend", object())  # not an in-process backend
+        zc.l1.set("k", "v")
+        await zc.apply_invalidation(keys=["k"], tags=["t"])
+        assert "k" not in zc.l1
+
+    async def test_unknown_cache_and_garbage_are_ignored(self, workers):
+        a, _ = workers
+        await a._bus._on_message(b"not json")
+        await a._bus._on_message(b'{"origin": "x", "cache": "other", "keys": ["k"], "tags": []}')
+
+    async def test_stale_sockets_are_removed(self, bus_dir):
+        stale = os.path.join(bus_dir, "stale.sock")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(stale)
+        sock.close()
+
+        transport = UnixSocketTransport(bus_dir)
+        await transport.start(lambda payload: asyncio.sleep(0))
+        await transport.publish(b"{}")
+        assert not os.path.exists(stale)
+        path = transport.path
+        await transport.close()
+        assert not os.path.exists(path)
+
+    async def test_redis_transport_delivers_to_others_and_skips_own_messages(self):
+        broker = _FakeRedis()
+        a, b = _worker("redis_a"), _worker("redis_b")
+        buses = []
+        for zc in (a, b):
+            bus = InvalidationBus(RedisPubSubTransport(client=broker), lambda name, zc=zc: zc)
+            await bus.start()
+            zc._bus = bus
+            buses.append(bus)
+
+        applied = []
+        original = a.apply_invalidation
+
+        async def recording(keys, tags):
+            applied.append((keys, tags))
+            await original(keys, tags)
+
+        a.apply_invalidation = recording
+        await b.set("k", "v")
+        await a.delete("k")
+
+        async def dropped():
+            return await b.get("k") is None
+
+        await _eventually(dropped)
+        assert applied == []
+        for bus in buses:
+            await bus.close()
+        assert broker.subscribers == []
+
+    async def test_redis_transport_requires_url_or_client(self):
+        with pytest.raises((ValueError, ImportError)):
+            RedisPubSubTransport()
+
+
+@pytest.mark.asyncio
+class TestCacheManagerInvalidationBus:
+    """start_invalidation_bus / stop_invalidation_bus on the manager."""
+
+    async def test_bus_attached_to_existing_and_new_caches(self, bus_dir):
+        cache.setup(prefix="bus", name="first")
+        bus = await cache.start_invalidation_bus(UnixSocketTransport(bus_dir))
+        try:
+            cache.setup(prefix="bus", name="second")
+            assert cache.get_cache("first")._bus is bus
+            assert cache.get_cache("second")._bus is bus
+            with pytest.raises(RuntimeError, match="already running"):
+                await cache.start_invalidation_bus(UnixSocketTransport(bus_dir))
+        finally:
+            await cache.shutdown()
+        assert cache._bus is None
+        assert os.listdir(bus_dir) == []
+
+    async def test_stop_is_idempotent(self):
+        await cache.stop_invalidation_bus()
+        assert cache._bus is None
+
+
+def test_incomplete_transport_cannot_be_instantiated():
+    class NoClose(InvalidationTransport):
+        async def start(self, on_message):
+            pass
+
+        async def publish(self, payload):
+            pass
+
+    with pytest.raises(TypeError, match="close"):
+        NoClose()
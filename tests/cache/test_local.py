@@ -0,0 +1,64 @@
+"""Tests for LocalCache (bounded in-process LRU/TTL near-cache)."""
+
+import time
+
+import pytest
+
+from zodiac_core.cache.local import DEFAULT_L1_TTL, LocalCache
+
+
+class TestLocalCache:
+    """LRU eviction, TTL expiry and validation."""
+
+    def test_set_get_delete(self):
+        l1 = LocalCache(max_entries=4)
+        l1.set("a", 1)
+        assert l1.get("a") == 1
+        assert "a" in l1
+        assert l1.delete("a") is True
+        assert l1.get("a") is None
+        assert l1.delete("a") is False
+
+    def test_evicts_least_recently_used(self):
+        l1 = LocalCache(max_entries=2)
+        l1.set("a", 1)
+        l1.set("b", 2)
+        assert l1.get("a") == 1  # touch "a" so "b" becomes LRU
+        l1.set("c", 3)
+        assert len(l1) == 2
+        assert l1.get("b") is None
+        assert l1.get("a") == 1
+        assert l1.get("c") == 3
+
+    def test_entry_ttl_is_capped_by_cache_ttl(self, monkeypatch):
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        l1 = LocalCache(max_entries=4, ttl=5)
+        l1.set("short", "v", ttl=1)
+        l1.set("long", "v", ttl=60)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 2)
+        assert l1.get("short") is None
+        assert l1.get("long") == "v"
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+        assert l1.get("long") is None
+        assert len(l1) == 0
+
+    def test_entries_always_expire(self, monkeypatch):
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        l1 = LocalCache(max_entries=4)
+        assert l1.ttl == DEFAULT_L1_TTL
+        l1.set("a", "v")
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + DEFAULT_L1_TTL)
+        assert l1.get("a") is None
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="max_entries"):
+            LocalCache(max_entries=0)
+        with pytest.raises(ValueError, match="ttl"):
+            LocalCache(max_entries=1, ttl=0)
+        with pytest.raises(ValueError, match="ttl"):
+            LocalCache(max_entries=1, ttl=None)
@@ -4,6 +4,7 @@ import pytest
 from aiocache import caches
 
 from zodiac_core.cache import cache
+from zodiac_core.cache.local import DEFAULT_L1_TTL
 from zodiac_core.cache.manager import DEFAULT_CACHE_NAME, ZODIAC_CACHE_NAMESPACE
 
 
@@ -138,3 +139,60 @@ class TestCacheManager:
 
         with pytest.raises(RuntimeError, match="not initialized"):
             cache.get_cache("secondary")
+
+    @pytest.mark.asyncio
+    async def test_setup_with_l1_enables_near_cache(self):
+        """l1_max_entries / l1_ttl wire an in-process LocalCache in front of the backend."""
+        cache.setup(prefix="near", default_ttl=60, l1_max_entries=100, l1_ttl=5)
+        c = cache.cache
+        assert c.l1 is not None
+        assert c.l1.max_entries == 100
+        assert c.l1.ttl == 5
+
+        await c.set("k", "v")
+        assert c.l1.get("k") == "v"
+
+        cache._wrappers.clear()
+        rebuilt = cache.get_cache(DEFAULT_CACHE_NAME)
+        assert rebuilt.l1 is not None and rebuilt.l1.max_entries == 100
+
+    def test_setup_l1_ttl_defaults_when_l1_enabled(self):
+        cache.setup(prefix="near-default", l1_max_entries=10)
+        assert cache.cache.l1.ttl == DEFAULT_L1_TTL
+
+    @pytest.mark.asyncio
+    async def test_setup_without_l1_is_single_tier(self):
+        cache.setup(prefix="single", default_ttl=60)
+        assert cache.cache.l1 is None
+
+    def test_setup_l1_ttl_without_max_entries_raises(self):
+        with pytest.raises(ValueError, match="l1_max_entries"):
+            cache.setup(prefix="bad-l1", l1_ttl=5)
+
+    def test_setup_ttl_jitter_default(self):
+        cache.setup(prefix="jitter", default_ttl=60, ttl_jitter=0.1)
+        assert cache.cache._ttl_jitter == 0.1
+        cache.setup(prefix="jitter", default_ttl=60, ttl_jitter=0.1)  # idempotent
+        with pytest.raises(RuntimeError, match="different settings"):
+            cache.setup(prefix="jitter", default_ttl=60, ttl_jitter=0.2)
+
+        cache._wrappers.clear()
+        assert cache.get_cache(DEFAULT_CACHE_NAME)._ttl_jitter == 0.1
+
+    def test_setup_invalid_ttl_jitter_raises(self):
+        with pytest.raises(ValueError, match="ttl_jitter"):
+            cache.setup(prefix="bad-jitter", ttl_jitter=2)
+
+    def test_setup_fail_open_options(self):
+        cache.setup(prefix="resilient", op_timeout=0.2, fail_open=True, breaker_threshold=3)
+        zc = cache.cache
+        assert zc._op_timeout == 0.2
+        assert zc._breaker.threshold == 3
+        assert zc._breaker.cooldown == 10.0
+        cache.setup(prefix="resilient", op_timeout=0.2, fail_open=True, breaker_threshold=3)  # idempotent
+        with pytest.raises(RuntimeError, match="different settings"):
+            cache.setup(prefix="resilient", op_timeout=0.5, fail_open=True, breaker_threshold=3)
+
+    def test_setup_invalid_op_timeout_raises(self):
+        with pytest.raises(ValueError, match="op_timeout"):
+            cache.setup(prefix="bad-timeout", op_timeout=-1)
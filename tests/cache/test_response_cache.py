@@ -0,0 +1,224 @@
+"""Tests for ResponseCacheMiddleware (HTTP response caching on ZodiacCache)."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+
+from zodiac_core.cache import ResponseCacheMiddleware, cache
+from zodiac_core.cache.middleware import _parse_cache_control
+
+
+def _client(app):
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.fixture
+def counted_app():
+    cache.setup(prefix="http", default_ttl=60)
+    app = FastAPI()
+    calls = {"items": 0}
+
+    @app.get("/items")
+    async def items(q: str = ""):
+        calls["items"] += 1
+        await asyncio.sleep(0.01)
+        return {"q": q, "n": calls["items"]}
+
+    @app.get("/private")
+    async def private(response: Response):
+        calls["items"] += 1
+        response.headers["Cache-Control"] = "private"
+        return {"n": calls["items"]}
+
+    @app.get("/cookie")
+    async def cookie(response: Response):
+        calls["items"] += 1
+        response.set_cookie("session", "s")
+        return {"n": calls["items"]}
+
+    @app.get("/short")
+    async def short(response: Response):
+        calls["items"] += 1
+        response.headers["Cache-Control"] = "public, max-age=5"
+        return {"n": calls["items"]}
+
+    @app.get("/lang")
+    async def lang(response: Response):
+        calls["items"] += 1
+        response.headers["Vary"] = "Accept-Language"
+        return {"n": calls["items"]}
+
+    @app.get("/other")
+    async def other():
+        calls["items"] += 1
+        return {"n": calls["items"]}
+
+    return app, calls
+
+
+@pytest.mark.asyncio
+class TestResponseCacheMiddleware:
+    """GET responses of selected paths are stored in and replayed from ZodiacCache."""
+
+    async def test_hit_replays_status_headers_and_body(self, counted_app):
+        app, calls = counted_app
+        app.add_middleware(ResponseCacheMiddleware, ttl=60, paths=["/items"])
+        async with _client(app) as client:
+            first = await client.get("/items", params={"q": "a", "x": "1"})
+            second = await client.get("/items?x=1&q=a")  # same query, different order
+            other = await client.get("/items", params={"q": "b"})
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.json() == first.json() == {"q": "a", "n": 1}
+        assert second.headers["content-type"] == "application/json"
+        assert second.headers["age"] == "0"
+        assert other.json()["n"] == 2
+        assert calls["items"] == 2
+
+    async def test_unselected_paths_and_methods_pass_through(self, counted_app):
+        app, calls = counted_app
+        app.add_middleware(ResponseCacheMiddleware, paths=["/items"])
+        async with _client(app) as client:
+            await client.get("/other")
+            response = await client.get("/other")
+            assert "x-cache" not in response.headers
+            await client.post("/items")
+        assert calls["items"] == 2
+
+    async def test_concurrent_misses_run_the_endpoint_once(self, counted_app):
+        app, calls = counted_app
+        app.add_middleware(ResponseCacheMiddleware, ttl=60)
+        async with _client(app) as client:
+            responses = await asyncio.gather(*(client.get("/items") for _ in range(5)))
+        assert calls["items"] == 1
+        assert sorted(r.headers["x-cache"] for r in responses) == ["HIT"] * 4 + ["MISS"]
+
+    @pytest.mark.parametrize("path", ["/private", "/cookie"])
+    async def test_private_responses_are_not_stored(self, counted_app, path):
+        app, calls = counted_app
+        app.add_middleware(ResponseCacheMiddleware, ttl=60)
+        async with _client(app) as client:
+            responses = await asyncio.gather(*(client.get(path) for _ in range(3)))
+        assert calls["items"] == 3
+        assert sorted(r.json()["n"] for r in responses) == [1, 2, 3]
+
+    async def test_request_cache_control_and_credentials(self, counted_app):
+        app, calls = counted_app
+        app.add_middleware(ResponseCacheMiddleware, ttl=60)
+        async with _client(app) as client:
+            await client.get("/items")
+            assert (await client.get("/items", headers={"Cache-Control": "no-store"})).json()["n"] == 2
+            refreshed = await client.get("/items", headers={"Cache-Control": "no-cache"})
+            assert refreshed.json()["n"] == 3
+            assert (await client.get("/items")).json()["n"] == 3  # no-cache stored the fresh response
+            assert (await client.get("/items", headers={"Authorization": "Bearer t"})).json()["n"] == 4
+
+    async def test_vary_headers_are_part_of_the_key(self, counted_app):
+        app, calls = counted_app
+        app.add_middleware(ResponseCacheMiddleware, ttl=60, vary_headers=["Accept-Language"])
+        async with _client(app) as client:
+            en = await client.get("/lang", headers={"Accept-Language": "en"})
+            fr = await client.get("/lang", headers={"Accept-Language": "fr"})
+            en_again = await client.get("/lang", headers={"Accept-Language": "en"})
+        assert (en.json()["n"], fr.json()["n"], en_again.json()["n"]) == (1, 2, 1)
+
+    async def test_response_vary_on_unknown_header_is_not_stored(self, counted_app):
+        app, calls = counted_app
+        app.add_middleware(ResponseCacheMiddleware, ttl=60)
+        async with _client(app) as client:
+            await client.get("/lang")
+            await client.get("/lang")
+        assert calls["items"] == 2
+
+    async def test_response_max_age_sets_ttl(self, counted_app, monkeypatch):
+        app, _ = counted_app
+        app.add_middleware(ResponseCacheMiddleware, ttl=60)
+        ttls = []
+        zc = cache.cache
+        original = zc.set
+
+        async def recording_set(key, value, ttl=None, **kwargs):
+            ttls.append(ttl)
+            return await original(key, value, ttl=ttl, **kwargs)
+
+        monkeypatch.setattr(zc, "set", recording_set)
+        async with _client(app) as client:
+            await client.get("/short")
+            await client.get("/items")
+        assert ttls == [5, 60]
+
+    async def test_tag_purge(self, counted_app):
+        app, calls = counted_app
+        app.add_middleware(ResponseCacheMiddleware, ttl=60, tags=lambda scope: ["items"])
+        async with _client(app) as client:
+            await client.get("/items")
+            await client.get("/items")
+            await cache.invalidate_tags(["items"])
+            assert (await client.get("/items")).headers["x-cache"] == "MISS"
+        assert calls["items"] == 2
+
+    async def test_oversized_bodies_are_not_stored(self, counted_app):
+        app, calls = counted_app
+        app.add_middleware(ResponseCacheMiddleware, ttl=60, max_body_size=5)
+        async with _client(app) as client:
+            await client.get("/items")
+            await client.get("/items")
+        assert calls["items"] == 2
+
+    async def test_uncacheable_bodies_are_streamed_through(self):
+        cache.setup(prefix="http", default_ttl=60)
+        release = asyncio.Event()
+        calls = 0
+
+        async def app(scope, receive, send):
+            nonlocal calls
+            calls += 1
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"x" * 2048, "more_body": True})
+            await release.wait()
+            await send({"type": "http.response.body", "body": b"end", "more_body": False})
+
+        async def request():
+            sent = []
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {"type": "http", "method": "GET", "path": "/stream", "headers": [], "query_string": b""}
+            task = asyncio.ensure_future(ResponseCacheMiddleware(app, max_body_size=1024)(scope, None, send))
+            return task, sent
+
+        leader, leader_sent = await request()
+        follower, follower_sent = await request()
+        await asyncio.sleep(0.05)
+        # Both responses reached their clients before the app finished: neither was held in a buffer.
+        assert not leader.done() and not follower.done()
+        assert [m["type"] for m in leader_sent] == ["http.response.start", "http.response.body"]
+        assert (b"x-cache", b"MISS") in leader_sent[0]["headers"]
+        assert len(follower_sent) == 2
+
+        release.set()
+        await asyncio.gather(leader, follower)
+        assert leader_sent[-1]["body"] == b"end" and follower_sent[-1]["body"] == b"end"
+        assert calls == 2
+
+    async def test_lifespan_passthrough(self):
+        events = []
+
+        async def app(scope, receive, send):
+            events.append(scope["type"])
+
+        await ResponseCacheMiddleware(app)({"type": "lifespan"}, None, None)
+        assert events == ["lifespan"]
+
+
+def test_parse_cache_control():
+    assert _parse_cache_control('public, Max-Age=60, s-maxage="30", no-transform') == {
+        "public": None,
+        "max-age": "60",
+        "s-maxage": "30",
+        "no-transform": None,
+    }
+    assert _parse_cache_control(None) == {}
@@ -0,0 +1,175 @@
+"""Tests for ZodiacSerializer (codecs, compression, pickle fallback, internal sentinels)."""
+
+from datetime import datetime, timezone
+
+import pytest
+from aiocache import Cache
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+from zodiac_core.cache import ZodiacCache, cache
+from zodiac_core.cache.manager import _CACHED_NONE, _BlobManifest, _CachedNoneSentinel, _CacheEntry
+from zodiac_core.cache.serializers import ZodiacSerializer
+
+
+class SerializedUser(BaseModel):
+    id: int
+    name: str
+    created_at: datetime
+
+
+class AliasedUser(BaseModel):
+    user_id: int = Field(alias="userId")
+    display_name: str = Field(alias="displayName")
+
+
+class CamelUser(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    user_id: int
+    created_at: datetime
+
+
+USER = SerializedUser(id=1, name="alice", created_at=datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+FORMATS = ["json", "orjson", "msgpack"]
+
+
+def _serializer(fmt: str, **kwargs) -> ZodiacSerializer:
+    if fmt != "json":
+        pytest.importorskip(fmt)
+    return ZodiacSerializer(format=fmt, **kwargs)
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+class TestZodiacSerializerRoundTrip:
+    """Every supported format round-trips the values ZodiacCache stores."""
+
+    def test_plain_data(self, fmt):
+        s = _serializer(fmt)
+        for value in [1, "x", 2.5, True, None, {"a": [1, {"b": None}]}, []]:
+            assert s.loads(s.dumps(value)) == value
+        assert s.loads(None) is None
+
+    def test_pydantic_models_are_revalidated(self, fmt):
+        s = _serializer(fmt)
+        out = s.loads(s.dumps({"users": [USER, USER]}))
+        assert out == {"users": [USER, USER]}
+        assert isinstance(out["users"][0], SerializedUser)
+        assert s.dumps(USER)[:1] != b"P"
+
+    def test_aliased_models(self, fmt):
+        s = _serializer(fmt)
+        aliased = AliasedUser(userId=1, displayName="alice")
+        camel = CamelUser(userId=2, createdAt=datetime(2026, 1, 1, tzinfo=timezone.utc))
+        for value in [aliased, camel, [aliased, aliased], [camel, camel], {"users": [aliased, camel]}]:
+            payload = s.dumps(value)
+            assert payload[:1] != b"P"
+            assert s.loads(payload) == value
+
+    def test_internal_sentinels(self, fmt):
+        s = _serializer(fmt)
+        assert isinstance(s.loads(s.dumps(_CACHED_NONE)), _CachedNoneSentinel)
+        entry = s.loads(s.dumps(_CacheEntry(USER, 10.0, 0.25)))
+        assert entry == _CacheEntry(USER, 10.0, 0.25)
+        nested_none = s.loads(s.dumps(_CacheEntry(_CACHED_NONE, 10.0)))
+        assert isinstance(nested_none.value, _CachedNoneSentinel)
+        manifest = s.dumps(_BlobManifest("ab12", 3, 1500))
+        assert manifest[:1] != b"P"
+        assert s.loads(manifest) == _BlobManifest("ab12", 3, 1500)
+
+    def test_unsupported_values_fall_back_to_pickle(self, fmt):
+        s = _serializer(fmt)
+        for value in [(1, 2), {1, 2}, datetime(2026, 1, 1), {"k": float("inf")}, {1: "int-key"}, {"__zc__": 1}]:
+            payload = s.dumps(value)
+            assert payload[:1] == b"P"
+            assert s.loads(payload) == value
+
+    def test_unsupported_values_raise_without_pickle_fallback(self, fmt):
+        s = _serializer(fmt, pickle_fallback=False)
+        with pytest.raises(TypeError, match="not supported"):
+            s.dumps((1, 2))
+
+
+class TestZodiacSerializerCompression:
+    """Payloads above the threshold are compressed; frames stay self-describing."""
+
+    @pytest.mark.parametrize("compression", ["zlib", "zstd"])
+    def test_large_payload_is_compressed(self, compression):
+        if compression == "zstd":
+            pytest.importorskip("zstandard")
+        s = ZodiacSerializer(compression=compression, compress_threshold=64)
+        value = {"rows": ["same text"] * 200}
+        payload = s.dumps(value)
+        assert payload[1:2] == (b"S" if compression == "zstd" else b"Z")
+        assert len(payload) < len(ZodiacSerializer(compression=None).dumps(value))
+        assert s.loads(payload) == value
+
+    def test_small_payload_is_not_compressed(self):
+        s = ZodiacSerializer(compress_threshold=1024)
+        assert s.dumps({"a": 1})[1:2] == b"-"
+
+    def test_frames_readable_after_configuration_change(self):
+        written = ZodiacSerializer(format="json", compression="zlib", compress_threshold=1).dumps({"a": [1] * 100})
+        assert ZodiacSerializer(compression=None).loads(written) == {"a": [1] * 100}
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError, match="format"):
+            ZodiacSerializer(format="xml")
+        with pytest.raises(ValueError, match="compression"):
+            ZodiacSerializer(compression="lz4")
+
+
+class TestZodiacSerializerWithCache:
+    """End-to-end through aiocache and ZodiacCache."""
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_keeps_cached_none_semantics(self):
+        zc = ZodiacCache(Cache(namespace="ser", serializer=ZodiacSerializer()))
+        calls = 0
+
+        async def producer_none():
+            nonlocal calls
+            calls += 1
+            return None
+
+        assert await zc.get_or_set("k", producer_none) is None
+        assert await zc.get_or_set("k", producer_none) is None
+        assert calls == 1
+        assert await zc.get("k") is None
+
+        await zc.set("user", USER)
+        assert await zc.get("user") == USER
+
+    @pytest.mark.asyncio
+    async def test_setup_with_serializer_config(self):
+        cache.setup(
+            prefix="ser-setup",
+            serializer={"class": "zodiac_core.cache.serializers.ZodiacSerializer", "compress_threshold": 16},
+        )
+        c = cache.cache
+        assert isinstance(c.backend.serializer, ZodiacSerializer)
+        await c.set("k", {"users": [USER]})
+        assert await c.get("k") == {"users": [USER]}
+
+
+class OtherModel(BaseModel):
+    value: str
+
+
+class TestZodiacSerializerModelLists:
+    """Homogeneous model lists are tagged once; mixed lists fall back to per-item tags."""
+
+    @pytest.mark.parametrize("fmt", FORMATS)
+    def test_mixed_model_list(self, fmt):
+        s = _serializer(fmt)
+        value = [USER, OtherModel(value="x"), 1]
+        assert s.loads(s.dumps(value)) == value
+
+    def test_unimportable_models_are_unsupported(self):
+        class LocalModel(BaseModel):
+            a: int
+
+        s = ZodiacSerializer(pickle_fallback=False)
+        with pytest.raises(TypeError, match="not supported"):
+            s.dumps([LocalModel(a=1)])
@@ -0,0 +1,151 @@
+"""Tests for cache instrumentation (histograms, per-cache and per-function stats, snapshots)."""
+
+import asyncio
+import time
+
+import pytest
+from aiocache import Cache
+from aiocache.serializers import PickleSerializer
+
+from zodiac_core.cache import ZodiacCache, cache, cached, cached_batch
+from zodiac_core.cache import manager as cache_manager_module
+from zodiac_core.cache.stats import CacheStats, Histogram, function_label_scope, get_function_label
+
+
+class TestHistogram:
+    """Fixed-bucket histogram."""
+
+    def test_observe_and_cumulative_snapshot(self):
+        histogram = Histogram((1.0, 10.0))
+        for value in (0.5, 1.0, 5.0, 50.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == 56.5
+        assert snapshot["buckets"] == {"1.0": 2, "10.0": 3, "+Inf": 4}
+
+
+class TestCacheStats:
+    """Counters, hit ratio and reset."""
+
+    def test_hit_ratio_and_reset(self):
+        stats = CacheStats()
+        assert stats.hit_ratio is None
+        stats.hits, stats.misses = 3, 1
+        assert stats.hit_ratio == 0.75
+        stats.producer.observe(0.1)
+
+        stats.reset()
+        assert stats.snapshot()["hits"] == 0
+        assert stats.snapshot()["producer_seconds"]["count"] == 0
+
+    def test_function_label_scope(self):
+        assert get_function_label() is None
+        with function_label_scope("mod:fn"):
+            assert get_function_label() == "mod:fn"
+        assert get_function_label() is None
+
+
+class TestZodiacCacheStats:
+    """ZodiacCache records hits, misses, lock waits, timings and sizes."""
+
+    @pytest.fixture
+    def zc(self):
+        return ZodiacCache(Cache(serializer=PickleSerializer(), namespace="stats"), default_ttl=60)
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_hits_misses_and_none(self, zc):
+        async def producer():
+            return "v"
+
+        async def producer_none():
+            return None
+
+        await zc.get_or_set("k", producer)
+        await zc.get_or_set("k", producer)
+        await zc.get_or_set("none", producer_none)
+        await zc.get_or_set("none", producer_none)
+
+        snapshot = zc.stats_snapshot()["cache"]
+        assert snapshot["misses"] == 2
+        assert snapshot["hits"] == 2
+        assert snapshot["none_hits"] == 1
+        assert snapshot["producer_seconds"]["count"] == 2
+        assert snapshot["lookup_seconds"]["count"] == 4
+        assert snapshot["lock_wait_seconds"]["count"] == 2
+        assert snapshot["value_size_bytes"]["count"] == 2
+        assert snapshot["value_size_bytes"]["sum"] > 0
+
+    @pytest.mark.asyncio
+    async def test_single_flight_waiters_count_as_lock_waits(self, zc):
+        release = asyncio.Event()
+
+        async def producer():
+            await release.wait()
+            return "v"
+
+        tasks = [asyncio.create_task(zc.get_or_set("k", producer)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        release.set()
+        assert await asyncio.gather(*tasks) == ["v", "v", "v"]
+        assert zc.stats.misses == 3
+        assert zc.stats.lock_waits == 2
+        assert zc.stats.producer.count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_hits(self, zc, monkeypatch):
+        async def producer():
+            return "v"
+
+        await zc.get_or_set("k", producer, ttl=1, stale_ttl=60)
+        later = time.time() + 5
+        monkeypatch.setattr(cache_manager_module.time, "time", lambda: later)
+        assert await zc.get_or_set("k", producer, ttl=1, stale_ttl=60) == "v"
+        assert zc.stats.stale_hits == 1
+        assert zc.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_stats(self, zc):
+        await zc.get("missing")
+        assert zc.stats.misses == 1
+        zc.reset_stats()
+        assert zc.stats.misses == 0
+
+
+class TestCachedDecoratorStats:
+    """@cached and @cached_batch record per-function stats next to the cache aggregate."""
+
+    @pytest.mark.asyncio
+    async def test_per_function_labels(self):
+        cache.setup(prefix="stats_deco", default_ttl=300)
+
+        @cached(ttl=60)
+        async def fetch(x: int):
+            return x
+
+        @cached_batch(ttl=60)
+        async def fetch_many(ids: list[int]):
+            return {i: i for i in ids}
+
+        await fetch(1)
+        await fetch(1)
+        await fetch_many([1, 2])
+        await fetch_many([1, 2, 3])
+
+        snapshot = cache.stats_snapshot()
+        assert list(snapshot) == ["default"]
+        functions = snapshot["default"]["functions"]
+        fetch_stats = functions[f"{fetch.__module__}:{fetch.__qualname__}"]
+        assert (fetch_stats["hits"], fetch_stats["misses"]) == (1, 1)
+        batch_stats = functions[f"{fetch_many.__module__}:{fetch_many.__qualname__}"]
+        assert (batch_stats["hits"], batch_stats["misses"]) == (2, 3)
+        assert batch_stats["producer_seconds"]["count"] == 2
+        assert snapshot["default"]["cache"]["hits"] == 3
+
+    @pytest.mark.asyncio
+    async def test_stats_snapshot_for_named_cache(self):
+        cache.setup(prefix="stats_named", name="other", default_ttl=300)
+        await cache.get_cache("other").get("missing")
+        assert cache.stats_snapshot("other")["other"]["cache"]["misses"] == 1
+        assert cache.get_cache("other").name == "other"
@@ -0,0 +1,93 @@
+"""Tests for cache warm-up (cache.register_warmup / cache.warmup)."""
+
+import asyncio
+
+import pytest
+
+from zodiac_core.cache import cache, cached
+from zodiac_core.cache.warmup import _make_loader, run_warmup
+
+
+@pytest.fixture(autouse=True)
+def clear_warmup_loaders():
+    cache._warmup_loaders.clear()
+    yield
+    cache._warmup_loaders.clear()
+
+
+class TestWarmup:
+    """Registered loaders run with bounded concurrency and are reported."""
+
+    def test_make_loader_normalizes_calls(self):
+        def load(*args, **kwargs): ...
+
+        loader = _make_loader(load, [1, ("a", 2), {"q": "x"}])
+        assert loader.calls == (((1,), {}), (("a", 2), {}), ((), {"q": "x"}))
+        assert loader.label.endswith(":TestWarmup.test_make_loader_normalizes_calls.<locals>.load")
+        assert _make_loader(load).calls == (((), {}),)
+        with pytest.raises(TypeError):
+            _make_loader("not callable")
+
+    @pytest.mark.asyncio
+    async def test_warmup_populates_cached_functions(self):
+        cache.setup(prefix="warmup", default_ttl=60)
+        calls = []
+
+        @cached(ttl=60)
+        async def get_user(user_id: int):
+            calls.append(user_id)
+            return {"id": user_id}
+
+        assert cache.register_warmup(get_user, [1, 2, 3], label="users") is get_user
+        progress = []
+        report = await cache.warmup(concurrency=2, on_progress=lambda done, total: progress.append((done, total)))
+
+        assert sorted(calls) == [1, 2, 3]
+        assert (report.total, report.completed, report.failed, report.skipped) == (3, 3, 0, 0)
+        assert report.loaders[0].label == "users"
+        assert report.loaders[0].calls == 3
+        assert progress[-1] == (3, 3)
+
+        await get_user(2)
+        assert len(calls) == 3  # served from the warmed cache
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_and_failures_are_counted(self):
+        running = peak = 0
+
+        async def load(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if i % 4 == 0:
+                raise RuntimeError("boom")
+
+        report = await run_warmup([_make_loader(load, range(12))], concurrency=3)
+        assert peak == 3
+        assert report.completed == 12
+        assert report.failed == 3
+        assert report.loaders[0].failures == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_remaining_calls(self):
+        async def slow(_):
+            await asyncio.sleep(10)
+
+        def fast():
+            return "sync loaders work too"
+
+        report = await run_warmup([_make_loader(fast), _make_loader(slow, [1, 2])], concurrency=4, timeout=0.05)
+        assert report.total == 3
+        assert report.completed == 1
+        assert report.skipped == 2
+
+    @pytest.mark.asyncio
+    async def test_no_loaders_and_invalid_options(self):
+        report = await cache.warmup()
+        assert (report.total, report.completed, report.loaders) == (0, 0, [])
+        with pytest.raises(ValueError, match="concurrency"):
+            await cache.warmup(concurrency=0)
+        with pytest.raises(ValueError, match="timeout"):
+            await cache.warmup(timeout=0)
@@ -1,14 +1,23 @@
 """Tests for ZodiacCache (get/set/delete/get_or_set, namespace, RedLock)."""
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
 
 import pytest
 from aiocache import Cache
 
-from zodiac_core.cache import ZodiacCache
+from zodiac_core.cache import CacheUnavailableError, ZodiacCache
 from zodiac_core.cache import manager as cache_manager_module
-from zodiac_core.cache.manager import _CACHED_NONE
+from zodiac_core.cache.local import LocalCache
+from zodiac_core.cache.manager import (
+    _CACHED_NONE,
+    IncompleteBlobError,
+    _BlobManifest,
+    _CacheEntry,
+    _jittered_ttl,
+    _xfetch_due,
+)
 
 
 class TestZodiacCachePrefix:
@@ -214,3 +223,725 @@ class TestZodiacCacheGetOrSet:
         out = await zc.get_or_set("k", producer)
         assert out is None
         assert producer_called is False
+
+
+class TestZodiacCacheL1:
+    """Two-tier behavior: in-process L1 in front of the backend."""
+
+    @pytest.fixture
+    def zc(self):
+        backend = Cache(namespace="l1")
+        return ZodiacCache(backend, default_ttl=60, l1=LocalCache(max_entries=16, ttl=30))
+
+    @pytest.mark.asyncio
+    async def test_hit_served_from_l1_without_backend(self, zc, monkeypatch):
+        await zc.set("k", "v")
+        assert zc.l1.get("k") == "v"
+
+        async def fail_get(*args, **kwargs):
+            raise AssertionError("backend should not be read on L1 hit")
+
+        monkeypatch.setattr(zc.backend, "get", fail_get)
+        assert await zc.get("k") == "v"
+        assert await zc.get_or_set("k", lambda: None) == "v"
+
+    @pytest.mark.asyncio
+    async def test_backend_hit_populates_l1(self, zc):
+        await zc.backend.set("k", "from-l2")
+        assert zc.l1.get("k") is None
+        assert await zc.get("k") == "from-l2"
+        assert zc.l1.get("k") == "from-l2"
+
+    @pytest.mark.asyncio
+    async def test_backend_value_outlives_backend_by_at_most_l1_ttl(self, zc, monkeypatch):
+        await zc.backend.set("k", "v", ttl=1)
+        assert await zc.get("k") == "v"
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 30)
+        assert zc.l1.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_evicts_both_tiers(self, zc):
+        await zc.set("k", "v")
+        await zc.delete("k")
+        assert zc.l1.get("k") is None
+        assert await zc.backend.get("k") is None
+        assert await zc.exists("k") is False
+
+    @pytest.mark.asyncio
+    async def test_cached_none_is_kept_in_l1(self, zc):
+        async def producer_none():
+            return None
+
+        assert await zc.get_or_set("k", producer_none) is None
+        assert zc.l1.get("k") is _CACHED_NONE
+        assert await zc.get("k") is None
+
+
+class TestZodiacCacheStaleWhileRevalidate:
+    """Soft/hard TTL: stale hits are served while one background task refreshes."""
+
+    @pytest.mark.asyncio
+    async def test_stale_hit_returns_immediately_and_refreshes_once(self, monkeypatch):
+        backend = Cache(namespace="swr")
+        zc = ZodiacCache(backend)
+        now = 1_000.0
+        monkeypatch.setattr(cache_manager_module.time, "time", lambda: now)
+        calls = 0
+        release = asyncio.Event()
+
+        async def producer():
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                await release.wait()
+            return f"v{calls}"
+
+        assert await zc.get_or_set("k", producer, ttl=10, stale_ttl=60) == "v1"
+
+        now = 1_015.0  # past soft TTL, inside stale window
+        results = await asyncio.gather(*[zc.get_or_set("k", producer, ttl=10, stale_ttl=60) for _ in range(5)])
+        assert results == ["v1"] * 5
+        assert len(zc._refresh_tasks) == 1
+
+        release.set()
+        await asyncio.gather(*zc._refresh_tasks.values())
+        assert calls == 2
+        assert await zc.get_or_set("k", producer, ttl=10, stale_ttl=60) == "v2"
+        assert await zc.get("k") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_without_stale_ttl_is_a_miss(self, monkeypatch):
+        backend = Cache(namespace="swr_miss")
+        zc = ZodiacCache(backend)
+        now = 1_000.0
+        monkeypatch.setattr(cache_manager_module.time, "time", lambda: now)
+        calls = 0
+
+        async def producer():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await zc.get_or_set("k", producer, ttl=10, stale_ttl=60) == 1
+        now = 1_015.0
+        assert await zc.get_or_set("k", producer, ttl=10) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_cached_none_is_decoded(self, monkeypatch):
+        backend = Cache(namespace="swr_none")
+        zc = ZodiacCache(backend)
+        now = 1_000.0
+        monkeypatch.setattr(cache_manager_module.time, "time", lambda: now)
+
+        async def producer_none():
+            return None
+
+        assert await zc.get_or_set("k", producer_none, ttl=10, stale_ttl=60) is None
+        now = 1_015.0
+        assert await zc.get_or_set("k", producer_none, ttl=10, stale_ttl=60) is None
+        await asyncio.gather(*zc._refresh_tasks.values())
+        assert await zc.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_keeps_stale_value(self, monkeypatch):
+        backend = Cache(namespace="swr_fail")
+        zc = ZodiacCache(backend)
+        now = 1_000.0
+        monkeypatch.setattr(cache_manager_module.time, "time", lambda: now)
+
+        async def ok():
+            return "old"
+
+        async def boom():
+            raise ValueError("refresh failed")
+
+        assert await zc.get_or_set("k", ok, ttl=10, stale_ttl=60) == "old"
+        now = 1_015.0
+        assert await zc.get_or_set("k", boom, ttl=10, stale_ttl=60) == "old"
+        await asyncio.gather(*zc._refresh_tasks.values(), return_exceptions=True)
+        await asyncio.sleep(0)
+        assert zc._refresh_tasks == {}
+        assert await zc.get("k") == "old"
+
+
+class TestZodiacCacheXFetch:
+    """Probabilistic early recomputation based on stored compute duration."""
+
+    def test_xfetch_due_grows_towards_expiry(self):
+        # A free producer (delta=0) is never recomputed before expiry.
+        assert _xfetch_due(_CacheEntry("v", 100.0, 0.0), 1.0, 99.9) is False
+        assert _xfetch_due(_CacheEntry("v", 100.0, 0.0), 1.0, 100.0) is True
+
+        # An expensive producer is recomputed early more often the closer expiry is.
+        entry = _CacheEntry("v", fresh_until=100.0, delta=1.0)
+        far = sum(_xfetch_due(entry, 1.0, 90.0) for _ in range(2000))
+        near = sum(_xfetch_due(entry, 1.0, 99.5) for _ in range(2000))
+        assert far < near
+
+    @pytest.mark.asyncio
+    async def test_early_recompute_refreshes_without_lock(self, monkeypatch):
+        backend = Cache(namespace="xfetch")
+        zc = ZodiacCache(backend)
+        calls = 0
+
+        async def producer():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await zc.get_or_set("k", producer, ttl=60, xfetch_beta=1.0) == 1
+        raw = await backend.get("k")
+        assert isinstance(raw, _CacheEntry)
+        assert raw.delta >= 0
+
+        @asynccontextmanager
+        async def no_lock(*args, **kwargs):
+            raise AssertionError("early recomputation must not take the lock")
+            yield
+
+        monkeypatch.setattr(cache_manager_module, "RedLock", no_lock)
+
+        # Not due: served from cache
+        monkeypatch.setattr(cache_manager_module, "_xfetch_due", lambda *args: False)
+        assert await zc.get_or_set("k", producer, ttl=60, xfetch_beta=1.0) == 1
+
+        # Due: this caller recomputes before expiry
+        monkeypatch.setattr(cache_manager_module, "_xfetch_due", lambda *args: True)
+        assert await zc.get_or_set("k", producer, ttl=60, xfetch_beta=1.0) == 2
+        assert await zc.get("k") == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_early_recompute_serves_the_fresh_value(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="xfetch_fail"))
+
+        async def producer():
+            return "v"
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        assert await zc.get_or_set("k", producer, ttl=60, xfetch_beta=1.0) == "v"
+        monkeypatch.setattr(cache_manager_module, "_xfetch_due", lambda *args: True)
+        assert await zc.get_or_set("k", failing, ttl=60, xfetch_beta=1.0) == "v"
+        assert await zc.get("k") == "v"
+
+    @pytest.mark.asyncio
+    async def test_early_recompute_with_cached_none(self, monkeypatch):
+        backend = Cache(namespace="xfetch_none")
+        zc = ZodiacCache(backend)
+        calls = 0
+
+        async def producer_none():
+            nonlocal calls
+            calls += 1
+            return None
+
+        assert await zc.get_or_set("k", producer_none, ttl=60, xfetch_beta=1.0) is None
+        assert (await backend.get("k")).value is _CACHED_NONE
+        monkeypatch.setattr(cache_manager_module, "_xfetch_due", lambda *args: False)
+        assert await zc.get_or_set("k", producer_none, ttl=60, xfetch_beta=1.0) is None
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_early_recompute_with_stale_ttl_runs_in_background(self, monkeypatch):
+        backend = Cache(namespace="xfetch_swr")
+        zc = ZodiacCache(backend)
+        calls = 0
+
+        async def producer():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await zc.get_or_set("k", producer, ttl=60, stale_ttl=60, xfetch_beta=1.0) == 1
+        monkeypatch.setattr(cache_manager_module, "_xfetch_due", lambda *args: True)
+        assert await zc.get_or_set("k", producer, ttl=60, stale_ttl=60, xfetch_beta=1.0) == 1
+        await asyncio.gather(*zc._refresh_tasks.values())
+        assert calls == 2
+        assert await zc.get("k") == 2
+
+
+class TestZodiacCacheBatch:
+    """get_many / set_many / get_or_set_many map onto multi_get / multi_set."""
+
+    @pytest.fixture
+    def zc(self):
+        return ZodiacCache(Cache(namespace="batch"), default_ttl=60)
+
+    @pytest.mark.asyncio
+    async def test_set_many_get_many_roundtrip(self, zc):
+        await zc.set_many({"a": 1, "b": None})
+        await zc.set_many([("c", 3)], ttl=10)
+        assert await zc.get_many(["a", "missing", "c"]) == [1, None, 3]
+        await zc.set_many([])
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_backend_call(self, zc, monkeypatch):
+        await zc.set_many({"a": 1, "b": 2})
+        calls = []
+        original = zc.backend.multi_get
+
+        async def spy(keys, *args, **kwargs):
+            calls.append(list(keys))
+            return await original(keys, *args, **kwargs)
+
+        monkeypatch.setattr(zc.backend, "multi_get", spy)
+        assert await zc.get_many(["a", "b", "c"]) == [1, 2, None]
+        assert calls == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_many_calls_producer_once_with_missing_keys(self, zc):
+        await zc.set("a", "cached-a")
+        seen = []
+
+        async def producer(keys):
+            seen.append(keys)
+            return {key: f"fresh-{key}" for key in keys if key != "gone"}
+
+        out = await zc.get_or_set_many(["a", "b", "c", "b", "gone"], producer)
+        assert out == {"a": "cached-a", "b": "fresh-b", "c": "fresh-c"}
+        assert list(out) == ["a", "b", "c"]
+        assert seen == [["b", "c", "gone"]]
+
+        out2 = await zc.get_or_set_many(["a", "b", "c"], producer)
+        assert out2 == {"a": "cached-a", "b": "fresh-b", "c": "fresh-c"}
+        assert len(seen) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_many_cached_none_and_skip(self, zc):
+        calls = 0
+
+        async def producer(keys):
+            nonlocal calls
+            calls += 1
+            return {key: None for key in keys}
+
+        assert await zc.get_or_set_many(["n"], producer) == {"n": None}
+        assert await zc.get_or_set_many(["n"], producer) == {"n": None}
+        assert calls == 1
+
+        assert await zc.get_or_set_many(["s"], producer, skip_cache_func=lambda v: v is None) == {"s": None}
+        assert await zc.get_or_set_many(["s"], producer, skip_cache_func=lambda v: v is None) == {"s": None}
+        assert calls == 3
+
+    @pytest.mark.asyncio
+    async def test_get_many_with_l1_only_fetches_l1_misses(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="batch_l1"), l1=LocalCache(max_entries=8))
+        await zc.set("a", 1)
+        await zc.backend.set("b", 2)
+        calls = []
+        original = zc.backend.multi_get
+
+        async def spy(keys, *args, **kwargs):
+            calls.append(list(keys))
+            return await original(keys, *args, **kwargs)
+
+        monkeypatch.setattr(zc.backend, "multi_get", spy)
+        assert await zc.get_many(["a", "b"]) == [1, 2]
+        assert calls == [["b"]]
+        assert zc.l1.get("b") == 2
+
+
+class TestZodiacCacheSingleFlight:
+    """Concurrent misses in one process share one RedLock participant."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_take_the_lock_once(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="flight"))
+        lock_entries = 0
+        calls = 0
+        original_lock = cache_manager_module.RedLock
+
+        def counting_lock(*args, **kwargs):
+            nonlocal lock_entries
+            lock_entries += 1
+            return original_lock(*args, **kwargs)
+
+        monkeypatch.setattr(cache_manager_module, "RedLock", counting_lock)
+
+        async def producer():
+            nonlocal calls
+            await asyncio.sleep(0.05)
+            calls += 1
+            return "data"
+
+        results = await asyncio.gather(*[zc.get_or_set("k", producer) for _ in range(200)])
+        assert results == ["data"] * 200
+        assert calls == 1
+        assert lock_entries == 1
+        assert zc._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_producer_exception_reaches_all_waiters_and_is_not_cached(self):
+        zc = ZodiacCache(Cache(namespace="flight_err"))
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*[zc.get_or_set("k", failing) for _ in range(10)], return_exceptions=True)
+        assert calls == 1
+        assert all(isinstance(r, ValueError) for r in results)
+        assert zc._inflight == {}
+
+        async def ok():
+            return "ok"
+
+        assert await zc.get_or_set("k", ok) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_the_flight(self):
+        zc = ZodiacCache(Cache(namespace="flight_cancel"))
+        started = asyncio.Event()
+
+        async def producer():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "v"
+
+        first = asyncio.create_task(zc.get_or_set("k", producer))
+        await started.wait()
+        second = asyncio.create_task(zc.get_or_set("k", producer))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "v"
+        assert await zc.get("k") == "v"
+
+
+class TestZodiacCacheTags:
+    """Tag invalidation: per-tag generation counters folded into keys."""
+
+    @pytest.fixture
+    def zc(self):
+        return ZodiacCache(Cache(namespace="tags"), default_ttl=60)
+
+    @pytest.mark.asyncio
+    async def test_unknown_tags_are_generation_zero(self, zc):
+        assert await zc.tag_versions(["a", "b"]) == {"a": 0, "b": 0}
+        assert await zc.tagged_key("k", ["b", "a"]) == "k:tags:a=0,b=0"
+        assert await zc.tagged_key("k", []) == "k"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_bumps_only_given_tags(self, zc):
+        await zc.invalidate_tags("a")
+        await zc.invalidate_tags(["a", "a"])
+        assert await zc.tag_versions(["a", "b"]) == {"a": 2, "b": 0}
+
+    @pytest.mark.asyncio
+    async def test_tagged_entry_unreachable_after_invalidation(self, zc):
+        key = await zc.tagged_key("k", ["users"])
+        await zc.set(key, "v")
+        assert await zc.get(await zc.tagged_key("k", ["users"])) == "v"
+
+        await zc.invalidate_tags(["users"])
+        assert await zc.get(await zc.tagged_key("k", ["users"])) is None
+
+    @pytest.mark.asyncio
+    async def test_l1_caches_versions_and_local_invalidation_evicts_them(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="tags_l1"), default_ttl=60, l1=LocalCache(max_entries=16))
+        calls = 0
+        original = zc.backend.multi_get
+
+        async def counting_multi_get(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return await original(*args, **kwargs)
+
+        monkeypatch.setattr(zc.backend, "multi_get", counting_multi_get)
+        await zc.tag_versions(["a"])
+        await zc.tag_versions(["a"])
+        assert calls == 1
+
+        await zc.invalidate_tags(["a"])
+        assert await zc.tag_versions(["a"]) == {"a": 1}
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_l1_tag_versions_expire_quickly(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="tags_l1_ttl"), default_ttl=60, l1=LocalCache(max_entries=16, ttl=300))
+        assert await zc.tag_versions(["a"]) == {"a": 0}
+        await zc.backend.increment("__tag__:a")  # invalidated by another process
+
+        now = time.monotonic()
+        assert await zc.tag_versions(["a"]) == {"a": 0}
+        monkeypatch.setattr(time, "monotonic", lambda: now + 1.5)
+        assert await zc.tag_versions(["a"]) == {"a": 1}
+
+
+class TestZodiacCacheTTLJitter:
+    """Deterministic per-key TTL jitter."""
+
+    def test_jittered_ttl_is_deterministic_and_bounded(self):
+        ttls = [_jittered_ttl(f"k{i}", 100, 0.2) for i in range(500)]
+        assert all(100 <= ttl <= 120 for ttl in ttls)
+        assert len(set(ttls)) > 10
+        assert _jittered_ttl("k1", 100, 0.2) == ttls[1]
+
+    def test_jittered_ttl_range_and_disabled(self):
+        assert all(110 <= _jittered_ttl(f"k{i}", 100, (10, 30)) <= 130 for i in range(100))
+        assert _jittered_ttl("k", 100, None) == 100
+        assert _jittered_ttl("k", 100, 0) == 100
+        assert _jittered_ttl("k", None, 0.5) is None
+
+    @pytest.mark.parametrize("jitter", [-0.1, 1.5, (5, 1), (-1, 2), (1, 2, 3), "10%", True])
+    def test_invalid_policies_raise(self, jitter):
+        with pytest.raises(ValueError, match="ttl_jitter"):
+            ZodiacCache(Cache(), ttl_jitter=jitter)
+
+    @pytest.fixture
+    def recorded_ttls(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="jitter"), default_ttl=100, ttl_jitter=(10, 20))
+        ttls = {}
+        original_set, original_multi_set = zc.backend.set, zc.backend.multi_set
+
+        async def recording_set(key, value, ttl=None, **kwargs):
+            ttls[key] = ttl
+            return await original_set(key, value, ttl=ttl, **kwargs)
+
+        async def recording_multi_set(pairs, ttl=None, **kwargs):
+            for key, _ in pairs:
+                ttls[key] = ttl
+            return await original_multi_set(pairs, ttl=ttl, **kwargs)
+
+        monkeypatch.setattr(zc.backend, "set", recording_set)
+        monkeypatch.setattr(zc.backend, "multi_set", recording_multi_set)
+        return zc, ttls
+
+    @pytest.mark.asyncio
+    async def test_default_policy_applies_to_writes(self, recorded_ttls):
+        zc, ttls = recorded_ttls
+
+        async def producer():
+            return "v"
+
+        await zc.set("a", 1)
+        await zc.get_or_set("b", producer)
+        await zc.set_many({f"m{i}": i for i in range(50)})
+        assert ttls["a"] == _jittered_ttl("a", 100, (10, 20))
+        assert ttls["b"] == _jittered_ttl("b", 100, (10, 20))
+        assert all(110 <= ttls[f"m{i}"] <= 120 for i in range(50))
+        assert await zc.get_many([f"m{i}" for i in range(50)]) == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_call_policy_overrides_default(self, recorded_ttls):
+        zc, ttls = recorded_ttls
+        await zc.set("a", 1, ttl_jitter=0)
+        await zc.set("b", 1, ttl=50, ttl_jitter=(1, 1))
+        assert ttls == {"a": 100, "b": 51}
+
+    @pytest.mark.asyncio
+    async def test_stale_ttl_envelope_uses_jittered_soft_ttl(self, recorded_ttls):
+        zc, ttls = recorded_ttls
+
+        async def producer():
+            return "v"
+
+        before = time.time()
+        await zc.get_or_set("k", producer, stale_ttl=30)
+        jittered = _jittered_ttl("k", 100, (10, 20))
+        assert ttls["k"] == jittered + 30
+        entry = await zc.backend.get("k")
+        assert entry.fresh_until >= before + jittered
+
+
+class TestZodiacCacheFailOpen:
+    """Backend timeouts, fail-open fallbacks and the circuit breaker."""
+
+    @staticmethod
+    def _hang(zc, monkeypatch, *methods):
+        calls = []
+
+        async def hang(*args, **kwargs):
+            calls.append(args)
+            await asyncio.sleep(10)
+
+        for method in methods:
+            monkeypatch.setattr(zc.backend, method, hang)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_without_fail_open(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="timeout"), op_timeout=0.01)
+        self._hang(zc, monkeypatch, "get")
+        with pytest.raises(TimeoutError):
+            await zc.get("k")
+
+    @pytest.mark.asyncio
+    async def test_slow_backend_becomes_a_miss(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="fail_open"), default_ttl=60, op_timeout=0.01, fail_open=True)
+        self._hang(zc, monkeypatch, "get", "set", "multi_get", "multi_set", "delete", "exists", "_add")
+
+        async def producer():
+            return "fresh"
+
+        assert await zc.get("k") is None
+        assert await zc.get_many(["a", "b"]) == [None, None]
+        assert await zc.set("k", 1) is False
+        assert await zc.set_many({"a": 1}) is False
+        assert await zc.delete("k") is False
+        assert await zc.exists("k") is False
+        assert await zc.get_or_set("k", producer, lease=0.01) == "fresh"
+        assert await zc.tagged_key("k", ["users"]) == "k:tags:users=-1"
+        assert zc.stats.backend_errors > 0
+
+    @pytest.mark.asyncio
+    async def test_failing_backend_falls_through_to_producer(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="fail_open_err"), fail_open=True)
+
+        async def boom(*args, **kwargs):
+            raise ConnectionError("down")
+
+        for method in ("get", "set", "_add"):
+            monkeypatch.setattr(zc.backend, method, boom)
+
+        async def producer():
+            return "fresh"
+
+        assert await zc.get_or_set("k", producer) == "fresh"
+        assert zc.stats_snapshot()["cache"]["backend_errors"] == 3  # get, lock acquisition, set
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_not_kept_in_l1(self, monkeypatch):
+        zc = ZodiacCache(Cache(namespace="fail_open_l1"), fail_open=True, l1=LocalCache(max_entries=16))
+        await zc.set("k", "old")
+        await zc.set("m", "old")
+
+        async def boom(*args, **kwargs):
+            raise ConnectionError("down")
+
+        for method in ("get", "set", "multi_get", "multi_set"):
+            monkeypatch.setattr(zc.backend, method, boom)
+
+        assert await zc.set("k", "new") is False
+        assert await zc.set_many({"m": "new", "n": "new"}) is False
+        assert (zc.l1.get("k"), zc.l1.get("m"), zc.l1.get("n")) == (None, None, None)
+        assert await zc.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_breaker_opens_then_half_opens(self, monkeypatch):
+        zc = ZodiacCache(
+            Cache(namespace="breaker"), op_timeout=0.01, fail_open=True, breaker_threshold=2, breaker_cooldown=0.05
+        )
+        calls = self._hang(zc, monkeypatch, "get")
+        for _ in range(4):
+            assert await zc.get("k") is None
+        assert len(calls) == 2  # circuit opened after two timeouts
+        assert zc.stats.backend_errors == 4
+
+        with pytest.raises(CacheUnavailableError):
+            await zc.invalidate_tags("users")
+
+        await asyncio.sleep(0.06)
+        monkeypatch.undo()
+        await zc.backend.set("k", "v")
+        assert await zc.get("k") == "v"  # half-open probe succeeded and closed the circuit
+        assert await zc.get("k") == "v"
+
+    @pytest.mark.asyncio
+    async def test_half_open_failure_reopens_immediately(self, monkeypatch):
+        zc = ZodiacCache(
+            Cache(namespace="breaker_reopen"),
+            op_timeout=0.01,
+            fail_open=True,
+            breaker_threshold=3,
+            breaker_cooldown=0.05,
+        )
+        calls = self._hang(zc, monkeypatch, "get")
+        for _ in range(3):
+            await zc.get("k")
+        await asyncio.sleep(0.06)
+        await zc.get("k")
+        await zc.get("k")
+        assert len(calls) == 4
+
+    @pytest.mark.parametrize("kwargs", [{"op_timeout": 0}, {"breaker_threshold": 0}, {"breaker_cooldown": -1}])
+    def test_invalid_options_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            ZodiacCache(Cache(), **kwargs)
+
+
+class TestZodiacCacheBlobs:
+    """Chunked large values: parts plus a manifest key, fetched concurrently or streamed."""
+
+    @pytest.fixture
+    def zc(self):
+        return ZodiacCache(Cache(namespace="blobs"), default_ttl=60, l1=LocalCache(max_entries=16))
+
+    PAYLOAD = bytes(range(256)) * 41  # 10496 bytes: 11 parts of 1000, over two batches
+
+    @pytest.mark.asyncio
+    async def test_set_get_roundtrip_in_parts(self, zc):
+        assert await zc.set_blob("report", self.PAYLOAD, chunk_size=1000) is True
+        manifest = await zc.backend.get("report")
+        assert manifest == _BlobManifest(manifest.token, 11, len(self.PAYLOAD))
+        assert await zc.get_blob("report") == self.PAYLOAD
+        assert len(zc.l1) == 0  # parts bypass L1
+
+        await zc.set_blob("text", "héllo", chunk_size=2)
+        assert (await zc.get_blob("text")).decode() == "héllo"
+
+    @pytest.mark.asyncio
+    async def test_async_iterable_input_and_streaming(self, zc):
+        async def render():
+            for start in range(0, len(self.PAYLOAD), 777):
+                yield self.PAYLOAD[start : start + 777]
+
+        await zc.set_blob("report", render(), chunk_size=1000)
+        chunks = await zc.stream_blob("report", prefetch=1)
+        received = [chunk async for chunk in chunks]
+        assert len(received) == 11
+        assert b"".join(received) == self.PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_missing_and_incomplete(self, zc):
+        assert await zc.get_blob("nope") is None
+        assert await zc.stream_blob("nope") is None
+        await zc.set("plain", b"not a blob")
+        assert await zc.get_blob("plain") is None
+
+        await zc.set_blob("report", self.PAYLOAD, chunk_size=1000)
+        manifest = await zc.backend.get("report")
+        await zc.backend.delete(f"report:blob:{manifest.token}:10")
+        assert await zc.get_blob("report") is None
+        chunks = await zc.stream_blob("report")
+        with pytest.raises(IncompleteBlobError):
+            async for _ in chunks:
+                pass
+
+    @pytest.mark.asyncio
+    async def test_overwrite_and_delete_remove_parts(self, zc):
+        await zc.set_blob("report", self.PAYLOAD, chunk_size=1000)
+        first = await zc.backend.get("report")
+        await zc.set_blob("report", b"small", chunk_size=1000)
+        assert await zc.backend.get(f"report:blob:{first.token}:0") is None
+        assert await zc.get_blob("report") == b"small"
+
+        second = await zc.backend.get("report")
+        assert await zc.delete_blob("report")
+        assert await zc.backend.get("report") is None
+        assert await zc.backend.get(f"report:blob:{second.token}:0") is None
+
+    @pytest.mark.asyncio
+    async def test_parts_outlive_manifest(self, zc, monkeypatch):
+        ttls = {}
+        original = zc.backend.multi_set
+
+        async def recording(pairs, ttl=None, **kwargs):
+            ttls["parts"] = ttl
+            return await original(pairs, ttl=ttl, **kwargs)
+
+        monkeypatch.setattr(zc.backend, "multi_set", recording)
+        await zc.set_blob("report", b"x" * 10, ttl=30)
+        assert ttls["parts"] == 30 + cache_manager_module._BLOB_TTL_GRACE
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self, zc):
+        with pytest.raises(ValueError, match="chunk_size"):
+            await zc.set_blob("k", b"x", chunk_size=0)
+        with pytest.raises(ValueError, match="prefetch"):
+            await zc.stream_blob("k", prefetch=0)
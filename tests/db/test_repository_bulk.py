@@ -0,0 +1,201 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlmodel import Field, SQLModel
+
+from zodiac_core.db.repository import BaseSQLRepository, _bulk_values, _upsert_statement
+from zodiac_core.db.session import db
+from zodiac_core.db.sql import IntIDModel, UUIDModel
+
+
+class BulkProductModel(IntIDModel, table=True):
+    sku: str = Field(unique=True)
+    name: str
+    stock: int = 0
+
+
+class BulkTagModel(UUIDModel, table=True):
+    label: str
+
+
+class BulkPlainModel(SQLModel, table=True):
+    code: str = Field(primary_key=True)
+    value: int
+
+
+class TestBulkValues:
+    """Normalization of bulk rows into column dicts."""
+
+    def test_mappings_get_model_defaults(self):
+        (row,) = _bulk_values(BulkTagModel, [{"label": "a"}])
+        assert isinstance(row["id"], uuid.UUID)
+        assert isinstance(row["created_at"], datetime)
+        assert row["created_at"].tzinfo is not None
+
+        (row,) = _bulk_values(BulkProductModel, [{"sku": "s", "name": "n"}])
+        assert "id" not in row  # autoincrement key left to the database
+        assert row["stock"] == 0
+
+    def test_instances_drop_unset_primary_keys(self):
+        (row,) = _bulk_values(BulkProductModel, [BulkProductModel(sku="s", name="n", stock=3)])
+        assert "id" not in row
+        assert (row["sku"], row["stock"]) == ("s", 3)
+        assert "updated_at" in row
+
+    def test_upsert_statement_per_dialect(self):
+        from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+        pg = _upsert_statement(BulkProductModel, postgresql.dialect(), ["sku"], ["name"])
+        assert "ON CONFLICT (sku) DO UPDATE SET name = excluded.name" in str(pg.compile(dialect=postgresql.dialect()))
+        lite = _upsert_statement(BulkProductModel, sqlite.dialect(), ["sku"], [])
+        assert "ON CONFLICT (sku) DO NOTHING" in str(lite.compile(dialect=sqlite.dialect()))
+        my = _upsert_statement(BulkProductModel, mysql.dialect(), ["sku"], ["name", "stock"])
+        compiled = str(my.compile(dialect=mysql.dialect()))
+        assert "ON DUPLICATE KEY UPDATE name = VALUES(name), stock = VALUES(stock)" in compiled
+
+        class _Other:
+            name = "oracle"
+
+        with pytest.raises(ValueError, match="oracle"):
+            _upsert_statement(BulkProductModel, _Other(), ["sku"], ["name"])
+
+
+class TestRepositoryBulk:
+    """bulk_insert / bulk_upsert / bulk_update against SQLite."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup_db(self):
+        db.setup("sqlite+aiosqlite:///:memory:")
+        await db.create_all()
+        yield
+        await db.shutdown()
+
+    async def _products(self, repo):
+        async with repo.session() as session:
+            result = await session.execute(select(BulkProductModel).order_by(BulkProductModel.sku))
+            return result.scalars().all()
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_in_chunks(self, monkeypatch):
+        repo = BaseSQLRepository()
+        async with repo.session() as session:
+            executions = []
+            original = session.execute
+
+            async def recording(statement, params=None, **kwargs):
+                executions.append(len(params))
+                return await original(statement, params, **kwargs)
+
+            monkeypatch.setattr(session, "execute", recording)
+            rows = [{"sku": f"sku-{i:02d}", "name": f"Product {i}"} for i in range(10)]
+            rows.append(BulkProductModel(sku="sku-10", name="Product 10", stock=5))
+            assert await repo.bulk_insert(session, BulkProductModel, rows, chunk_size=4) == 11
+            await session.commit()
+
+        assert executions == [4, 4, 3]
+        products = await self._products(repo)
+        assert [p.sku for p in products] == [f"sku-{i:02d}" for i in range(11)]
+        assert products[-1].stock == 5
+        assert all(p.created_at is not None and p.updated_at is not None for p in products)
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_returning(self):
+        repo = BaseSQLRepository()
+        async with repo.session() as session:
+            rows = await repo.bulk_insert(
+                session,
+                BulkTagModel,
+                [{"label": label} for label in "cab"],
+                chunk_size=2,
+                returning=[BulkTagModel.id, BulkTagModel.label],
+            )
+            await session.commit()
+            assert [row.label for row in rows] == ["c", "a", "b"]
+            assert all(isinstance(row.id, uuid.UUID) for row in rows)
+            assert await repo.bulk_insert(session, BulkTagModel, [], returning=[BulkTagModel.id]) == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_updates_existing_rows(self):
+        repo = BaseSQLRepository()
+        old = datetime(2020, 1, 1)
+        async with repo.session() as session:
+            await repo.bulk_insert(
+                session,
+                BulkProductModel,
+                [{"sku": "a", "name": "A", "stock": 1, "created_at": old, "updated_at": old}],
+            )
+            rows = await repo.bulk_upsert(
+                session,
+                BulkProductModel,
+                [{"sku": "a", "name": "A2", "stock": 7}, {"sku": "b", "name": "B"}],
+                conflict_columns=["sku"],
+                returning=[BulkProductModel],
+            )
+            await session.commit()
+        assert [(row[0].sku, row[0].name) for row in rows] == [("a", "A2"), ("b", "B")]
+
+        a, b = await self._products(repo)
+        assert (a.name, a.stock) == ("A2", 7)
+        assert a.created_at.replace(tzinfo=None) == old  # preserved
+        assert a.updated_at.replace(tzinfo=None) > old + timedelta(days=1)  # refreshed
+        assert (b.name, b.stock) == ("B", 0)
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_defaults_to_primary_key_and_do_nothing(self):
+        repo = BaseSQLRepository()
+        async with repo.session() as session:
+            await repo.bulk_upsert(session, BulkPlainModel, [{"code": "x", "value": 1}])
+            await repo.bulk_upsert(session, BulkPlainModel, [{"code": "x", "value": 2}, {"code": "y", "value": 3}])
+            await repo.bulk_upsert(session, BulkPlainModel, [{"code": "x", "value": 9}], update_columns=[])
+            await session.commit()
+            result = await session.execute(select(BulkPlainModel.code, BulkPlainModel.value).order_by("code"))
+            assert result.all() == [("x", 2), ("y", 3)]
+
+    @pytest.mark.asyncio
+    async def test_bulk_update(self):
+        repo = BaseSQLRepository()
+        old = datetime(2020, 1, 1)
+        async with repo.session() as session:
+            await repo.bulk_insert(
+                session,
+                BulkProductModel,
+                [{"sku": s, "name": s.upper(), "created_at": old, "updated_at": old} for s in "abc"],
+            )
+            products = {p.sku: p.id for p in (await session.execute(select(BulkProductModel))).scalars()}
+            matched = await repo.bulk_update(
+                session,
+                BulkProductModel,
+                [
+                    {"id": products["a"], "stock": 10},
+                    {"id": products["b"], "stock": 20, "name": "Bee"},
+                    {"id": 999, "stock": 1},
+                ],
+                chunk_size=1,
+            )
+            by_sku = await repo.bulk_update(session, BulkProductModel, [{"sku": "c", "stock": 30}], key_columns=["sku"])
+            await session.commit()
+            with pytest.raises(ValueError, match="key columns"):
+                await repo.bulk_update(session, BulkProductModel, [{"stock": 1}])
+
+        assert (matched, by_sku) == (2, 1)
+        a, b, c = await self._products(repo)
+        assert [(p.name, p.stock) for p in (a, b, c)] == [("A", 10), ("Bee", 20), ("C", 30)]
+        assert all(p.updated_at.replace(tzinfo=None) > old for p in (a, b, c))
+        assert a.created_at.replace(tzinfo=None) == old
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_without_multi_rowcount_returns_none(self, monkeypatch):
+        repo = BaseSQLRepository()
+        async with repo.session() as session:
+            await repo.bulk_insert(session, BulkProductModel, [{"sku": "a", "name": "A"}])
+            # Like asyncpg, which reports -1 after executemany.
+            monkeypatch.setattr(session.get_bind().dialect, "supports_sane_multi_rowcount", False)
+            matched = await repo.bulk_update(session, BulkProductModel, [{"sku": "a", "stock": 5}], key_columns=["sku"])
+            assert matched is None
+            await session.commit()
+
+        (product,) = await self._products(repo)
+        assert product.stock == 5
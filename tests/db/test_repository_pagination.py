@@ -1,3 +1,7 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
 import pytest
 import pytest_asyncio
 from pydantic import BaseModel, ConfigDict
@@ -6,7 +10,8 @@ from sqlmodel import Field, SQLModel
 
 from zodiac_core.db.repository import BaseSQLRepository
 from zodiac_core.db.session import db
-from zodiac_core.pagination import PageParams
+from zodiac_core.exceptions import BadRequestException
+from zodiac_core.pagination import CursorParams, PageParams, encode_cursor
 
 
 # 1. Define Test Models
@@ -15,6 +20,12 @@ class ItemModel(SQLModel, table=True):
     name: str
 
 
+class EventModel(SQLModel, table=True):
+    id: int = Field(default=None, primary_key=True)
+    score: int
+    created_at: datetime
+
+
 class ItemModelSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     id: int
@@ -115,3 +126,260 @@ class TestRepositoryPagination:
 
         assert result.total == 0
         assert len(result.items) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count_strategy", ["sequential", "window", "concurrent"])
+    @pytest.mark.parametrize(("page", "expected_total", "expected_len"), [(1, 25, 10), (3, 25, 5), (4, 25, 0)])
+    async def test_count_strategies_agree(self, count_strategy, page, expected_total, expected_len):
+        """Every strategy returns the same total, including for a page past the end."""
+        repo = ItemModelRepository()
+        stmt = select(ItemModel).order_by(ItemModel.id)
+        result = await repo.paginate_query(
+            stmt, PageParams(page=page, size=10), ItemModelSchema, count_strategy=count_strategy
+        )
+
+        assert result.total == expected_total
+        assert len(result.items) == expected_len
+        assert all(isinstance(item, ItemModelSchema) for item in result.items)
+
+    @pytest.mark.asyncio
+    async def test_window_count_runs_a_single_query(self):
+        repo = ItemModelRepository()
+        statements = []
+        async with repo.session() as session:
+            original = session.execute
+
+            async def recording(statement, *args, **kwargs):
+                statements.append(statement)
+                return await original(statement, *args, **kwargs)
+
+            session.execute = recording
+            result = await repo.paginate(
+                session, select(ItemModel).order_by(ItemModel.id), PageParams(page=2, size=10), count_strategy="window"
+            )
+            empty = await repo.paginate(
+                session, select(ItemModel).where(ItemModel.id < 0), PageParams(page=1, size=10), count_strategy="window"
+            )
+
+        assert len(statements) == 2
+        assert (result.total, result.items[0].name) == (25, "Item 11")
+        assert (empty.total, empty.items) == (0, [])
+
+    @pytest.mark.asyncio
+    async def test_window_count_falls_back_for_distinct(self):
+        repo = ItemModelRepository()
+        stmt = (
+            select(ItemModel.name).where(ItemModel.id <= 4).union_all(select(ItemModel.name).where(ItemModel.id <= 4))
+        )
+        distinct = select(stmt.subquery().c.name).distinct().order_by("name")
+        result = await repo.paginate_query(distinct, PageParams(page=1, size=3), count_strategy="window")
+        assert result.total == 4
+        assert result.items == ["Item 01", "Item 02", "Item 03"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_count_uses_a_second_connection(self):
+        """With a real pool, the count runs on another connection and misses uncommitted rows."""
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "pagination.db")
+        db.setup(f"sqlite+aiosqlite:///{path}", name="pooled")
+        try:
+            await db.create_all(name="pooled")
+            repo = BaseSQLRepository(db_name="pooled")
+            async with repo.session() as session:
+                session.add_all([ItemModel(name=f"Pooled {i}") for i in range(3)])
+                await session.commit()
+                session.add(ItemModel(name="Uncommitted"))
+                await session.flush()
+
+                stmt = select(ItemModel).order_by(ItemModel.id)
+                concurrent = await repo.paginate(session, stmt, PageParams(size=10), count_strategy="concurrent")
+                sequential = await repo.paginate(session, stmt, PageParams(size=10))
+
+            assert (concurrent.total, len(concurrent.items)) == (3, 4)
+            assert (sequential.total, len(sequential.items)) == (4, 4)
+        finally:
+            await db.shutdown(name="pooled")
+            os.remove(path)
+            os.rmdir(directory)
+
+    @pytest.mark.asyncio
+    async def test_unknown_count_strategy(self):
+        repo = ItemModelRepository()
+        with pytest.raises(ValueError, match="count_strategy"):
+            await repo.paginate_query(select(ItemModel), PageParams(), count_strategy="guess")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("page", "has_next", "expected_len"), [(1, True, 10), (2, True, 10), (3, False, 5), (4, False, 0)]
+    )
+    async def test_count_mode_none_probes_for_next_page(self, page, has_next, expected_len):
+        repo = ItemModelRepository()
+        stmt = select(ItemModel).order_by(ItemModel.id)
+        result = await repo.paginate_query(stmt, PageParams(page=page, size=10), count_mode="none")
+
+        assert result.total is None
+        assert result.count_mode == "none"
+        assert result.has_next is has_next
+        assert len(result.items) == expected_len
+
+    @pytest.mark.asyncio
+    async def test_include_total_false_skips_the_count(self):
+        repo = ItemModelRepository()
+        params = PageParams(size=20, include_total=False)
+        result = await repo.paginate_query(select(ItemModel).order_by(ItemModel.id), params, ItemModelSchema)
+        assert (result.total, result.count_mode, result.has_next, len(result.items)) == (None, "none", True, 20)
+
+    @pytest.mark.asyncio
+    async def test_exact_count_derives_has_next(self):
+        repo = ItemModelRepository()
+        stmt = select(ItemModel).order_by(ItemModel.id)
+        first = await repo.paginate_query(stmt, PageParams(page=2, size=10))
+        last = await repo.paginate_query(stmt, PageParams(page=3, size=10))
+        assert (first.count_mode, first.has_next, first.total_capped) == ("exact", True, False)
+        assert last.has_next is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count_strategy", ["sequential", "concurrent"])
+    async def test_capped_count(self, count_strategy):
+        repo = ItemModelRepository()
+        stmt = select(ItemModel).order_by(ItemModel.id)
+        capped = await repo.paginate_query(
+            stmt, PageParams(page=3, size=10), count_mode="capped", count_cap=20, count_strategy=count_strategy
+        )
+        under = await repo.paginate_query(stmt, PageParams(size=10), count_mode="capped", count_cap=100)
+
+        assert (capped.total, capped.total_capped, capped.has_next, len(capped.items)) == (20, True, False, 5)
+        assert (under.total, under.total_capped, under.has_next) == (25, False, True)
+        assert under.count_mode == "capped"
+
+    @pytest.mark.asyncio
+    async def test_cached_count_is_reused_until_it_expires(self):
+        pytest.importorskip("aiocache")
+        from zodiac_core.cache import cache
+
+        cache.setup(prefix="pagination", name="counts")
+        try:
+            repo = ItemModelRepository()
+            stmt = select(ItemModel).where(ItemModel.id > 5).order_by(ItemModel.id)
+            options = {"count_mode": "cached", "count_cache": "counts", "count_ttl": 60}
+            first = await repo.paginate_query(stmt, PageParams(size=10), **options)
+
+            async with repo.session() as session:
+                session.add(ItemModel(name="Item 26"))
+                await session.commit()
+
+            stale = await repo.paginate_query(stmt, PageParams(page=2, size=10), **options)
+            other = await repo.paginate_query(select(ItemModel).where(ItemModel.id > 6), PageParams(), **options)
+
+            assert (first.total, first.count_mode) == (20, "cached")
+            assert stale.total == 20  # served from the cache
+            assert stale.has_next is True  # probed, not derived from the stale total
+            assert other.total == 20  # different parameters, counted afresh
+        finally:
+            await cache.shutdown(name="counts")
+
+    @pytest.mark.asyncio
+    async def test_unknown_count_mode(self):
+        repo = ItemModelRepository()
+        with pytest.raises(ValueError, match="count_mode"):
+            await repo.paginate_query(select(ItemModel), PageParams(), count_mode="guess")
+
+
+# 4. Keyset Pagination Test Class
+class TestRepositoryKeysetPagination:
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup_db(self):
+        """Seed 25 events with duplicate scores (ties) and distinct timestamps."""
+        db.setup("sqlite+aiosqlite:///:memory:")
+        await db.create_all()
+
+        base = datetime(2026, 1, 1)
+        async with db.session() as session:
+            for i in range(1, 26):
+                session.add(EventModel(score=i % 4, created_at=base + timedelta(minutes=i)))
+            await session.commit()
+
+        yield
+        await db.shutdown()
+
+    async def _walk(self, repo, order_by, size=7):
+        """Follow next_cursor to the end, then prev_cursor back; return both id sequences."""
+        forward, pages = [], []
+        params = CursorParams(size=size)
+        while True:
+            page = await repo.paginate_keyset_query(select(EventModel), params, order_by=order_by)
+            pages.append(page)
+            forward.extend(item.id for item in page.items)
+            if page.next_cursor is None:
+                break
+            params = CursorParams(cursor=page.next_cursor, size=size)
+
+        backward = [item.id for item in pages[-1].items]
+        page = pages[-1]
+        while page.prev_cursor is not None:
+            page = await repo.paginate_keyset_query(
+                select(EventModel), CursorParams(cursor=page.prev_cursor, size=size), order_by=order_by
+            )
+            backward[:0] = [item.id for item in page.items]
+        return forward, backward, pages
+
+    @pytest.mark.asyncio
+    async def test_walks_all_rows_once_with_ties_broken_by_primary_key(self):
+        repo = ItemModelRepository()
+        forward, backward, pages = await self._walk(repo, [EventModel.score])
+
+        expected = sorted(range(1, 26), key=lambda i: (i % 4, i))
+        assert forward == expected
+        assert backward == expected
+        assert [len(page.items) for page in pages] == [7, 7, 7, 4]
+        assert pages[0].prev_cursor is None
+        assert pages[-1].next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_descending_and_mixed_directions(self):
+        repo = ItemModelRepository()
+        forward, backward, _ = await self._walk(repo, [EventModel.created_at.desc()], size=10)
+        assert forward == backward == list(range(25, 0, -1))
+
+        forward, backward, _ = await self._walk(repo, [EventModel.score.desc(), EventModel.id.asc()], size=6)
+        expected = sorted(range(1, 26), key=lambda i: (-(i % 4), i))
+        assert forward == backward == expected
+
+    @pytest.mark.asyncio
+    async def test_transformer_and_session_variant(self):
+        repo = ItemModelRepository()
+        async with repo.session() as session:
+            page = await repo.paginate_keyset(
+                session, select(EventModel).where(EventModel.score == 1), CursorParams(size=3), order_by=[EventModel.id]
+            )
+        assert [item.id for item in page.items] == [1, 5, 9]
+        assert page.size == 3
+        assert page.next_cursor is not None
+
+        class EventSchema(BaseModel):
+            model_config = ConfigDict(from_attributes=True)
+            id: int
+            created_at: datetime
+
+        page = await repo.paginate_keyset_query(
+            select(EventModel), CursorParams(size=2), order_by=[EventModel.created_at], transformer=EventSchema
+        )
+        assert isinstance(page.items[0], EventSchema)
+
+    @pytest.mark.asyncio
+    async def test_empty_result(self):
+        repo = ItemModelRepository()
+        stmt = select(EventModel).where(EventModel.score == 99)
+        page = await repo.paginate_keyset_query(stmt, CursorParams(), order_by=[EventModel.id])
+        assert page.items == []
+        assert page.next_cursor is None
+        assert page.prev_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_not_matching_order_is_rejected(self):
+        repo = ItemModelRepository()
+        params = CursorParams(cursor=encode_cursor([1]))
+        with pytest.raises(BadRequestException):
+            await repo.paginate_keyset_query(select(EventModel), params, order_by=[EventModel.score])
+        with pytest.raises(ValueError, match="order_by"):
+            await repo.paginate_keyset_query(select(EventModel), CursorParams(), order_by=[])
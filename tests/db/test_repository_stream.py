@@ -0,0 +1,89 @@
+import pytest
+import pytest_asyncio
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import select
+from sqlmodel import Field, SQLModel
+
+from zodiac_core.db.repository import BaseSQLRepository
+from zodiac_core.db.session import db
+
+
+class StreamRowModel(SQLModel, table=True):
+    id: int = Field(default=None, primary_key=True)
+    name: str
+
+
+class StreamRowSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    name: str
+
+
+class TestRepositoryStream:
+    """BaseSQLRepository.stream reads results chunk by chunk."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup_db(self):
+        db.setup("sqlite+aiosqlite:///:memory:")
+        await db.create_all()
+        async with db.session() as session:
+            session.add_all([StreamRowModel(name=f"Row {i:02d}") for i in range(1, 26)])
+            await session.commit()
+        yield
+        await db.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_streams_all_rows_in_chunks(self, monkeypatch):
+        repo = BaseSQLRepository()
+        validated = []
+        original = StreamRowSchema.model_validate.__func__
+
+        def recording(cls, obj, *args, **kwargs):
+            validated.append(obj.id)
+            return original(cls, obj, *args, **kwargs)
+
+        monkeypatch.setattr(StreamRowSchema, "model_validate", classmethod(recording))
+        received = []
+        stmt = select(StreamRowModel).order_by(StreamRowModel.id)
+        async for item in repo.stream(stmt, chunk_size=10, transformer=StreamRowSchema):
+            received.append((item.id, len(validated)))
+
+        assert [item_id for item_id, _ in received] == list(range(1, 26))
+        # Each chunk is transformed when it is fetched, not the whole result up front.
+        assert [seen for _, seen in received] == [10] * 10 + [20] * 10 + [25] * 5
+
+    @pytest.mark.asyncio
+    async def test_uses_yield_per_on_the_given_session(self):
+        repo = BaseSQLRepository()
+        async with repo.session() as session:
+            statements = []
+            original = session.stream
+
+            async def recording(statement, *args, **kwargs):
+                statements.append(statement)
+                return await original(statement, *args, **kwargs)
+
+            session.stream = recording
+            names = [row async for row in repo.stream(select(StreamRowModel.name).order_by("id"), session=session)]
+
+        assert names[:2] == ["Row 01", "Row 02"]
+        assert len(names) == 25
+        assert statements[0].get_execution_options()["yield_per"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_releases_the_session(self):
+        repo = BaseSQLRepository()
+        stream = repo.stream(select(StreamRowModel).order_by(StreamRowModel.id), chunk_size=5)
+        first = await anext(stream)
+        await stream.aclose()
+        assert first.id == 1
+
+        # The connection is usable again.
+        async with repo.session() as session:
+            assert len((await session.execute(select(StreamRowModel))).scalars().all()) == 25
+
+    @pytest.mark.asyncio
+    async def test_invalid_chunk_size(self):
+        repo = BaseSQLRepository()
+        with pytest.raises(ValueError, match="chunk_size"):
+            await anext(repo.stream(select(StreamRowModel), chunk_size=0))
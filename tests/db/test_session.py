@@ -1,7 +1,12 @@
+import asyncio
+import os
+import shutil
+import tempfile
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from sqlalchemy import text
+import pytest_asyncio
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Field, SQLModel
 
@@ -270,3 +275,125 @@ class TestDependencyIntegration:
         with pytest.raises(RuntimeError, match="not initialized"):
             await anext(gen)
         await gen.aclose()
+
+
+class ReplicaMarkerModel(SQLModel, table=True):
+    id: int = Field(default=None, primary_key=True)
+    source: str
+
+
+class TestReadReplicas:
+    """Primary/replica groups: read-only routing, selection policies and read-your-writes."""
+
+    @pytest_asyncio.fixture
+    async def replicated(self):
+        """A primary and two replicas, each a separate SQLite file holding one row naming itself."""
+        if db._engines:
+            await db.shutdown()
+        directory = tempfile.mkdtemp()
+        urls = {source: f"sqlite+aiosqlite:///{os.path.join(directory, source)}.db" for source in ("p", "r1", "r2")}
+
+        async def setup(selection="round_robin"):
+            db.setup(urls["p"], replicas=[urls["r1"], urls["r2"]], replica_selection=selection)
+            engines = [db.engine, *db.get_replica_engines()]
+            for source, engine in zip(urls, engines, strict=True):
+                async with engine.begin() as conn:
+                    await conn.run_sync(ReplicaMarkerModel.metadata.create_all, tables=[ReplicaMarkerModel.__table__])
+                    await conn.execute(ReplicaMarkerModel.__table__.insert().values(source=source))
+
+        yield setup
+        await db.shutdown()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    @staticmethod
+    async def _source(session):
+        return (await session.execute(select(ReplicaMarkerModel.source).order_by(ReplicaMarkerModel.id))).scalar()
+
+    @pytest.mark.asyncio
+    async def test_readonly_sessions_rotate_over_replicas(self, replicated):
+        await replicated()
+
+        async def reads():
+            sources = []
+            for _ in range(4):
+                async with db.session(readonly=True) as session:
+                    sources.append(await self._source(session))
+            async with db.session() as session:
+                sources.append(await self._source(session))
+            return sources
+
+        # A fresh context, as for a request that has not written anything.
+        assert await asyncio.create_task(reads()) == ["r1", "r2", "r1", "r2", "p"]
+        assert len(db.get_replica_engines()) == 2
+        assert db.get_replica_engines("other") == []
+
+    @pytest.mark.asyncio
+    async def test_reads_stick_to_the_primary_after_a_write(self, replicated):
+        await replicated()
+
+        async def request(write):
+            async with db.session() as session:
+                if write == "orm":
+                    session.add(ReplicaMarkerModel(source="new"))
+                    await session.flush()
+                elif write == "core":
+                    await session.execute(ReplicaMarkerModel.__table__.delete().where(ReplicaMarkerModel.id < 0))
+                elif write == "manual":
+                    db.mark_written()
+                else:
+                    await session.execute(select(ReplicaMarkerModel))
+                async with db.session(readonly=True) as reader:
+                    return await self._source(reader)
+
+        assert await asyncio.create_task(request("orm")) == "p"
+        assert await asyncio.create_task(request("core")) == "p"
+        assert await asyncio.create_task(request("manual")) == "p"
+        # Stickiness is scoped to the context that wrote.
+        assert await asyncio.create_task(request(None)) in ("r1", "r2")
+
+    @pytest.mark.asyncio
+    async def test_least_connections_avoids_busy_replicas(self, replicated):
+        await replicated("least_connections")
+
+        async def reads():
+            async with db.session(readonly=True) as busy:
+                first = await self._source(busy)  # keeps its connection checked out
+                sources = []
+                for _ in range(3):
+                    async with db.session(readonly=True) as session:
+                        sources.append(await self._source(session))
+                return first, sources
+
+        first, sources = await asyncio.create_task(reads())
+        other = "r2" if first == "r1" else "r1"
+        assert sources == [other] * 3
+
+    @pytest.mark.asyncio
+    async def test_repository_reads_use_replicas(self, replicated):
+        from zodiac_core.db.repository import BaseSQLRepository
+        from zodiac_core.pagination import PageParams
+
+        await replicated()
+        repo = BaseSQLRepository()
+
+        async def reads():
+            page = await repo.paginate_query(select(ReplicaMarkerModel), PageParams())
+            streamed = [item async for item in repo.stream(select(ReplicaMarkerModel))]
+            async with repo.session() as session:
+                written = await self._source(session)
+            return page.items[0].source, streamed[0].source, written
+
+        paged, streamed, written = await asyncio.create_task(reads())
+        assert {paged, streamed} == {"r1", "r2"}
+        assert written == "p"
+
+    @pytest.mark.asyncio
+    async def test_replica_setup_validation_and_shutdown(self, replicated):
+        with pytest.raises(ValueError, match="replica_selection"):
+            db.setup("sqlite+aiosqlite:///:memory:", replicas=["sqlite+aiosqlite:///:memory:"], replica_selection="x")
+        await replicated()
+        assert await db.verify()
+        with pytest.raises(RuntimeError, match="different settings"):
+            db.setup("sqlite+aiosqlite:///:memory:")
+        await db.shutdown(name=DEFAULT_DB_NAME)
+        assert db._replica_groups == {}
@@ -5,7 +5,15 @@ import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
-from zodiac_core import ServiceNameMiddleware, TraceIDMiddleware, get_request_id, get_service_name, setup_loguru
+from zodiac_core import (
+    RequestMemoMiddleware,
+    ServiceNameMiddleware,
+    TraceIDMiddleware,
+    get_request_id,
+    get_service_name,
+    setup_loguru,
+)
+from zodiac_core.context import get_request_memo
 from zodiac_core.middleware import AccessLogMiddleware, register_middleware
 
 
@@ -296,3 +304,57 @@ class TestServiceNameMiddleware:
         await middleware({"type": "lifespan"}, noop_receive, noop_send)
 
         assert seen_service_name == [None]
+
+
+@pytest.mark.asyncio
+class TestRequestMemoMiddleware:
+    async def test_http_gets_fresh_memo_per_request(self):
+        seen_memos = []
+
+        async def fake_app(scope, receive, send):
+            memo = get_request_memo()
+            memo["calls"] = memo.get("calls", 0) + 1
+            seen_memos.append(memo)
+
+        async def noop_receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def noop_send(_message):
+            pass
+
+        middleware = RequestMemoMiddleware(fake_app)
+        await middleware({"type": "http", "path": "/", "headers": []}, noop_receive, noop_send)
+        await middleware({"type": "http", "path": "/", "headers": []}, noop_receive, noop_send)
+
+        assert seen_memos[0] == seen_memos[1] == {"calls": 1}
+        assert seen_memos[0] is not seen_memos[1]
+        assert get_request_memo() is None
+
+    async def test_lifespan_passthrough(self):
+        seen_memos = []
+
+        async def fake_app(scope, receive, send):
+            seen_memos.append(get_request_memo())
+
+        async def noop_receive():
+            return {}
+
+        async def noop_send(_message):
+            pass
+
+        middleware = RequestMemoMiddleware(fake_app)
+        await middleware({"type": "lifespan"}, noop_receive, noop_send)
+
+        assert seen_memos == [None]
+
+    async def test_registered_by_register_middleware(self):
+        app = FastAPI()
+        register_middleware(app)
+
+        @app.get("/memo")
+        async def memo_endpoint():
+            return {"has_memo": get_request_memo() is not None}
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.get("/memo")
+        assert resp.json() == {"has_memo": True}
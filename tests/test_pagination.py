@@ -1,11 +1,16 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
 from typing import Annotated
+from uuid import UUID
 
 import pytest
 from fastapi import FastAPI, Query
 from fastapi.testclient import TestClient
 from pydantic import BaseModel, ValidationError
 
-from zodiac_core.pagination import PagedResponse, PageParams
+from zodiac_core.exceptions import BadRequestException
+from zodiac_core.pagination import CursorPage, CursorParams, PagedResponse, PageParams, decode_cursor, encode_cursor
 
 
 class UserDTO(BaseModel):
@@ -20,6 +25,7 @@ class TestPageParams:
         p = PageParams()
         assert p.page == 1
         assert p.size == 20
+        assert p.include_total is True
 
     def test_valid_custom_values(self):
         p = PageParams(page=2, size=50)
@@ -53,6 +59,16 @@ class TestPagedResponse:
         assert resp.total == 105
         assert resp.page == 1
         assert resp.size == 10
+        assert resp.has_next is True
+        assert resp.count_mode == "exact"
+
+    def test_create_without_exact_total(self):
+        params = PageParams(page=3, size=10)
+        assert PagedResponse.create([], 30, params).has_next is False
+        assert PagedResponse.create([], None, params, has_next=True, count_mode="none").has_next is True
+        capped = PagedResponse.create([], 30, params, count_mode="capped", total_capped=True)
+        assert capped.has_next is None  # unknown past a capped total
+        assert PagedResponse.create([], 30, PageParams(page=2, size=10), total_capped=True).has_next is True
 
 
 class TestPaginationIntegration:
@@ -92,3 +108,44 @@ class TestPaginationIntegration:
         response = client.get("/users?size=200")
         assert response.status_code == 422
         assert "less than or equal to 100" in response.text
+
+
+class TestCursors:
+    """Tests for keyset pagination cursors and models."""
+
+    class Color(Enum):
+        RED = "red"
+
+    def test_roundtrip_typed_values(self):
+        values = [
+            datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc),
+            date(2026, 1, 2),
+            Decimal("1.50"),
+            UUID("12345678-1234-5678-1234-567812345678"),
+            42,
+            "name",
+            None,
+        ]
+        cursor = encode_cursor(values)
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (values, False)
+        assert decode_cursor(encode_cursor([self.Color.RED], backward=True)) == (["red"], True)
+
+    def test_unsupported_value(self):
+        with pytest.raises(TypeError):
+            encode_cursor([object()])
+
+    @pytest.mark.parametrize(
+        "cursor", ["not-base64!", "e30", encode_cursor([1])[:-3], "eyJ2IjpbeyJkZWMiOiJ4In1dLCJiIjpmYWxzZX0"]
+    )
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(BadRequestException):
+            decode_cursor(cursor)
+
+    def test_models(self):
+        params = CursorParams()
+        assert (params.cursor, params.size) == (None, 20)
+        with pytest.raises(ValidationError):
+            CursorParams(size=101)
+        page = CursorPage[UserDTO].create([UserDTO(id=1, name="A")], CursorParams(size=5), next_cursor="n")
+        assert (page.size, page.next_cursor, page.prev_cursor) == (5, "n", None)
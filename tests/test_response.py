@@ -1,12 +1,19 @@
 import json
+from datetime import datetime
 
-from fastapi import status
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
+from zodiac_core.exceptions import NotFoundException
 from zodiac_core.response import (
+    StreamingDataResponse,
     create_response,
     response_created,
     response_ok,
 )
+from zodiac_core.routing import APIRouter
 
 
 class TestResponseHelpers:
@@ -58,3 +65,97 @@ class TestResponseHelpers:
         data = json.loads(resp.body)
         assert data["code"] == 1000
         assert data["message"] == "Custom"
+
+
+class StreamItem(BaseModel):
+    id: int
+    at: datetime
+
+
+async def _items(count, fail_with=None):
+    for i in range(count):
+        yield StreamItem(id=i, at=datetime(2026, 1, 1))
+    if fail_with is not None:
+        raise fail_with
+
+
+async def _collect(response):
+    return [chunk async for chunk in response.body_iterator]
+
+
+class TestStreamingDataResponse:
+    """StreamingDataResponse emits items incrementally as NDJSON or an enveloped JSON array."""
+
+    @pytest.mark.asyncio
+    async def test_json_envelope(self):
+        response = StreamingDataResponse(_items(3), flush_size=1)
+        chunks = await _collect(response)
+        assert response.media_type == "application/json"
+        assert chunks[0] == b'{"data":['  # sent before any item is produced
+        assert len(chunks) == 5
+        body = json.loads(b"".join(chunks))
+        assert body == {
+            "data": [{"id": i, "at": "2026-01-01T00:00:00"} for i in range(3)],
+            "code": 0,
+            "message": "Success",
+        }
+
+    @pytest.mark.asyncio
+    async def test_empty_json_and_custom_envelope(self):
+        chunks = await _collect(StreamingDataResponse(_items(0), code=7, message="Exported"))
+        assert json.loads(b"".join(chunks)) == {"data": [], "code": 7, "message": "Exported"}
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self):
+        response = StreamingDataResponse(_items(3), format="ndjson")
+        chunks = await _collect(response)
+        assert response.media_type == "application/x-ndjson"
+        assert len(chunks) == 1  # buffered up to flush_size
+        lines = b"".join(chunks).splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_errors_close_the_json_envelope(self):
+        chunks = await _collect(StreamingDataResponse(_items(2, NotFoundException(message="gone"))))
+        body = json.loads(b"".join(chunks))
+        assert [item["id"] for item in body["data"]] == [0, 1]
+        assert (body["code"], body["message"]) == (status.HTTP_404_NOT_FOUND, "gone")
+
+        chunks = await _collect(StreamingDataResponse(_items(1, RuntimeError("boom"))))
+        body = json.loads(b"".join(chunks))
+        assert (body["code"], body["message"]) == (500, "Internal Server Error")
+
+    @pytest.mark.asyncio
+    async def test_errors_abort_ndjson(self):
+        response = StreamingDataResponse(_items(2, RuntimeError("boom")), format="ndjson")
+        chunks = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for chunk in response.body_iterator:
+                chunks.append(chunk)
+        assert len(b"".join(chunks).splitlines()) == 2  # buffered items are sent first
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="format"):
+            StreamingDataResponse(_items(0), format="csv")
+
+    def test_zodiac_route_streams_async_iterators(self):
+        app = FastAPI()
+        router = APIRouter()
+
+        @router.get("/auto", response_model=list[StreamItem])
+        async def auto():
+            return _items(2)
+
+        @router.get("/ndjson")
+        async def ndjson():
+            return StreamingDataResponse(_items(2), format="ndjson")
+
+        app.include_router(router)
+        client = TestClient(app)
+
+        auto_response = client.get("/auto")
+        assert auto_response.json()["data"][1]["id"] == 1
+        assert auto_response.json()["code"] == 0
+        ndjson_response = client.get("/ndjson")
+        assert ndjson_response.headers["content-type"] == "application/x-ndjson"
+        assert len(ndjson_response.text.splitlines()) == 2
@@ -21,10 +21,17 @@ from .http import (
     translate_upstream_errors,
 )
 from .logging import LogFileOptions, setup_loguru
-from .middleware import AccessLogMiddleware, ServiceNameMiddleware, TraceIDMiddleware, register_middleware
+from .middleware import (
+    AccessLogMiddleware,
+    RequestMemoMiddleware,
+    ServiceNameMiddleware,
+    TraceIDMiddleware,
+    register_middleware,
+)
 from .pagination import PagedResponse, PageParams
 from .response import (
     Response,
+    StreamingDataResponse,
     create_response,
     response_bad_request,
     response_conflict,
@@ -58,6 +65,7 @@ __all__ = [
     "__version__",
     # response
     "Response",
+    "StreamingDataResponse",
     "create_response",
     "response_ok",
     "response_created",
@@ -76,6 +84,7 @@ __all__ = [
     "TraceIDMiddleware",
     "ServiceNameMiddleware",
     "AccessLogMiddleware",
+    "RequestMemoMiddleware",
     # http client
     "ZodiacClient",
     "ZodiacSyncClient",
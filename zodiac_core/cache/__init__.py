@@ -15,12 +15,27 @@ Example:
     async def get_user(user_id: int):
         return await db.fetch_user(user_id)
 
+    # Batch loaders: one round trip, producer called once with the missing ids
+    @cached_batch(ttl=60)
+    async def get_users(user_ids: list[int]) -> dict[int, User]:
+        return await db.fetch_users(user_ids)
+
     # Or use the cache instance directly
     c = cache.cache
     await c.get_or_set("entity:123", load_user, ttl=300)
 """
 
-from zodiac_core.cache.decorators import cached
-from zodiac_core.cache.manager import ZodiacCache, cache
-
-__all__ = ["cache", "cached", "ZodiacCache"]
+from zodiac_core.cache.decorators import cached, cached_batch, memoize_request
+from zodiac_core.cache.manager import CacheUnavailableError, IncompleteBlobError, ZodiacCache, cache
+from zodiac_core.cache.middleware import ResponseCacheMiddleware
+
+__all__ = [
+    "cache",
+    "cached",
+    "cached_batch",
+    "memoize_request",
+    "ZodiacCache",
+    "CacheUnavailableError",
+    "IncompleteBlobError",
+    "ResponseCacheMiddleware",
+]
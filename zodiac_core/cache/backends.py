@@ -0,0 +1,280 @@
+"""
+Bounded in-memory aiocache backend for ZodiacCache.
+
+``ZodiacMemoryCache`` is a drop-in replacement for ``aiocache.SimpleMemoryCache``
+that bounds memory with an LRU policy (by entry count and/or payload bytes) and
+expires entries with a single timer-wheel sweeper per cache instead of one
+``loop.call_later`` handle per key.
+
+Example:
+
+    cache.setup(
+        prefix="myapp",
+        cache="zodiac_core.cache.backends.ZodiacMemoryCache",
+        max_entries=100_000,
+        max_bytes=256 * 1024 * 1024,
+    )
+"""
+
+import asyncio
+import math
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from aiocache.base import BaseCache
+from aiocache.serializers import NullSerializer
+
+# (value, expires_at on the monotonic clock or None, accounted size in bytes)
+_Entry = Tuple[Any, Optional[float], int]
+
+
+def _size_of(value: Any) -> int:
+    """Payload size: exact for bytes/str (serialized values), shallow ``sys.getsizeof`` otherwise."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode())
+    return sys.getsizeof(value)
+
+
+class ZodiacMemoryBackend(BaseCache):
+    """
+    OrderedDict-based LRU store with lazy and swept expiry.
+
+    Expired entries are never returned (checked on access) and are reclaimed by
+    a sweeper task that wakes every ``sweep_interval`` seconds while entries
+    with a TTL exist. Keys are bucketed by expiry tick (a hashed timer wheel),
+    so each sweep only visits keys that are due; a key leaves its bucket when
+    its entry is evicted, deleted or rescheduled, so the wheel never holds more
+    keys than the store.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: float = 1.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        if sweep_interval <= 0:
+            raise ValueError("sweep_interval must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = float(sweep_interval)
+
+        self._data: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._wheel: Dict[int, Set[str]] = {}
+        self._swept_tick = math.floor(time.monotonic() / self.sweep_interval)
+        self._sweeper: Optional[asyncio.Task] = None
+
+    @property
+    def size(self) -> int:
+        """Number of stored entries (including expired ones not yet swept)."""
+        return len(self._data)
+
+    @property
+    def bytes_used(self) -> int:
+        """Accounted payload bytes of all stored entries."""
+        return self._bytes
+
+    def _tick(self, deadline: float) -> int:
+        """Bucket of a deadline: the first tick boundary at or after it."""
+        return math.ceil(deadline / self.sweep_interval)
+
+    def _lookup(self, key: str) -> Optional[_Entry]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            self._pop(key)
+            return None
+        return entry
+
+    def _store(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        self._pop(key)
+        expires_at = time.monotonic() + ttl if ttl else None
+        size = _size_of(value)
+        self._data[key] = (value, expires_at, size)
+        self._bytes += size
+        if expires_at is not None:
+            self._schedule(key, expires_at)
+        self._evict()
+
+    def _pop(self, key: str) -> int:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return 0
+        self._bytes -= entry[2]
+        self._unschedule(key, entry[1])
+        return 1
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until both bounds hold (an oversized value is not kept)."""
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key, entry = self._data.popitem(last=False)
+            self._bytes -= entry[2]
+            self._unschedule(key, entry[1])
+
+    def _unschedule(self, key: str, expires_at: Optional[float]) -> None:
+        """Remove ``key`` from the bucket of its deadline, dropping the bucket once empty."""
+        if expires_at is None:
+            return
+        tick = self._tick(expires_at)
+        bucket = self._wheel.get(tick)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._wheel[tick]
+
+    def _schedule(self, key: str, expires_at: float) -> None:
+        self._wheel.setdefault(self._tick(expires_at), set()).add(key)
+        loop = asyncio.get_running_loop()
+        if self._sweeper is None or self._sweeper.done() or self._sweeper.get_loop() is not loop:
+            self._sweeper = loop.create_task(self._sweep_forever())
+
+    def _sweep(self, now: float) -> int:
+        """Remove expired keys from every bucket that is due; returns the number removed."""
+        removed = 0
+        now_tick = math.floor(now / self.sweep_interval)  # only buckets whose boundary has passed are due
+        if now_tick - self._swept_tick <= len(self._wheel):
+            due = range(self._swept_tick + 1, now_tick + 1)
+        else:  # after a long pause, scanning the buckets is cheaper than walking every elapsed tick
+            due = sorted(tick for tick in self._wheel if tick <= now_tick)
+        for tick in due:
+            for key in self._wheel.pop(tick, ()):
+                entry = self._data.get(key)
+                if entry is not None and entry[1] is not None and entry[1] <= now:
+                    removed += self._pop(key)
+        self._swept_tick = now_tick
+        return removed
+
+    async def _sweep_forever(self) -> None:
+        while self._wheel:
+            await asyncio.sleep(self.sweep_interval)
+            self._sweep(time.monotonic())
+
+    async def _get(self, key, encoding="utf-8", _conn=None):
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        self._data.move_to_end(key)
+        return entry[0]
+
+    async def _gets(self, key, encoding="utf-8", _conn=None):
+        return await self._get(key, encoding=encoding, _conn=_conn)
+
+    async def _multi_get(self, keys, encoding="utf-8", _conn=None):
+        return [await self._get(key, encoding=encoding) for key in keys]
+
+    async def _set(self, key, value, ttl=None, _cas_token=None, _conn=None):
+        if _cas_token is not None:
+            entry = self._lookup(key)
+            if entry is None or entry[0] != _cas_token:
+                return 0
+        self._store(key, value, ttl)
+        return True
+
+    async def _multi_set(self, pairs, ttl=None, _conn=None):
+        for key, value in pairs:
+            self._store(key, value, ttl)
+        return True
+
+    async def _add(self, key, value, ttl=None, _conn=None):
+        if self._lookup(key) is not None:
+            raise ValueError("Key {} already exists, use .set to update the value".format(key))
+        self._store(key, value, ttl)
+        return True
+
+    async def _exists(self, key, _conn=None):
+        return self._lookup(key) is not None
+
+    async def _increment(self, key, delta, _conn=None):
+        entry = self._lookup(key)
+        if entry is None:
+            self._store(key, delta, None)
+            return delta
+        try:
+            value = int(entry[0]) + delta
+        except ValueError:
+            raise TypeError("Value is not an integer") from None
+        # Increments keep the remaining TTL (and wheel bucket), like Redis INCRBY.
+        size = _size_of(value)
+        self._data[key] = (value, entry[1], size)
+        self._bytes += size - entry[2]
+        return value
+
+    async def _expire(self, key, ttl, _conn=None):
+        entry = self._lookup(key)
+        if entry is None:
+            return False
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._unschedule(key, entry[1])
+        self._data[key] = (entry[0], expires_at, entry[2])
+        if expires_at is not None:
+            self._schedule(key, expires_at)
+        return True
+
+    async def _delete(self, key, _conn=None):
+        return self._pop(key)
+
+    async def _clear(self, namespace=None, _conn=None):
+        if namespace:
+            for key in [key for key in self._data if key.startswith(namespace)]:
+                self._pop(key)
+        else:
+            self._data.clear()
+            self._bytes = 0
+            self._wheel.clear()
+        return True
+
+    async def _raw(self, command, *args, encoding="utf-8", _conn=None, **kwargs):
+        return getattr(self._data, command)(*args, **kwargs)
+
+    async def _redlock_release(self, key, value):
+        entry = self._lookup(key)
+        if entry is not None and entry[0] == value:
+            return self._pop(key)
+        return 0
+
+    async def _close(self, *args, _conn=None, **kwargs):
+        if self._sweeper is not None and not self._sweeper.done():
+            self._sweeper.cancel()
+        self._sweeper = None
+
+
+class ZodiacMemoryCache(ZodiacMemoryBackend):
+    """
+    Bounded memory cache for ``cache.setup(cache="zodiac_core.cache.backends.ZodiacMemoryCache")``.
+
+    Defaults to ``NullSerializer`` like ``SimpleMemoryCache``; ``CacheManager.setup``
+    configures ``PickleSerializer`` unless told otherwise, in which case
+    ``max_bytes`` accounts the exact serialized size.
+
+    Args:
+        max_entries: Maximum number of entries; least recently used entries are
+            evicted beyond it. Unbounded when None.
+        max_bytes: Maximum accounted payload size in bytes (exact for serialized
+            values, shallow ``sys.getsizeof`` for raw objects). Unbounded when None.
+        sweep_interval: Resolution in seconds of the expiry sweeper.
+    """
+
+    NAME = "zodiac_memory"
+
+    def __init__(self, serializer=None, **kwargs):
+        super().__init__(serializer=serializer or NullSerializer(), **kwargs)
+
+    @classmethod
+    def parse_uri_path(cls, path):
+        return {}
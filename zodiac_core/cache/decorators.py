@@ -1,17 +1,26 @@
 """
 @cached decorator: cache async or sync function result using the configured default cache.
+@cached_batch decorator: cache per-id results of batch loaders with one round trip per call.
+@memoize_request decorator: memoize results for the duration of one request (no backend).
 """
 
+import asyncio
+import contextvars
 import hashlib
 import inspect
 import pickle
-from collections.abc import Awaitable, Callable
-from functools import wraps
-from typing import Any, Optional, TypeVar
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from concurrent.futures import Executor
+from functools import partial, wraps
+from typing import Any, Dict, List, Optional, TypeVar, Union
 
+from zodiac_core.cache.manager import TTLJitter, _check_ttl_jitter, _tag_list
 from zodiac_core.cache.manager import cache as _default_cache_manager
+from zodiac_core.cache.stats import function_label_scope
+from zodiac_core.context import get_request_memo
 
 T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
 
 
 def _skip_none(result: Any) -> bool:
@@ -19,6 +28,36 @@ def _skip_none(result: Any) -> bool:
     return result is None
 
 
+async def _run_in_executor(executor: Optional[Executor], fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a sync callable in ``executor`` (None: the loop's default) with a copy of the current context."""
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(context.run, fn, *args, **kwargs))
+
+
+# Exact types eligible for the repr-based fast path (subclasses such as enums take the slow path).
+_SCALAR_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+
+
+async def _memoized(memo: Dict[Any, Any], key: Any, compute: Callable[[], Awaitable[T]]) -> T:
+    """
+    Return the memoized result for ``key`` or compute it once. Concurrent callers
+    in the same request share one computation; failures are not memoized.
+    """
+    future = memo.get(key)
+    if future is None:
+        future = asyncio.ensure_future(compute())
+        memo[key] = future
+
+        def _forget_failure(done: asyncio.Future) -> None:
+            if done.cancelled() or done.exception() is not None:
+                if memo.get(key) is done:
+                    del memo[key]
+
+        future.add_done_callback(_forget_failure)
+    return await asyncio.shield(future)
+
+
 def _normalize_key_part(value: Any) -> Any:
     """Normalize supported arguments into a stable structure for the default key builder."""
     if value is None or isinstance(value, bool | int | float | str | bytes):
@@ -28,6 +67,50 @@ def _normalize_key_part(value: Any) -> Any:
     raise TypeError(f"unsupported type {type(value).__qualname__}")
 
 
+def _compile_key_builder(
+    fn: Callable[..., Awaitable[Any]],
+    *,
+    include_cls: bool = False,
+    include_self: bool = False,
+) -> Callable[[Callable[..., Awaitable[Any]], tuple, dict], str]:
+    """
+    Build the default (fn, args, kwargs) -> str key function for ``fn`` once.
+
+    Function identity and receiver handling are resolved at decoration time.
+    Calls whose arguments are all plain scalars hash their ``repr`` directly;
+    anything else (e.g. tuples) is normalized and pickled as before.
+    """
+    base = f"{fn.__module__}:{fn.__qualname__}"
+    parameter_names = tuple(inspect.signature(fn).parameters)
+    first_param = parameter_names[0] if parameter_names else None
+    replace_cls = first_param == "cls" and include_cls
+    replace_self = first_param == "self" and include_self
+    scalar_types = _SCALAR_TYPES
+
+    def builder(_fn: Callable[..., Awaitable[Any]], args: tuple, kwargs: dict) -> str:
+        if args and (replace_cls or replace_self):
+            owner = args[0] if replace_cls else args[0].__class__
+            args = (f"{owner.__module__}:{owner.__qualname__}", *args[1:])
+
+        if all(type(arg) in scalar_types for arg in args) and all(
+            type(value) in scalar_types for value in kwargs.values()
+        ):
+            raw = repr((args, sorted(kwargs.items()))).encode()
+        else:
+            try:
+                normalized_args = tuple(_normalize_key_part(arg) for arg in args)
+                normalized_kwargs = tuple((key, _normalize_key_part(value)) for key, value in sorted(kwargs.items()))
+            except TypeError as e:
+                raise TypeError(
+                    f"Unsupported argument type for cached key in {base}; "
+                    "provide key_builder explicitly for complex parameters"
+                ) from e
+            raw = pickle.dumps((normalized_args, normalized_kwargs))
+        return f"{base}:{hashlib.blake2b(raw, digest_size=8).hexdigest()}"
+
+    return builder
+
+
 def _default_key_builder(
     fn: Callable[..., Awaitable[Any]],
     args: tuple,
@@ -36,33 +119,8 @@ def _default_key_builder(
     include_cls: bool = False,
     include_self: bool = False,
 ) -> str:
-    """Build cache key from function identity and supported immutable arguments."""
-    base = f"{fn.__module__}:{fn.__qualname__}"
-    signature = inspect.signature(fn)
-    parameter_names = tuple(signature.parameters)
-    normalized_args_input = args
-
-    if args and parameter_names:
-        first_param = parameter_names[0]
-        first_arg = args[0]
-
-        if first_param == "cls" and include_cls:
-            cls_identity = f"{first_arg.__module__}:{first_arg.__qualname__}"
-            normalized_args_input = (cls_identity, *args[1:])
-        elif first_param == "self" and include_self:
-            self_identity = f"{first_arg.__class__.__module__}:{first_arg.__class__.__qualname__}"
-            normalized_args_input = (self_identity, *args[1:])
-
-    try:
-        normalized_args = tuple(_normalize_key_part(arg) for arg in normalized_args_input)
-        normalized_kwargs = tuple((key, _normalize_key_part(value)) for key, value in sorted(kwargs.items()))
-    except TypeError as e:
-        raise TypeError(
-            f"Unsupported argument type for cached key in {base}; provide key_builder explicitly for complex parameters"
-        ) from e
-    raw = pickle.dumps((normalized_args, normalized_kwargs))
-    h = hashlib.sha256(raw).hexdigest()[:16]
-    return f"{base}:{h}"
+    """Build cache key from function identity and supported immutable arguments (uncompiled form)."""
+    return _compile_key_builder(fn, include_cls=include_cls, include_self=include_self)(fn, args, kwargs)
 
 
 def cached(
@@ -72,16 +130,24 @@ def cached(
     skip_cache_func: Optional[Callable[[T], bool]] = None,
     include_cls: bool = False,
     include_self: bool = False,
+    stale_ttl: Optional[float] = None,
+    xfetch_beta: Optional[float] = None,
+    tags: Union[str, Iterable[str], Callable[..., Iterable[str]], None] = None,
+    ttl_jitter: Optional[TTLJitter] = None,
+    offload: Union[bool, Executor] = False,
+    request_scope: bool = False,
 ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
     """
     Decorate an async or sync function to cache its return value with the configured cache.
-    The decorated callable is always async (await the result). Sync functions are called
-    inside the cache layer; avoid slow blocking sync work to not block the event loop.
+    The decorated callable is always async (await the result). By default sync functions
+    are called inline on the event loop; pass ``offload`` for slow or blocking sync work.
 
     Uses ``cache.get_cache(name)`` when ``name`` is set, otherwise ``cache.cache`` (default).
     Key is built from module, qualname, and supported immutable args/kwargs
     (or a custom key_builder).
     TTL comes from decorator, then from the cache instance default_ttl.
+    Hits, misses and timings are also recorded per function, labeled
+    ``module:qualname`` (see ``cache.stats_snapshot()``).
 
     **Exception handling:** If the wrapped function raises, the exception
     propagates and nothing is written to the cache.
@@ -106,34 +172,206 @@ def cached(
             (`self.__class__.__module__` + `self.__class__.__qualname__`) in the
             default cache key. This is suitable only when instances of the same
             class are functionally equivalent for the cached method.
+        stale_ttl: Enables stale-while-revalidate: after ``ttl`` the entry is served
+            stale for up to ``stale_ttl`` more seconds while one background task
+            refreshes it. See ``ZodiacCache.get_or_set``.
+        xfetch_beta: Enables probabilistic early recomputation (XFetch) with this
+            beta; 1.0 is a good default. See ``ZodiacCache.get_or_set``.
+        tags: Invalidation tags for this function's entries: a tag, an iterable of
+            tags, or a callable receiving the call's ``*args, **kwargs`` and
+            returning tags. ``cache.invalidate_tags(...)`` makes every entry
+            carrying one of the tags unreachable (see ``ZodiacCache.tagged_key``).
+        ttl_jitter: Spreads expiries of this function's entries: a fraction of the
+            TTL (``0.1`` = up to 10% longer) or a ``(min_seconds, max_seconds)``
+            range, stable per key. If None, uses the cache default from ``cache.setup``.
+        offload: Sync functions only. ``True`` runs the function in the event loop's
+            default executor, an ``Executor`` instance runs it there; ``False``
+            (default) calls it inline. Context variables (e.g. the request id) are
+            propagated to the worker thread. Ignored for async functions.
+        request_scope: When True, results are also memoized for the current request
+            (see ``memoize_request``): repeated calls with the same arguments in one
+            request skip the backend entirely. Requires ``RequestMemoMiddleware``
+            (installed by ``register_middleware``); without it this is a no-op.
+
+    Example:
+        ```python
+        @cached(ttl=300, tags=lambda user_id: ["users", f"user:{user_id}"])
+        async def get_user(user_id: int) -> User: ...
+
+        await cache.invalidate_tags(["user:42"])  # one user
+        await cache.invalidate_tags("users")  # every get_user entry
+        ```
     """
+    _check_ttl_jitter(ttl_jitter)
+    if not isinstance(offload, (bool, Executor)):
+        raise TypeError("offload must be a bool or a concurrent.futures.Executor")
 
     def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         if key_builder is None:
+            builder = _compile_key_builder(fn, include_cls=include_cls, include_self=include_self)
+        else:
+            builder = key_builder
+        skip = skip_cache_func if skip_cache_func is not None else _skip_none
+        static_tags = None if tags is None or callable(tags) else _tag_list(tags)
+        label = f"{fn.__module__}:{fn.__qualname__}"
+        is_async = inspect.iscoroutinefunction(fn)
+        executor = offload if isinstance(offload, Executor) else None
+
+        async def lookup(key: str, args: tuple, kwargs: dict) -> T:
+            backend = _default_cache_manager.get_cache(name) if name is not None else _default_cache_manager.cache
+            if tags is not None:
+                key = await backend.tagged_key(key, static_tags if static_tags is not None else tags(*args, **kwargs))
+
+            async def producer() -> T:
+                if is_async:
+                    return await fn(*args, **kwargs)
+                if offload is not False:
+                    return await _run_in_executor(executor, fn, *args, **kwargs)
+                return fn(*args, **kwargs)
 
-            def builder(inner_fn: Callable[..., Awaitable[Any]], args: tuple, kwargs: dict) -> str:
-                return _default_key_builder(
-                    inner_fn,
-                    args,
-                    kwargs,
-                    include_cls=include_cls,
-                    include_self=include_self,
+            with function_label_scope(label):
+                return await backend.get_or_set(
+                    key,
+                    producer,
+                    ttl=ttl,
+                    skip_cache_func=skip,
+                    stale_ttl=stale_ttl,
+                    xfetch_beta=xfetch_beta,
+                    ttl_jitter=ttl_jitter,
                 )
+
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = builder(fn, args, kwargs)
+            if request_scope:
+                memo = get_request_memo()
+                if memo is not None:
+                    return await _memoized(memo, (label, key), partial(lookup, key, args, kwargs))
+            return await lookup(key, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def cached_batch(
+    ttl: Optional[int] = None,
+    key_builder: Optional[Callable[[Callable[..., Any], Hashable, tuple, dict], str]] = None,
+    name: Optional[str] = None,
+    skip_cache_func: Optional[Callable[[Any], bool]] = None,
+    ttl_jitter: Optional[TTLJitter] = None,
+) -> Callable[[Callable[..., Awaitable[Mapping[K, T]]]], Callable[..., Awaitable[Dict[K, T]]]]:
+    """
+    Decorate an async function that takes a list of ids and returns a mapping of
+    id to value, caching each id as its own entry.
+
+    Every call costs one ``multi_get``; the function is then called once, with
+    only the ids that were missing, and the results are stored with one
+    ``multi_set`` (see ``ZodiacCache.get_or_set_many``).
+
+    The ids must be the first positional argument. Further arguments are part
+    of every per-id key. Ids missing from the returned mapping are not cached
+    and are left out of the result.
+
+    Args:
+        ttl: TTL in seconds for each per-id entry. If None, uses cache default_ttl.
+        key_builder: Optional (fn, item_id, args, kwargs) -> str, where ``args``
+            excludes the id list. Default supports the same argument types as
+            ``@cached``.
+        name: Name of the cache (from cache.setup(..., name=...)). If None, uses default.
+        skip_cache_func: Callable(value) -> bool; if True, that value is not stored.
+            Default is to skip when the value is None.
+        ttl_jitter: Spreads expiries of the per-id entries (see ``@cached``).
+
+    Example:
+        ```python
+        @cached_batch(ttl=60)
+        async def get_users(user_ids: list[int]) -> dict[int, User]:
+            return {u.id: u for u in await repo.find_by_ids(user_ids)}
+
+        users = await get_users([1, 2, 3])
+        ```
+    """
+    _check_ttl_jitter(ttl_jitter)
+
+    def decorator(fn: Callable[..., Awaitable[Mapping[K, T]]]) -> Callable[..., Awaitable[Dict[K, T]]]:
+        if key_builder is None:
+            compiled = _compile_key_builder(fn)
+
+            def builder(inner_fn: Callable[..., Any], item_id: Hashable, args: tuple, kwargs: dict) -> str:
+                return compiled(inner_fn, (item_id, *args), kwargs)
         else:
             builder = key_builder
         skip = skip_cache_func if skip_cache_func is not None else _skip_none
+        label = f"{fn.__module__}:{fn.__qualname__}"
 
         @wraps(fn)
-        async def wrapper(*args: Any, **kwargs: Any) -> T:
+        async def wrapper(ids: Iterable[K], *args: Any, **kwargs: Any) -> Dict[K, T]:
             backend = _default_cache_manager.get_cache(name) if name is not None else _default_cache_manager.cache
-            key = builder(fn, args, kwargs)
+            key_to_id = {builder(fn, item_id, args, kwargs): item_id for item_id in dict.fromkeys(ids)}
 
-            async def producer() -> T:
-                if inspect.iscoroutinefunction(fn):
+            async def producer(missing_keys: List[str]) -> Dict[str, T]:
+                produced = await fn([key_to_id[key] for key in missing_keys], *args, **kwargs)
+                return {key: produced[key_to_id[key]] for key in missing_keys if key_to_id[key] in produced}
+
+            with function_label_scope(label):
+                values = await backend.get_or_set_many(
+                    list(key_to_id), producer, ttl=ttl, skip_cache_func=skip, ttl_jitter=ttl_jitter
+                )
+            return {key_to_id[key]: value for key, value in values.items()}
+
+        return wrapper
+
+    return decorator
+
+
+def memoize_request(
+    key_builder: Optional[Callable[[Callable[..., Awaitable[T]], tuple, dict], str]] = None,
+    include_cls: bool = False,
+    include_self: bool = False,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Decorate an async or sync function to memoize its results for the duration of
+    the current request. Values are kept as-is in a dict held by a ContextVar:
+    no serialization, no backend, and they are dropped when the request ends.
+
+    Within one request the function runs at most once per key (concurrent calls
+    share the computation); exceptions propagate and are not memoized. Outside a
+    request scope (no ``RequestMemoMiddleware``) every call runs the function.
+    Use ``@cached(request_scope=True)`` to put the memo in front of a shared cache.
+
+    Args:
+        key_builder: Optional (fn, args, kwargs) -> str. Default is the same as ``@cached``.
+        include_cls: See ``@cached``.
+        include_self: See ``@cached``.
+
+    Example:
+        ```python
+        @memoize_request()
+        async def get_current_tenant(tenant_id: int) -> Tenant:
+            return await tenant_repo.get(tenant_id)
+        ```
+    """
+
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        if key_builder is None:
+            builder = _compile_key_builder(fn, include_cls=include_cls, include_self=include_self)
+        else:
+            builder = key_builder
+        label = f"{fn.__module__}:{fn.__qualname__}"
+        is_async = inspect.iscoroutinefunction(fn)
+
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            async def compute() -> T:
+                if is_async:
                     return await fn(*args, **kwargs)
                 return fn(*args, **kwargs)
 
-            return await backend.get_or_set(key, producer, ttl=ttl, skip_cache_func=skip)
+            memo = get_request_memo()
+            if memo is None:
+                return await compute()
+            return await _memoized(memo, (label, builder(fn, args, kwargs)), compute)
 
         return wrapper
 
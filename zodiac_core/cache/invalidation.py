@@ -0,0 +1,228 @@
+"""
+Cross-process invalidation for per-process cache layers.
+
+The L1 near-cache (and in-process backends such as ``SimpleMemoryCache`` or
+``ZodiacMemoryCache``) live in each worker, so a ``delete`` or
+``invalidate_tags`` in one worker leaves stale values in the others. Starting
+an invalidation bus makes every cache broadcast the keys and tags it
+invalidates; each other process drops them from its own layers.
+
+Example:
+
+    from zodiac_core.cache.invalidation import RedisPubSubTransport, UnixSocketTransport
+
+    await cache.start_invalidation_bus(RedisPubSubTransport("redis://redis:6379/0"))
+    # single host (e.g. uvicorn --workers 4), no broker needed:
+    await cache.start_invalidation_bus(UnixSocketTransport("/tmp/myapp-cache-bus"))
+
+Broadcasts are best-effort: a lost message leaves stale entries until they
+expire (``l1_ttl`` bounds how long).
+"""
+
+import asyncio
+import glob
+import json
+import os
+import socket
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Optional, Set
+
+from loguru import logger
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - depends on optional dependency
+    redis_asyncio = None
+
+if TYPE_CHECKING:
+    from zodiac_core.cache.manager import ZodiacCache
+
+MessageHandler = Callable[[bytes], Awaitable[None]]
+
+DEFAULT_CHANNEL = "zodiac:cache:invalidate"
+
+
+class InvalidationTransport(ABC):
+    """
+    Delivers opaque payloads to every other process. Subclasses implement the
+    three coroutines below (a subclass missing one cannot be instantiated);
+    delivering a process's own messages back to it is allowed (the bus ignores them).
+    """
+
+    @abstractmethod
+    async def start(self, on_message: MessageHandler) -> None:
+        """Begin receiving; ``on_message`` is awaited with each payload."""
+
+    @abstractmethod
+    async def publish(self, payload: bytes) -> None:
+        """Send ``payload`` to the other processes."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop receiving and release resources."""
+
+
+class RedisPubSubTransport(InvalidationTransport):
+    """
+    Redis pub/sub transport for multi-host deployments.
+
+    Args:
+        url: Redis URL, used when ``client`` is not given.
+        channel: Pub/sub channel shared by all processes of the application.
+        client: An existing ``redis.asyncio.Redis`` client (not closed by the transport).
+    """
+
+    def __init__(self, url: Optional[str] = None, *, channel: str = DEFAULT_CHANNEL, client: Any = None) -> None:
+        if client is None:
+            if redis_asyncio is None:
+                raise ImportError(
+                    "redis is required for RedisPubSubTransport. Please install it with: pip install redis"
+                )
+            if url is None:
+                raise ValueError("RedisPubSubTransport requires a url or a client")
+            client = redis_asyncio.Redis.from_url(url)
+            self._owns_client = True
+        else:
+            self._owns_client = False
+        self.channel = channel
+        self._client = client
+        self._pubsub: Any = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, on_message: MessageHandler) -> None:
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(on_message))
+
+    async def _listen(self, on_message: MessageHandler) -> None:
+        async for message in self._pubsub.listen():
+            if message.get("type") == "message":
+                await on_message(message["data"])
+
+    async def publish(self, payload: bytes) -> None:
+        await self._client.publish(self.channel, payload)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._owns_client:
+            await self._client.aclose()
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, on_message: MessageHandler) -> None:
+        self._on_message = on_message
+        self._tasks: Set[asyncio.Task] = set()
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        task = asyncio.ensure_future(self._on_message(data))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+class UnixSocketTransport(InvalidationTransport):
+    """
+    Single-host transport over Unix datagram sockets, one per process, in a
+    shared directory. Publishing sends one datagram to every other socket in
+    the directory; sockets of dead processes are removed on the way.
+
+    Args:
+        directory: Directory shared by all processes of the application (created if missing).
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.path: Optional[str] = None
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._sender: Optional[socket.socket] = None
+
+    async def start(self, on_message: MessageHandler) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock")
+        receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        receiver.bind(self.path)
+        self._transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: _DatagramProtocol(on_message), sock=receiver
+        )
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sender.setblocking(False)
+
+    async def publish(self, payload: bytes) -> None:
+        if self._sender is None:
+            raise RuntimeError("UnixSocketTransport is not started")
+        for path in glob.glob(os.path.join(glob.escape(self.directory), "*.sock")):
+            if path == self.path:
+                continue
+            try:
+                self._sender.sendto(payload, path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # No process behind this socket any more.
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            except BlockingIOError:
+                logger.warning(f"Cache invalidation dropped for {path}: receive buffer full")
+
+    async def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._sender is not None:
+            self._sender.close()
+            self._sender = None
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+
+
+class InvalidationBus:
+    """
+    Publishes invalidations of local caches and applies the ones received from
+    other processes. Created by ``cache.start_invalidation_bus(transport)``.
+
+    Args:
+        transport: Delivery mechanism (``RedisPubSubTransport``, ``UnixSocketTransport`` or custom).
+        resolve: Returns the local ``ZodiacCache`` for a cache name, or None when not configured here.
+    """
+
+    def __init__(self, transport: InvalidationTransport, resolve: Callable[[str], Optional["ZodiacCache"]]) -> None:
+        self.transport = transport
+        self.origin = uuid.uuid4().hex
+        self._resolve = resolve
+
+    async def start(self) -> None:
+        await self.transport.start(self._on_message)
+
+    async def close(self) -> None:
+        await self.transport.close()
+
+    async def publish(self, cache_name: str, keys: Iterable[str] = (), tags: Iterable[str] = ()) -> None:
+        """Broadcast invalidated ``keys`` / ``tags`` of ``cache_name``; failures are logged, not raised."""
+        payload = json.dumps({"origin": self.origin, "cache": cache_name, "keys": list(keys), "tags": list(tags)})
+        try:
+            await self.transport.publish(payload.encode())
+        except Exception as e:
+            logger.warning(f"Cache invalidation broadcast for '{cache_name}' failed: {e!r}")
+
+    async def _on_message(self, payload: bytes) -> None:
+        try:
+            message = json.loads(payload)
+            if message["origin"] == self.origin:
+                return
+            target = self._resolve(message["cache"])
+            if target is not None:
+                await target.apply_invalidation(message["keys"], message["tags"])
+        except Exception as e:
+            logger.warning(f"Ignoring cache invalidation message {payload[:200]!r}: {e!r}")
@@ -0,0 +1,73 @@
+"""
+In-process near-cache (L1) used in front of the configured aiocache backend.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+_MISSING = object()
+# Default lifetime of an L1 entry; bounds how long L1 may lag the shared backend.
+DEFAULT_L1_TTL = 5.0
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with a per-entry TTL.
+
+    Values are stored as-is (no serialization), so callers must treat cached
+    objects as immutable. Expired entries are dropped lazily on access; when
+    the cache is full the least recently used entry is evicted. Every entry
+    expires after at most ``ttl`` seconds.
+    """
+
+    def __init__(self, max_entries: int, ttl: float = DEFAULT_L1_TTL) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        if ttl is None or ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value or ``default`` when missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value. The effective TTL is the shorter of ``ttl`` and the
+        cache-wide TTL. Values read back from the backend are stored without
+        their remaining backend TTL, so L1 may serve them up to the cache-wide
+        TTL past their backend expiry.
+        """
+        effective = self.ttl if ttl is None or ttl <= 0 else min(self.ttl, ttl)
+        expires_at = time.monotonic() + effective
+
+        if key in self._data:
+            self._data.move_to_end(key)
+        self._data[key] = (value, expires_at)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        """Evict a key; returns True if it was present."""
+        return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
@@ -2,12 +2,20 @@
 Unified cache layer: config (setup) + prefix + @cached decorator.
 """
 
-from collections.abc import Awaitable, Callable
+import asyncio
+import hashlib
+import math
+import random
+import secrets
+import time
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Mapping
 from copy import deepcopy
-from typing import Any, Dict, Optional, TypeVar
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, TypeVar, Union
 
 try:
     from aiocache import caches as aiocaches
+    from aiocache.backends.memory import SimpleMemoryBackend
     from aiocache.base import BaseCache
     from aiocache.lock import RedLock
 except ImportError as e:
@@ -18,8 +26,23 @@ except ImportError as e:
 
 from loguru import logger
 
+from zodiac_core.cache.backends import ZodiacMemoryBackend
+from zodiac_core.cache.invalidation import InvalidationBus, InvalidationTransport
+from zodiac_core.cache.local import DEFAULT_L1_TTL, LocalCache
+from zodiac_core.cache.stats import CacheStats, get_function_label
+from zodiac_core.cache.warmup import WarmupLoader, WarmupReport, _make_loader, run_warmup
+
 ZODIAC_CACHE_NAMESPACE = "zodiac_cache"
 DEFAULT_CACHE_NAME = "default"
+_TAG_KEY_PREFIX = "__tag__:"
+# Max seconds a tag generation stays in L1, so invalidations from other processes
+# show up quickly even when l1_ttl is long.
+_TAG_L1_TTL = 1.0
+DEFAULT_CHUNK_SIZE = 512 * 1024
+# Parts per multi_get / multi_set round trip of a chunked value.
+_BLOB_BATCH = 8
+# Parts outlive their manifest slightly, so a live manifest never points at expired parts.
+_BLOB_TTL_GRACE = 60
 
 
 class _CachedNoneSentinel:
@@ -29,13 +52,166 @@ class _CachedNoneSentinel:
 
 
 _CACHED_NONE = _CachedNoneSentinel()
+# Fallback of backend writes that failed open, telling them apart from a write returning False.
+_WRITE_FAILED = object()
+
+
+class _CacheEntry(NamedTuple):
+    """
+    Internal envelope storing a value with its soft expiry (wall-clock epoch
+    seconds) and the time the producer took to compute it (seconds).
+    """
+
+    value: Any
+    fresh_until: float
+    delta: float = 0.0
+
+
+def _xfetch_due(entry: _CacheEntry, beta: float, now: float) -> bool:
+    """
+    XFetch (Vattani et al.): recompute early when ``now - delta * beta * ln(U)``
+    reaches the expiry, ``U`` uniform in (0, 1]. The probability grows as expiry
+    approaches and with the cost of recomputation.
+    """
+    return now - entry.delta * beta * math.log(1.0 - random.random()) >= entry.fresh_until
+
+
+def _decode(value: Any) -> Any:
+    """Turn the cached-None sentinel back into None."""
+    return None if isinstance(value, _CachedNoneSentinel) else value
+
+
+def _check_resilience(op_timeout: Optional[float], breaker_threshold: int, breaker_cooldown: float) -> None:
+    """Validate timeout and circuit-breaker options."""
+    if op_timeout is not None and op_timeout <= 0:
+        raise ValueError("op_timeout must be positive when provided")
+    if breaker_threshold < 1:
+        raise ValueError("breaker_threshold must be at least 1")
+    if breaker_cooldown <= 0:
+        raise ValueError("breaker_cooldown must be positive")
+
+
+def _tag_list(tags: Union[str, Iterable[str]]) -> List[str]:
+    """Normalize tags to a de-duplicated list; a bare string is a single tag."""
+    return [tags] if isinstance(tags, str) else list(dict.fromkeys(tags))
+
+
+def _load_tag_version(value: Any) -> int:
+    """Tag counters are written by ``increment`` and bypass the serializer (int, or bytes/str on Redis)."""
+    return 0 if value is None else int(value)
+
+
+def _check_ttl_jitter(ttl_jitter: Optional["TTLJitter"]) -> None:
+    """Validate a jitter policy: a fraction in [0, 1] or a ``(min_seconds, max_seconds)`` range."""
+    if ttl_jitter is None:
+        return
+    if isinstance(ttl_jitter, (int, float)) and not isinstance(ttl_jitter, bool):
+        if not 0 <= ttl_jitter <= 1:
+            raise ValueError("ttl_jitter as a fraction must be between 0 and 1")
+        return
+    if isinstance(ttl_jitter, (tuple, list)) and len(ttl_jitter) == 2 and 0 <= ttl_jitter[0] <= ttl_jitter[1]:
+        return
+    raise ValueError("ttl_jitter must be a fraction between 0 and 1 or a (min_seconds, max_seconds) range")
+
+
+def _jittered_ttl(key: str, ttl: Optional[float], ttl_jitter: Optional["TTLJitter"]) -> Optional[float]:
+    """
+    Extend ``ttl`` by a whole number of seconds derived from a hash of ``key``:
+    up to ``ttl * fraction``, or between ``min_seconds`` and ``max_seconds``.
+    The same key always gets the same TTL, different keys spread evenly.
+    """
+    if not ttl or not ttl_jitter:
+        return ttl
+    if isinstance(ttl_jitter, (tuple, list)):
+        low, high = ttl_jitter
+    else:
+        low, high = 0.0, ttl * ttl_jitter
+    position = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big") / 2**64
+    return ttl + round(low + (high - low) * position)
+
 
 T = TypeVar("T")
+TTLJitter = Union[float, Tuple[float, float]]
+
+
+class _BlobManifest(NamedTuple):
+    """Stored under the key of a chunked value; parts live at ``{key}:blob:{token}:{index}``."""
+
+    token: str
+    parts: int
+    size: int
+
+
+def _blob_part_keys(key: str, manifest: _BlobManifest) -> List[str]:
+    return [f"{key}:blob:{manifest.token}:{index}" for index in range(manifest.parts)]
+
+
+def _batched(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+class IncompleteBlobError(LookupError):
+    """A part of a chunked value expired or was evicted while it was being streamed."""
+
+
+class CacheUnavailableError(RuntimeError):
+    """Raised when the circuit breaker is open and an operation cannot fail open (e.g. invalidation)."""
+
+
+class _CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker. After ``threshold`` failures in a row the
+    circuit opens for ``cooldown`` seconds; afterwards calls are let through again
+    and the first failure re-opens it, the first success closes it.
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True when this failure opens the circuit."""
+        self._failures += 1
+        if self._failures >= self.threshold and not self.is_open:
+            self._open_until = time.monotonic() + self.cooldown
+            return True
+        return False
 
 
 class ZodiacCache:
     """
-    Thin wrapper over aiocache BaseCache with stampede protection.
+    Thin wrapper over aiocache BaseCache with stampede protection: concurrent
+    misses are coalesced per process (single-flight) and across processes by RedLock.
+
+    When ``l1`` is provided, it acts as an in-process near-cache in front of
+    the backend: reads are served from memory when possible, backend hits
+    populate it, and ``set`` / ``delete`` write through to both tiers.
+
+    ``ttl_jitter`` is the default expiry-spreading policy for writes (see ``set``).
+
+    ``op_timeout`` bounds every backend operation. With ``fail_open``, a slow or
+    failing backend is treated as a miss: reads return None, writes return False
+    (and evict the key from L1 instead of storing it there), ``get_or_set`` calls
+    the producer directly, and after ``breaker_threshold`` consecutive failures
+    the backend is skipped for ``breaker_cooldown`` seconds.
+    Only ``invalidate_tags`` still raises, since losing an invalidation is unsafe.
+
+    When an invalidation bus is running (``cache.start_invalidation_bus``),
+    ``delete`` and ``invalidate_tags`` are broadcast to the other processes,
+    which drop the keys and tags from their own in-process layers.
+
+    Hits, misses, lock waits, latencies and stored sizes are recorded in
+    ``stats`` and, for calls made by ``@cached`` functions, per function
+    (see ``stats_snapshot``).
     """
 
     def __init__(
@@ -43,38 +219,508 @@ class ZodiacCache:
         backend: BaseCache,
         *,
         default_ttl: Optional[int] = None,
+        l1: Optional[LocalCache] = None,
+        name: Optional[str] = None,
+        ttl_jitter: Optional[TTLJitter] = None,
+        op_timeout: Optional[float] = None,
+        fail_open: bool = False,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 10.0,
     ) -> None:
+        _check_ttl_jitter(ttl_jitter)
+        _check_resilience(op_timeout, breaker_threshold, breaker_cooldown)
         self._backend = backend
+        self._op_timeout = op_timeout
+        self._fail_open = fail_open
+        self._breaker = _CircuitBreaker(breaker_threshold, breaker_cooldown) if fail_open else None
         self._default_ttl = default_ttl
+        self._ttl_jitter = ttl_jitter
+        self._l1 = l1
+        self._name = name
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats = CacheStats()
+        self._function_stats: Dict[str, CacheStats] = {}
+        self._bus: Optional[InvalidationBus] = None
 
     @property
     def backend(self) -> BaseCache:
         """The underlying aiocache backend instance."""
         return self._backend
 
+    @property
+    def l1(self) -> Optional[LocalCache]:
+        """The in-process near-cache, or None when the cache is single-tier."""
+        return self._l1
+
+    @property
+    def name(self) -> Optional[str]:
+        """The name this cache was configured under, when created by ``CacheManager``."""
+        return self._name
+
+    @property
+    def stats(self) -> CacheStats:
+        """Aggregate statistics of this cache."""
+        return self._stats
+
+    def stats_snapshot(self) -> Dict[str, Any]:
+        """
+        Return ``{"cache": {...}, "functions": {"module:qualname": {...}}}`` with
+        the aggregate and per-function statistics as plain data.
+        """
+        return {
+            "cache": self._stats.snapshot(),
+            "functions": {label: stats.snapshot() for label, stats in self._function_stats.items()},
+        }
+
+    def reset_stats(self) -> None:
+        """Zero the aggregate and per-function statistics."""
+        self._stats.reset()
+        self._function_stats.clear()
+
+    def _observers(self) -> Tuple[CacheStats, ...]:
+        """Stats objects to update: the aggregate, plus the calling ``@cached`` function's if any."""
+        label = get_function_label()
+        if label is None:
+            return (self._stats,)
+        function_stats = self._function_stats.get(label)
+        if function_stats is None:
+            function_stats = self._function_stats[label] = CacheStats()
+        return (self._stats, function_stats)
+
+    def _record_lookup(self, value: Any, started: float, stale_ok: bool) -> None:
+        """
+        Record the lookup latency and count a hit or a miss. An expired envelope
+        is a stale hit when ``stale_ok`` and a miss otherwise.
+        """
+        elapsed = time.perf_counter() - started
+        stale = False
+        if isinstance(value, _CacheEntry):
+            stale = value.fresh_until <= time.time()
+            if stale and not stale_ok:
+                value = None
+            else:
+                value = value.value
+        for stats in self._observers():
+            stats.lookup.observe(elapsed)
+            if value is None:
+                stats.misses += 1
+                continue
+            stats.hits += 1
+            if stale:
+                stats.stale_hits += 1
+            if isinstance(value, _CachedNoneSentinel):
+                stats.none_hits += 1
+
+    async def _call_backend(self, method: Callable[..., Awaitable[Any]], *args: Any, grace: float = 0.0, **kwargs: Any):
+        """
+        Run a backend operation within ``op_timeout`` (plus ``grace`` seconds) and
+        feed the circuit breaker. Raises ``CacheUnavailableError`` while it is open.
+        """
+        if self._breaker is not None and self._breaker.is_open:
+            raise CacheUnavailableError(f"Cache '{self._name}' backend is unavailable (circuit open)")
+        try:
+            if self._op_timeout is None:
+                result = await method(*args, **kwargs)
+            else:
+                async with asyncio.timeout(self._op_timeout + grace):
+                    result = await method(*args, **kwargs)
+        except Exception:
+            if self._breaker is not None and self._breaker.record_failure():
+                logger.warning(
+                    f"Cache '{self._name}' backend failed {self._breaker.threshold} times in a row, "
+                    f"bypassing it for {self._breaker.cooldown}s"
+                )
+            raise
+        if self._breaker is not None:
+            self._breaker.record_success()
+        return result
+
+    async def _backend_op(self, fallback: Any, method: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any):
+        """``_call_backend``, returning ``fallback`` instead of raising when failing open."""
+        try:
+            return await self._call_backend(method, *args, **kwargs)
+        except Exception as e:
+            if not self._fail_open:
+                raise
+            self._record_backend_error(method, e)
+            return fallback
+
+    def _record_backend_error(self, method: Callable[..., Any], error: Exception) -> None:
+        for stats in self._observers():
+            stats.backend_errors += 1
+        if not isinstance(error, CacheUnavailableError):
+            logger.debug(f"Cache '{self._name}' {getattr(method, '__name__', method)} failed open: {error!r}")
+
+    def _dumps(self, value: Any) -> Any:
+        """Serialize with the backend serializer, recording the payload size."""
+        payload = self._backend.serializer.dumps(value)
+        if isinstance(payload, (bytes, str)):
+            for stats in self._observers():
+                stats.value_size.observe(len(payload))
+        return payload
+
     async def _get_raw(self, key: str) -> Any:
-        """Retrieve the raw backend value, including internal sentinels."""
-        return await self._backend.get(key)
+        """Retrieve the raw value (L1 first, then backend), including internal sentinels."""
+        if self._l1 is not None:
+            value = self._l1.get(key)
+            # Stale envelopes defer to the backend, which may already hold a refreshed value.
+            if value is not None and not (isinstance(value, _CacheEntry) and value.fresh_until <= time.time()):
+                return value
+        value = await self._backend_op(None, self._backend.get, key)
+        if value is not None and self._l1 is not None:
+            self._l1.set(key, value)
+        return value
 
     async def get(self, key: str) -> Any:
-        """Retrieve a value from the cache."""
+        """Retrieve a value from the cache (stale-while-revalidate entries are returned as-is)."""
+        started = time.perf_counter()
         value = await self._get_raw(key)
-        if isinstance(value, _CachedNoneSentinel):
-            return None
-        return value
+        self._record_lookup(value, started, stale_ok=True)
+        if isinstance(value, _CacheEntry):
+            value = value.value
+        return _decode(value)
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Store a value in the cache with an optional TTL."""
+    def _resolve_ttl(self, key: str, ttl: Optional[float], ttl_jitter: Optional[TTLJitter]) -> Optional[float]:
+        """Apply the default TTL, then the jitter policy (the call's, else the cache default)."""
         ttl = ttl if ttl is not None else self._default_ttl
-        return await self._backend.set(key, value, ttl=ttl)
+        return _jittered_ttl(key, ttl, ttl_jitter if ttl_jitter is not None else self._ttl_jitter)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        ttl_jitter: Optional[TTLJitter] = None,
+    ) -> bool:
+        """
+        Store a value in the cache with an optional TTL.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: TTL in seconds. If None, uses the cache default_ttl.
+            ttl_jitter: Spreads expiries of entries written with the same TTL: a
+                fraction (``0.1`` extends the TTL by up to 10%) or a
+                ``(min_seconds, max_seconds)`` range added to it. The extension is
+                derived from the key, so it is stable across writes and processes.
+                If None, uses the cache default; pass ``0`` to disable.
+        """
+        _check_ttl_jitter(ttl_jitter)
+        return await self._store(key, value, self._resolve_ttl(key, ttl, ttl_jitter))
+
+    async def _store(self, key: str, value: Any, ttl: Optional[float]) -> bool:
+        """
+        Write ``value`` to the backend (and L1) with an already resolved TTL. When
+        the backend write fails open, L1 drops the key rather than holding a value
+        the backend never stored.
+        """
+        result = await self._backend_op(_WRITE_FAILED, self._backend.set, key, value, ttl=ttl, dumps_fn=self._dumps)
+        if self._l1 is not None:
+            if result is _WRITE_FAILED:
+                self._l1.delete(key)
+            else:
+                self._l1.set(key, value, ttl=ttl)
+        return result is not _WRITE_FAILED and result
+
+    async def _get_many_raw(self, keys: List[str]) -> List[Any]:
+        """Batch variant of ``_get_raw``: L1 first, then a single backend ``multi_get`` for the rest."""
+        values: List[Any] = [None] * len(keys)
+        pending: List[int] = []
+        now = time.time()
+        for index, key in enumerate(keys):
+            value = self._l1.get(key) if self._l1 is not None else None
+            if value is None or (isinstance(value, _CacheEntry) and value.fresh_until <= now):
+                pending.append(index)
+            else:
+                values[index] = value
+        if pending:
+            fetched = await self._backend_op(
+                [None] * len(pending), self._backend.multi_get, [keys[index] for index in pending]
+            )
+            for index, value in zip(pending, fetched, strict=True):
+                values[index] = value
+                if value is not None and self._l1 is not None:
+                    self._l1.set(keys[index], value)
+        return values
+
+    async def get_many(self, keys: Iterable[str]) -> List[Any]:
+        """Retrieve several values in one backend round trip; misses are None, in ``keys`` order."""
+        values = await self._get_many_raw(list(keys))
+        return [_decode(value.value if isinstance(value, _CacheEntry) else value) for value in values]
+
+    async def set_many(
+        self,
+        items: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]],
+        ttl: Optional[int] = None,
+        ttl_jitter: Optional[TTLJitter] = None,
+    ) -> bool:
+        """
+        Store several values with one backend ``multi_set`` and a shared optional TTL.
+
+        With a jitter policy (see ``set``), keys are grouped by their jittered
+        TTL, costing one ``multi_set`` per distinct TTL (whole seconds).
+        """
+        _check_ttl_jitter(ttl_jitter)
+        pairs = list(items.items()) if isinstance(items, Mapping) else list(items)
+        if not pairs:
+            return True
+        groups: Dict[Optional[float], List[Tuple[str, Any]]] = {}
+        for key, value in pairs:
+            groups.setdefault(self._resolve_ttl(key, ttl, ttl_jitter), []).append((key, value))
+        results = await asyncio.gather(*(self._store_many(group, group_ttl) for group_ttl, group in groups.items()))
+        return all(results)
+
+    async def _store_many(self, pairs: List[Tuple[str, Any]], ttl: Optional[float]) -> bool:
+        """Write several values with one ``multi_set`` and an already resolved TTL (see ``_store``)."""
+        result = await self._backend_op(_WRITE_FAILED, self._backend.multi_set, pairs, ttl=ttl, dumps_fn=self._dumps)
+        if self._l1 is not None:
+            for key, value in pairs:
+                if result is _WRITE_FAILED:
+                    self._l1.delete(key)
+                else:
+                    self._l1.set(key, value, ttl=ttl)
+        return result is not _WRITE_FAILED and result
 
     async def delete(self, key: str) -> bool:
-        """Remove a value from the cache."""
-        return await self._backend.delete(key)
+        """Remove a value from the cache (both tiers when L1 is enabled)."""
+        if self._l1 is not None:
+            self._l1.delete(key)
+        result = await self._backend_op(False, self._backend.delete, key)
+        if self._bus is not None:
+            await self._bus.publish(self._name, keys=[key])
+        return result
 
     async def exists(self, key: str) -> bool:
         """Check if a key exists in the cache."""
-        return await self._backend.exists(key)
+        if self._l1 is not None and key in self._l1:
+            return True
+        return await self._backend_op(False, self._backend.exists, key)
+
+    async def set_blob(
+        self,
+        key: str,
+        data: Union[bytes, bytearray, memoryview, str, AsyncIterable[bytes]],
+        ttl: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ttl_jitter: Optional[TTLJitter] = None,
+    ) -> bool:
+        """
+        Store a large payload as ``chunk_size`` parts plus a small manifest under ``key``.
+
+        ``data`` is bytes (``str`` is UTF-8 encoded) or an async iterable of bytes,
+        e.g. a payload rendered incrementally, which is written part by part without
+        being held in memory. Parts bypass L1 and are written ``_BLOB_BATCH`` per
+        ``multi_set``. The manifest is written last, so readers never see a partial
+        value; parts of the value it replaces are deleted afterwards.
+
+        Read it back with ``get_blob`` or ``stream_blob``; ``delete_blob`` removes it.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        ttl = self._resolve_ttl(key, ttl, ttl_jitter)
+        part_ttl = ttl + _BLOB_TTL_GRACE if ttl else ttl
+        token = secrets.token_hex(8)
+        previous = await self._backend_op(None, self._backend.get, key)
+
+        parts = size = 0
+        stored = True
+
+        async def write(batch: List[bytes], first: int) -> bool:
+            pairs = [(f"{key}:blob:{token}:{first + offset}", part) for offset, part in enumerate(batch)]
+            return await self._backend_op(False, self._backend.multi_set, pairs, ttl=part_ttl, dumps_fn=self._dumps)
+
+        if isinstance(data, (bytes, bytearray, memoryview, str)):
+            view = memoryview(data.encode() if isinstance(data, str) else data).cast("B")
+            chunks = [bytes(view[start : start + chunk_size]) for start in range(0, len(view), chunk_size)]
+            parts, size = len(chunks), len(view)
+            batches = _batched(chunks, _BLOB_BATCH)
+            results = await asyncio.gather(*(write(batch, i * _BLOB_BATCH) for i, batch in enumerate(batches)))
+            stored = all(results)
+        else:
+            buffer, batch = bytearray(), []
+            async for piece in data:
+                buffer += piece
+                size += len(piece)
+                while len(buffer) >= chunk_size:
+                    batch.append(bytes(buffer[:chunk_size]))
+                    del buffer[:chunk_size]
+                    if len(batch) == _BLOB_BATCH:
+                        stored = await write(batch, parts) and stored
+                        parts += len(batch)
+                        batch = []
+            if buffer:
+                batch.append(bytes(buffer))
+            if batch:
+                stored = await write(batch, parts) and stored
+                parts += len(batch)
+
+        if not stored:
+            return False
+        stored = await self._backend_op(
+            False, self._backend.set, key, _BlobManifest(token, parts, size), ttl=ttl, dumps_fn=self._dumps
+        )
+        if self._l1 is not None:
+            self._l1.delete(key)
+        if isinstance(previous, _BlobManifest):
+            await self._delete_blob_parts(key, previous)
+        return stored
+
+    async def _blob_manifest(self, key: str) -> Optional[_BlobManifest]:
+        started = time.perf_counter()
+        manifest = await self._backend_op(None, self._backend.get, key)
+        if not isinstance(manifest, _BlobManifest):
+            manifest = None
+        self._record_lookup(manifest, started, stale_ok=False)
+        return manifest
+
+    async def _get_blob_parts(self, part_keys: List[str]) -> List[bytes]:
+        parts = await self._backend_op([None] * len(part_keys), self._backend.multi_get, part_keys)
+        if any(part is None for part in parts):
+            raise IncompleteBlobError(f"Chunked cache value is missing parts ({part_keys[0]}...)")
+        return parts
+
+    async def get_blob(self, key: str) -> Optional[bytes]:
+        """
+        Return a value stored by ``set_blob``, fetching all parts concurrently, or
+        None when it is missing or incomplete.
+        """
+        manifest = await self._blob_manifest(key)
+        if manifest is None:
+            return None
+        batches = _batched(_blob_part_keys(key, manifest), _BLOB_BATCH)
+        try:
+            fetched = await asyncio.gather(*(self._get_blob_parts(batch) for batch in batches))
+        except IncompleteBlobError:
+            return None
+        return b"".join(part for batch in fetched for part in batch)
+
+    async def stream_blob(self, key: str, prefetch: int = 2) -> Optional[AsyncIterator[bytes]]:
+        """
+        Return an async iterator over the parts of a value stored by ``set_blob``,
+        or None when it is missing. Up to ``prefetch`` batches of parts are fetched
+        ahead of the consumer, so the full value is never held in memory::
+
+            chunks = await cache.cache.stream_blob("report:42")
+            if chunks is not None:
+                return StreamingResponse(chunks, media_type="application/json")
+
+        Raises ``IncompleteBlobError`` while iterating if a part has expired or
+        been evicted since the manifest was read.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        manifest = await self._blob_manifest(key)
+        if manifest is None:
+            return None
+        batches = _batched(_blob_part_keys(key, manifest), _BLOB_BATCH)
+
+        async def iterate() -> AsyncIterator[bytes]:
+            pending: deque = deque()
+            upcoming = iter(batches)
+            try:
+                for batch in upcoming:
+                    pending.append(asyncio.ensure_future(self._get_blob_parts(batch)))
+                    if len(pending) < prefetch:
+                        continue
+                    for part in await pending.popleft():
+                        yield part
+                while pending:
+                    for part in await pending.popleft():
+                        yield part
+            finally:
+                # Consumer stopped early (or a part was missing): drop the prefetched batches.
+                for task in pending:
+                    if task.done() and not task.cancelled():
+                        task.exception()  # retrieved, so asyncio does not log it
+                    task.cancel()
+
+        return iterate()
+
+    async def delete_blob(self, key: str) -> bool:
+        """Remove a value stored by ``set_blob``: the manifest and every part."""
+        manifest = await self._backend_op(None, self._backend.get, key)
+        result = await self.delete(key)
+        if isinstance(manifest, _BlobManifest):
+            await self._delete_blob_parts(key, manifest)
+        return result
+
+    async def _delete_blob_parts(self, key: str, manifest: _BlobManifest) -> None:
+        await asyncio.gather(
+            *(self._backend_op(False, self._backend.delete, part_key) for part_key in _blob_part_keys(key, manifest))
+        )
+
+    async def tag_versions(self, tags: Union[str, Iterable[str]]) -> Dict[str, int]:
+        """
+        Return the current generation of each tag (0 for tags never invalidated)
+        with at most one backend round trip. With L1 enabled, versions are cached
+        locally for at most one second (or ``l1_ttl`` if shorter), which bounds
+        how long other processes take to observe an invalidation. When failing
+        open, unreadable tags get version -1 (not cached), which no stored
+        generation matches.
+        """
+        versions: Dict[str, int] = {}
+        pending: List[str] = []
+        for tag in _tag_list(tags):
+            version = self._l1.get(_TAG_KEY_PREFIX + tag) if self._l1 is not None else None
+            if version is None:
+                pending.append(tag)
+            else:
+                versions[tag] = version
+        if pending:
+            fetched = await self._backend_op(
+                None, self._backend.multi_get, [_TAG_KEY_PREFIX + tag for tag in pending], loads_fn=_load_tag_version
+            )
+            if fetched is None:
+                return {**versions, **dict.fromkeys(pending, -1)}
+            for tag, version in zip(pending, fetched, strict=True):
+                versions[tag] = version
+                if self._l1 is not None:
+                    self._l1.set(_TAG_KEY_PREFIX + tag, version, ttl=_TAG_L1_TTL)
+        return versions
+
+    async def tagged_key(self, key: str, tags: Union[str, Iterable[str]]) -> str:
+        """
+        Fold the current generation of ``tags`` into ``key``. Entries stored under
+        a tagged key become unreachable once any of its tags is invalidated and
+        expire with their TTL.
+        """
+        ordered = sorted(_tag_list(tags))
+        if not ordered:
+            return key
+        versions = await self.tag_versions(ordered)
+        return f"{key}:tags:" + ",".join(f"{tag}={versions[tag]}" for tag in ordered)
+
+    async def invalidate_tags(self, tags: Union[str, Iterable[str]]) -> None:
+        """
+        Invalidate every entry stored under a key tagged with any of ``tags`` by
+        bumping each tag's generation counter: O(1) per tag regardless of how
+        many entries carry it, with no key scans.
+        """
+        ordered = _tag_list(tags)
+        await asyncio.gather(*(self._call_backend(self._backend.increment, _TAG_KEY_PREFIX + tag) for tag in ordered))
+        if self._l1 is not None:
+            for tag in ordered:
+                self._l1.delete(_TAG_KEY_PREFIX + tag)
+        if self._bus is not None:
+            await self._bus.publish(self._name, tags=ordered)
+
+    async def apply_invalidation(self, keys: Iterable[str] = (), tags: Iterable[str] = ()) -> None:
+        """
+        Drop ``keys`` and ``tags`` invalidated by another process from this
+        process's layers: the L1 and, when the backend itself lives in this
+        process (``SimpleMemoryCache`` / ``ZodiacMemoryCache``), the backend.
+        Shared backends (e.g. Redis) are left alone.
+        """
+        keys, tag_keys = list(keys), [_TAG_KEY_PREFIX + tag for tag in tags]
+        if self._l1 is not None:
+            for key in (*keys, *tag_keys):
+                self._l1.delete(key)
+        if isinstance(self._backend, (SimpleMemoryBackend, ZodiacMemoryBackend)):
+            for key in keys:
+                await self._backend.delete(key)
+            for tag_key in tag_keys:
+                await self._backend.increment(tag_key)
 
     async def get_or_set(
         self,
@@ -83,41 +729,258 @@ class ZodiacCache:
         ttl: Optional[int] = None,
         lease: Optional[float] = 2.0,
         skip_cache_func: Optional[Callable[[T], bool]] = None,
+        stale_ttl: Optional[float] = None,
+        xfetch_beta: Optional[float] = None,
+        ttl_jitter: Optional[TTLJitter] = None,
     ) -> T:
         """
         Get from cache, or call producer and set on miss with RedLock protection.
 
+        With ``stale_ttl``, entries are kept for ``ttl + stale_ttl`` seconds but are
+        only fresh for ``ttl``. A stale hit is returned immediately while a single
+        background task (per process and key) refreshes the entry under RedLock.
+
+        With ``xfetch_beta``, the producer's duration is stored next to the value and
+        a fresh hit triggers an early recomputation with a probability that grows as
+        expiry approaches (XFetch), so popular keys are usually refreshed by a single
+        caller before they expire instead of by every worker racing for the lock.
+        The early recomputation runs in the background when ``stale_ttl`` is also set;
+        otherwise a failing one is logged and the cached value is returned.
+
         Args:
             key: Cache key.
             producer: Async callable to compute the value.
-            ttl: TTL in seconds.
+            ttl: TTL in seconds (soft TTL when ``stale_ttl`` is set).
             lease: Lock lease in seconds for stampede protection.
             skip_cache_func: If it returns True, the produced value is not stored.
+            stale_ttl: Extra seconds a value may be served stale while it is refreshed.
+            xfetch_beta: XFetch aggressiveness; 1.0 is the usual choice, larger values
+                recompute earlier. Disabled when None.
+            ttl_jitter: Expiry-spreading policy applied to ``ttl`` (see ``set``).
         """
+        _check_ttl_jitter(ttl_jitter)
+        ttl = self._resolve_ttl(key, ttl, ttl_jitter)
+        started = time.perf_counter()
         value = await self._get_raw(key)
-        if isinstance(value, _CachedNoneSentinel):
-            return None
-        if value is not None:
-            return value
+        self._record_lookup(value, started, stale_ok=bool(stale_ttl))
+        if isinstance(value, _CacheEntry):
+            now = time.time()
+            if value.fresh_until > now:
+                if not xfetch_beta or not _xfetch_due(value, xfetch_beta, now):
+                    return _decode(value.value)
+                if stale_ttl:
+                    self._schedule_refresh(
+                        key, producer, ttl, lease, skip_cache_func, stale_ttl, xfetch_beta, value.fresh_until
+                    )
+                    return _decode(value.value)
+                # Early recomputation: this caller alone refreshes, without taking the lock.
+                # A failed refresh still serves the fresh value that was just read.
+                try:
+                    return await self._produce(key, producer, ttl, skip_cache_func, stale_ttl, xfetch_beta)
+                except Exception as e:
+                    logger.warning(f"Early recomputation of cache key '{key}' failed: {e!r}")
+                    return _decode(value.value)
+            if stale_ttl:
+                self._schedule_refresh(key, producer, ttl, lease, skip_cache_func, stale_ttl, xfetch_beta)
+                return _decode(value.value)
+        elif value is not None:
+            return _decode(value)
+
+        # Single-flight: only one coroutine per process and key takes part in the RedLock,
+        # concurrent misses await its result instead of polling the backend lock.
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self._count_lock_wait()
+        else:
+            flight = asyncio.ensure_future(
+                self._produce_locked(key, producer, ttl, lease, skip_cache_func, stale_ttl, xfetch_beta)
+            )
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda t: self._finish_flight(key, t))
+        return await asyncio.shield(flight)
 
+    def _count_lock_wait(self) -> None:
+        for stats in self._observers():
+            stats.lock_waits += 1
+
+    def _finish_flight(self, key: str, flight: asyncio.Future) -> None:
+        """Forget a finished in-flight computation and mark its exception as retrieved."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if not flight.cancelled():
+            flight.exception()
+
+    async def _produce_locked(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[T]],
+        ttl: Optional[int],
+        lease: Optional[float],
+        skip_cache_func: Optional[Callable[[T], bool]],
+        stale_ttl: Optional[float],
+        xfetch_beta: Optional[float] = None,
+        refresh_until: Optional[float] = None,
+    ) -> T:
+        """
+        Recheck under RedLock, then run the producer and store its result.
+
+        ``refresh_until`` is the soft expiry of a still-fresh entry picked for an
+        XFetch early refresh: it is recomputed unless another worker replaced it.
+        """
         lease_sec = lease if lease is not None and lease > 0 else 2.0
-        async with RedLock(self._backend, key, lease=lease_sec):
+        lock = RedLock(self._backend, key, lease=lease_sec)
+        started = time.perf_counter()
+        # Waiting for another holder may legitimately take up to the lease.
+        if not await self._backend_op(False, self._acquire, lock, grace=lease_sec):
+            # Failing open: compute without the lock rather than stall on a dead backend.
+            return await self._produce(key, producer, ttl, skip_cache_func, stale_ttl, xfetch_beta)
+        try:
+            waited = time.perf_counter() - started
+            for stats in self._observers():
+                stats.lock_wait.observe(waited)
             value = await self._get_raw(key)
-            if isinstance(value, _CachedNoneSentinel):
-                return None
-            if value is not None:
-                return value
+            if isinstance(value, _CacheEntry):
+                if value.fresh_until > time.time() and value.fresh_until != refresh_until:
+                    self._count_lock_wait()
+                    return _decode(value.value)
+            elif value is not None:
+                self._count_lock_wait()
+                return _decode(value)
+
+            return await self._produce(key, producer, ttl, skip_cache_func, stale_ttl, xfetch_beta)
+        finally:
+            await self._backend_op(None, lock.__aexit__, None, None, None)
 
-            fresh = await producer()
-            if skip_cache_func is not None and skip_cache_func(fresh):
-                return fresh
+    @staticmethod
+    async def _acquire(lock: RedLock) -> bool:
+        await lock.__aenter__()
+        return True
 
-            to_store = _CACHED_NONE if fresh is None else fresh
-            await self.set(key, to_store, ttl=ttl)
+    async def _produce(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[T]],
+        ttl: Optional[int],
+        skip_cache_func: Optional[Callable[[T], bool]],
+        stale_ttl: Optional[float],
+        xfetch_beta: Optional[float],
+    ) -> T:
+        """Run the producer and store its result, wrapped in an envelope when needed."""
+        started = time.perf_counter()
+        fresh = await producer()
+        elapsed = time.perf_counter() - started
+        for stats in self._observers():
+            stats.producer.observe(elapsed)
+        if skip_cache_func is not None and skip_cache_func(fresh):
             return fresh
 
+        to_store = _CACHED_NONE if fresh is None else fresh
+        ttl = ttl if ttl is not None else self._default_ttl
+        if ttl and (stale_ttl or xfetch_beta):
+            entry = _CacheEntry(to_store, time.time() + ttl, elapsed)
+            await self._store(key, entry, ttl + (stale_ttl or 0))
+        else:
+            await self._store(key, to_store, ttl)
+        return fresh
+
+    async def get_or_set_many(
+        self,
+        keys: Iterable[str],
+        producer: Callable[[List[str]], Awaitable[Mapping[str, T]]],
+        ttl: Optional[int] = None,
+        skip_cache_func: Optional[Callable[[T], bool]] = None,
+        ttl_jitter: Optional[TTLJitter] = None,
+    ) -> Dict[str, T]:
+        """
+        Batch variant of ``get_or_set``: one ``multi_get``, then a single producer call
+        with the missing keys, then one ``multi_set`` for the produced values.
+
+        There is no RedLock around the producer: concurrent batches missing the same
+        keys may both compute them.
+
+        Args:
+            keys: Cache keys; duplicates are ignored.
+            producer: Async callable receiving the missing keys and returning a
+                mapping of key to value. Keys absent from the mapping are not cached
+                and are left out of the result.
+            ttl: TTL in seconds.
+            skip_cache_func: If it returns True for a value, that value is not stored.
+            ttl_jitter: Expiry-spreading policy applied per key (see ``set``).
+
+        Returns:
+            Mapping of key to value, in ``keys`` order, for every key that was cached
+            or produced.
+        """
+        ordered = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        started = time.perf_counter()
+        values = await self._get_many_raw(ordered)
+        now = time.time()
+        for key, value in zip(ordered, values, strict=True):
+            self._record_lookup(value, started, stale_ok=False)
+            if isinstance(value, _CacheEntry):
+                if value.fresh_until > now:
+                    found[key] = _decode(value.value)
+                else:
+                    missing.append(key)
+            elif value is None:
+                missing.append(key)
+            else:
+                found[key] = _decode(value)
+
+        if missing:
+            started = time.perf_counter()
+            produced = await producer(missing)
+            elapsed = time.perf_counter() - started
+            for stats in self._observers():
+                stats.producer.observe(elapsed)
+            to_store = []
+            for key in missing:
+                if key not in produced:
+                    continue
+                fresh = produced[key]
+                found[key] = fresh
+                if skip_cache_func is not None and skip_cache_func(fresh):
+                    continue
+                to_store.append((key, _CACHED_NONE if fresh is None else fresh))
+            await self.set_many(to_store, ttl=ttl, ttl_jitter=ttl_jitter)
+
+        return {key: found[key] for key in ordered if key in found}
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[Any]],
+        ttl: Optional[int],
+        lease: Optional[float],
+        skip_cache_func: Optional[Callable[[Any], bool]],
+        stale_ttl: Optional[float],
+        xfetch_beta: Optional[float] = None,
+        refresh_until: Optional[float] = None,
+    ) -> None:
+        """Start a background refresh for ``key`` unless one is already running in this process."""
+        if key in self._refresh_tasks:
+            return
+        task = asyncio.create_task(
+            self._produce_locked(key, producer, ttl, lease, skip_cache_func, stale_ttl, xfetch_beta, refresh_until)
+        )
+        self._refresh_tasks[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            self._refresh_tasks.pop(key, None)
+            if not t.cancelled() and t.exception() is not None:
+                logger.warning(f"Background refresh of cache key '{key}' failed: {t.exception()!r}")
+
+        task.add_done_callback(_done)
+
     async def close(self) -> None:
         """Close the underlying backend connections."""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        self._refresh_tasks.clear()
+        if self._l1 is not None:
+            self._l1.clear()
         await self._backend.close()
 
 
@@ -134,6 +997,8 @@ class CacheManager:
             cls._instance = super().__new__(cls)
             cls._instance._wrappers: Dict[str, ZodiacCache] = {}
             cls._instance._setup_configs: Dict[str, Dict[str, Any]] = {}
+            cls._instance._warmup_loaders: List[WarmupLoader] = []
+            cls._instance._bus: Optional[InvalidationBus] = None
         return cls._instance
 
     def get_cache(self, name: str = DEFAULT_CACHE_NAME) -> ZodiacCache:
@@ -143,24 +1008,129 @@ class CacheManager:
                 backend = aiocaches.get(name)
             except Exception as e:
                 raise RuntimeError(f"Cache '{name}' is not initialized: {e}") from e
-            setup_config = self._setup_configs.get(name, {})
-            self._wrappers[name] = ZodiacCache(
-                backend=backend,
-                default_ttl=setup_config.get("default_ttl"),
-            )
+            self._wrappers[name] = self._create_wrapper(name, backend, self._setup_configs.get(name, {}))
+            self._wrappers[name]._bus = self._bus
         return self._wrappers[name]
 
+    @staticmethod
+    def _create_wrapper(name: str, backend: BaseCache, setup_config: Dict[str, Any]) -> ZodiacCache:
+        """Build a ZodiacCache for ``backend`` from the options recorded by ``setup``."""
+        l1 = None
+        if setup_config.get("l1_max_entries"):
+            l1 = LocalCache(max_entries=setup_config["l1_max_entries"], ttl=setup_config["l1_ttl"])
+        return ZodiacCache(
+            backend=backend,
+            default_ttl=setup_config.get("default_ttl"),
+            l1=l1,
+            name=name,
+            ttl_jitter=setup_config.get("ttl_jitter"),
+            op_timeout=setup_config.get("op_timeout"),
+            fail_open=setup_config.get("fail_open", False),
+            breaker_threshold=setup_config.get("breaker_threshold", 5),
+            breaker_cooldown=setup_config.get("breaker_cooldown", 10.0),
+        )
+
     @property
     def cache(self) -> ZodiacCache:
         """The default cache instance (ZodiacCache) for get/set/get_or_set."""
         return self.get_cache(DEFAULT_CACHE_NAME)
 
+    def stats_snapshot(self, name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Return statistics of every configured cache (or only ``name``) as
+        ``{cache_name: ZodiacCache.stats_snapshot()}``, e.g. for a metrics endpoint.
+        """
+        names = [name] if name is not None else list(self._wrappers)
+        return {cache_name: self.get_cache(cache_name).stats_snapshot() for cache_name in names}
+
+    async def invalidate_tags(self, tags: Union[str, Iterable[str]], name: str = DEFAULT_CACHE_NAME) -> None:
+        """Invalidate entries tagged with any of ``tags`` in the named cache (see ``ZodiacCache.invalidate_tags``)."""
+        await self.get_cache(name).invalidate_tags(tags)
+
+    async def start_invalidation_bus(self, transport: InvalidationTransport) -> InvalidationBus:
+        """
+        Broadcast ``delete`` / ``invalidate_tags`` of every cache in this process
+        to the other processes sharing ``transport``, and apply theirs here.
+        Stopped by ``stop_invalidation_bus`` or a full ``shutdown()``.
+
+        Args:
+            transport: ``RedisPubSubTransport``, ``UnixSocketTransport`` (see
+                ``zodiac_core.cache.invalidation``) or a custom transport.
+        """
+        if self._bus is not None:
+            raise RuntimeError("Cache invalidation bus is already running")
+        bus = InvalidationBus(transport, self._wrappers.get)
+        await bus.start()
+        self._bus = bus
+        for wrapper in self._wrappers.values():
+            wrapper._bus = bus
+        logger.info(f"Cache invalidation bus started ({type(transport).__name__})")
+        return bus
+
+    async def stop_invalidation_bus(self) -> None:
+        """Stop broadcasting and receiving invalidations (no-op when not running)."""
+        bus, self._bus = self._bus, None
+        if bus is None:
+            return
+        for wrapper in self._wrappers.values():
+            wrapper._bus = None
+        await bus.close()
+
+    def register_warmup(
+        self,
+        loader: Callable[..., Any],
+        calls: Optional[Iterable[Any]] = None,
+        *,
+        label: Optional[str] = None,
+    ) -> Callable[..., Any]:
+        """
+        Register a loader for ``warmup()`` and return it unchanged.
+
+        Args:
+            loader: Usually a ``@cached`` function; any sync or async callable works.
+            calls: Argument sets to call it with: a tuple is positional arguments,
+                a mapping keyword arguments, anything else a single argument.
+                None calls it once without arguments.
+            label: Name in logs and the report; defaults to ``module:qualname``.
+        """
+        self._warmup_loaders.append(_make_loader(loader, calls, label))
+        return loader
+
+    async def warmup(
+        self,
+        *,
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[int, int], Any]] = None,
+    ) -> WarmupReport:
+        """
+        Run the registered loaders (see ``register_warmup``), e.g. during lifespan startup.
+
+        Args:
+            concurrency: Maximum number of loader calls in flight.
+            timeout: Overall budget in seconds; calls still pending are cancelled
+                and reported as skipped. No limit when None.
+            on_progress: Called as ``on_progress(completed, total)`` after each call.
+
+        Returns:
+            A ``WarmupReport`` with counts and per-loader timings. Failing calls are
+            logged and counted, never raised.
+        """
+        return await run_warmup(self._warmup_loaders, concurrency=concurrency, timeout=timeout, on_progress=on_progress)
+
     def setup(
         self,
         prefix: str,
         *,
         name: str = DEFAULT_CACHE_NAME,
         default_ttl: Optional[int] = None,
+        l1_max_entries: Optional[int] = None,
+        l1_ttl: Optional[float] = None,
+        ttl_jitter: Optional[TTLJitter] = None,
+        op_timeout: Optional[float] = None,
+        fail_open: bool = False,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 10.0,
         **kwargs: Any,
     ) -> None:
         """
@@ -169,15 +1139,55 @@ class CacheManager:
         ``serializer``, ``ttl``). We only set default ``namespace`` to
         ``{ZODIAC_CACHE_NAMESPACE}:{prefix}`` and minimal defaults (cache class,
         serializer) when omitted.
+
+        Args:
+            prefix: Namespace prefix for all keys of this cache.
+            name: Cache name used by ``get_cache(name)`` and ``@cached(name=...)``.
+            default_ttl: Default TTL in seconds when a call does not pass one.
+            l1_max_entries: Enables an in-process near-cache (L1) holding at most
+                this many entries in front of the backend. Disabled when None.
+            l1_ttl: Maximum lifetime in seconds of an L1 entry (``DEFAULT_L1_TTL``
+                when L1 is enabled without it). Bounds staleness across processes:
+                a value read from the backend may be served from L1 up to
+                ``l1_ttl`` past its backend expiry, so keep it short.
+            ttl_jitter: Default expiry-spreading policy for writes: a fraction of the
+                TTL (e.g. ``0.1``) or a ``(min_seconds, max_seconds)`` range, applied
+                deterministically per key (see ``ZodiacCache.set``).
+            op_timeout: Timeout in seconds for each backend operation (lock
+                acquisition additionally gets the lock lease). No timeout when None.
+            fail_open: Treat backend timeouts and errors as cache misses instead of
+                raising, so requests fall through to the producer.
+            breaker_threshold: With ``fail_open``, consecutive backend failures that
+                open the circuit breaker.
+            breaker_cooldown: With ``fail_open``, seconds the backend is bypassed
+                once the breaker is open.
         """
         config = dict(kwargs)
         config["namespace"] = f"{ZODIAC_CACHE_NAMESPACE}:{prefix}"  # always apply our namespace
         config.setdefault("cache", "aiocache.SimpleMemoryCache")
         config.setdefault("serializer", {"class": "aiocache.serializers.PickleSerializer"})
 
+        if l1_ttl is not None and not l1_max_entries:
+            raise ValueError("l1_ttl requires l1_max_entries to enable the L1 cache")
+        if l1_max_entries and l1_ttl is None:
+            l1_ttl = DEFAULT_L1_TTL
+        _check_ttl_jitter(ttl_jitter)
+        _check_resilience(op_timeout, breaker_threshold, breaker_cooldown)
+
+        current = {
+            "default_ttl": default_ttl,
+            "l1_max_entries": l1_max_entries,
+            "l1_ttl": l1_ttl,
+            "ttl_jitter": ttl_jitter,
+            "op_timeout": op_timeout,
+            "fail_open": fail_open,
+            "breaker_threshold": breaker_threshold,
+            "breaker_cooldown": breaker_cooldown,
+            "config": config,
+        }
+
         if name in self._wrappers:
             existing = self._setup_configs.get(name)
-            current = {"default_ttl": default_ttl, "config": config}
             if existing == current:
                 logger.debug(f"Cache '{name}' is already configured with the same settings, skipping.")
                 return
@@ -185,8 +1195,9 @@ class CacheManager:
 
         aiocaches.add(name, config)
         instance = aiocaches.get(name)
-        self._wrappers[name] = ZodiacCache(backend=instance, default_ttl=default_ttl)
-        self._setup_configs[name] = {"default_ttl": default_ttl, "config": deepcopy(config)}
+        self._wrappers[name] = self._create_wrapper(name, instance, current)
+        self._wrappers[name]._bus = self._bus
+        self._setup_configs[name] = deepcopy(current)
         logger.info(f"Cache '{name}' initialized with prefix={prefix}")
 
     async def shutdown(self, name: str | None = None) -> None:
@@ -206,6 +1217,7 @@ class CacheManager:
             self._setup_configs.pop(name, None)
             return
 
+        await self.stop_invalidation_bus()
         for cache_name, wrapper in list(self._wrappers.items()):
             await wrapper.close()
             getattr(aiocaches, "_caches", {}).pop(cache_name, None)
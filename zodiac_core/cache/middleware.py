@@ -0,0 +1,290 @@
+"""
+HTTP response cache (Pure ASGI) on top of ZodiacCache.
+
+Caches whole GET responses (status, headers and body) of selected paths, keyed
+on path, query string and chosen request headers:
+
+    from zodiac_core.cache import ResponseCacheMiddleware
+
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        ttl=60,
+        paths=["/api/v1/items", "/api/v1/catalog"],
+        vary_headers=["accept-language"],
+        tags=lambda scope: ["items"],
+    )
+
+    await cache.invalidate_tags(["items"])  # purge every cached response tagged "items"
+
+Concurrent misses for the same key are coalesced through
+``ZodiacCache.get_or_set`` (single-flight per process, RedLock across processes).
+A response is buffered only while it may still be stored: once it turns out
+uncacheable or outgrows ``max_body_size`` it is streamed to the client as it is
+produced, and concurrent requests compute their own.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode
+
+from loguru import logger
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from zodiac_core.cache.manager import DEFAULT_CACHE_NAME, ZodiacCache, cache
+
+TagsOption = Union[Iterable[str], Callable[[Scope], Iterable[str]], None]
+
+# Response headers describing one particular response, never replayed from the cache.
+_UNCACHED_HEADERS = frozenset({b"date", b"x-request-id", b"age"})
+_PRIVATE_DIRECTIVES = ("no-store", "private", "no-cache")
+
+
+class _Uncacheable(Exception):
+    """Raised by the producer when the response is not stored, releasing concurrent requests."""
+
+
+class _ResponseCapture:
+    """
+    ASGI ``send`` buffering a response while it may still be cached. Once the
+    start message is not cacheable, the body grows past ``max_body_size`` or a
+    non-body message (trailers, pathsend) is sent, the buffer is flushed and
+    the rest of the response goes straight to the client.
+    """
+
+    def __init__(self, middleware: "ResponseCacheMiddleware", send: Send) -> None:
+        self.middleware = middleware
+        self.send = send
+        self.messages: List[Message] = []
+        self.ttl: Optional[int] = None
+        self.streaming = asyncio.Event()
+        self._size = 0
+
+    async def __call__(self, message: Message) -> None:
+        if self.streaming.is_set():
+            await self.send(message)
+            return
+        self.messages.append(message)
+        if message["type"] == "http.response.start":
+            self.ttl = self.middleware._start_ttl(message)
+            cacheable = self.ttl is not None
+        elif message["type"] == "http.response.body":
+            self._size += len(message.get("body", b""))
+            cacheable = self.ttl is not None and self._size <= self.middleware.max_body_size
+        else:
+            cacheable = False
+        if not cacheable:
+            await self.stream()
+
+    async def stream(self) -> None:
+        """Send the buffered messages and pass every later one straight through."""
+        self.streaming.set()
+        messages, self.messages = self.messages, []
+        await self.middleware._replay(messages, self.send, hit=False)
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a ``Cache-Control`` header into ``{directive: argument or None}`` (lower-cased)."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _max_age(directives: Dict[str, Optional[str]]) -> Optional[int]:
+    """``s-maxage`` (shared caches) wins over ``max-age``; None when absent or invalid."""
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                return int(directives[name] or "")
+            except ValueError:
+                return None
+    return None
+
+
+class ResponseCacheMiddleware:
+    """
+    Response cache middleware (Pure ASGI).
+
+    Only ``GET`` requests whose path starts with one of ``paths`` (all paths when
+    None) are cached. A response is stored when its status is in ``statuses``, it
+    has no ``Set-Cookie``, its ``Cache-Control`` has none of ``no-store``,
+    ``private`` or ``no-cache``, its ``Vary`` only names headers listed in
+    ``vary_headers``, and its body is at most ``max_body_size`` bytes. Other
+    responses are streamed through without being buffered.
+
+    Requests carrying ``Authorization`` or ``Cookie`` bypass the cache unless
+    those headers are listed in ``vary_headers`` (and so are part of the key).
+    A request ``Cache-Control: no-store`` bypasses it; ``no-cache`` skips the
+    lookup but stores the fresh response.
+
+    Args:
+        app: The ASGI application.
+        ttl: Default lifetime in seconds; a response ``s-maxage`` / ``max-age`` overrides it.
+        paths: Path prefixes to cache; None caches every GET route.
+        vary_headers: Request headers whose values are part of the cache key.
+        tags: Tags for the cached responses, static or computed from the ASGI scope;
+            purge them with ``cache.invalidate_tags``.
+        cache_name: Name of the configured cache (see ``cache.setup(name=...)``).
+        statuses: Response status codes that may be cached.
+        max_body_size: Larger responses are streamed through but not stored.
+        header_name: Response header reporting ``HIT`` / ``MISS``; None disables it.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        ttl: Optional[int] = None,
+        paths: Optional[Sequence[str]] = None,
+        vary_headers: Iterable[str] = (),
+        tags: TagsOption = None,
+        cache_name: str = DEFAULT_CACHE_NAME,
+        statuses: Iterable[int] = (200, 203, 300, 301, 404, 410),
+        max_body_size: int = 1024 * 1024,
+        header_name: Optional[str] = "X-Cache",
+    ) -> None:
+        self.app = app
+        self.ttl = ttl
+        self.paths = tuple(paths) if paths is not None else None
+        self.vary_headers = tuple(sorted({header.lower() for header in vary_headers}))
+        self.tags = tags
+        self.cache_name = cache_name
+        self.statuses = frozenset(statuses)
+        self.max_body_size = max_body_size
+        self.header_name = header_name.lower().encode("latin-1") if header_name else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or not self._matches(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        request_directives = _parse_cache_control(headers.get("cache-control"))
+        if "no-store" in request_directives or any(
+            name in headers and name not in self.vary_headers for name in ("authorization", "cookie")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        zc = cache.get_cache(self.cache_name)
+        key = await zc.tagged_key(self._key(scope, headers), self._tags(scope))
+        capture = _ResponseCapture(self, send)
+        if "no-cache" in request_directives:
+            await self.app(scope, receive, capture)
+            if await self._store(zc, key, capture) is not None:
+                await self._replay(capture.messages, send, hit=False)
+            return
+
+        running: List[asyncio.Future] = []
+
+        async def producer() -> Dict[str, Any]:
+            app = asyncio.ensure_future(self.app(scope, receive, capture))
+            running.append(app)
+            streaming = asyncio.ensure_future(capture.streaming.wait())
+            try:
+                await asyncio.wait({app, streaming}, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                app.cancel()
+                raise
+            finally:
+                streaming.cancel()
+            if not app.done():
+                # Streamed to the client: release concurrent requests instead of holding them until it ends.
+                raise _Uncacheable()
+            app.result()
+            entry = await self._store(zc, key, capture)
+            if entry is None:
+                raise _Uncacheable()
+            return entry
+
+        try:
+            # The producer stores the entry itself, with the TTL taken from the response.
+            entry = await zc.get_or_set(key, producer, ttl=self.ttl, skip_cache_func=lambda _: True)
+        except _Uncacheable:
+            if running:  # our response is being streamed by the capture
+                await running[0]
+            else:  # another request's response was not cacheable: compute our own
+                await self.app(scope, receive, send)
+            return
+        if running:
+            await self._replay(capture.messages, send, hit=False)
+        else:
+            await self._replay(self._entry_messages(entry), send, hit=True)
+
+    def _matches(self, path: str) -> bool:
+        return self.paths is None or any(path.startswith(prefix) for prefix in self.paths)
+
+    def _tags(self, scope: Scope) -> List[str]:
+        if self.tags is None:
+            return []
+        tags = self.tags(scope) if callable(self.tags) else self.tags
+        return list(tags)
+
+    def _key(self, scope: Scope, headers: Headers) -> str:
+        """``http:{path}:{digest}``, the digest covering the sorted query and the vary header values."""
+        query = urlencode(sorted(parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)))
+        parts = [scope.get("root_path", "") + scope["path"], query]
+        parts.extend(f"{name}={headers.get(name, '')}" for name in self.vary_headers)
+        digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+        return f"http:{scope['path']}:{digest}"
+
+    async def _store(self, zc: ZodiacCache, key: str, capture: _ResponseCapture) -> Optional[Dict[str, Any]]:
+        """Store a fully buffered response and return its entry; None when it was streamed instead."""
+        if capture.streaming.is_set() or capture.ttl is None:
+            return None
+        messages = capture.messages
+        start = messages[0]
+        entry = {
+            "status": start["status"],
+            "headers": [
+                [name, value] for name, value in start.get("headers", []) if name.lower() not in _UNCACHED_HEADERS
+            ],
+            "body": b"".join(message.get("body", b"") for message in messages[1:]),
+            "stored_at": time.time(),
+        }
+        await zc.set(key, entry, ttl=capture.ttl or None)
+        return entry
+
+    def _start_ttl(self, start: Message) -> Optional[int]:
+        """Return the TTL to store the response with (0 for the cache default), or None."""
+        if start["status"] not in self.statuses:
+            return None
+        response_headers = Headers(raw=start.get("headers", []))
+        if "set-cookie" in response_headers:
+            return None
+        directives = _parse_cache_control(response_headers.get("cache-control"))
+        if any(directive in directives for directive in _PRIVATE_DIRECTIVES):
+            return None
+        for vary in response_headers.getlist("vary"):
+            for name in vary.split(","):
+                name = name.strip().lower()
+                if name and name not in self.vary_headers:
+                    logger.debug(f"Not caching response: Vary '{name}' is not in vary_headers")
+                    return None
+        max_age = _max_age(directives)
+        if max_age is not None:
+            return max_age if max_age > 0 else None
+        return self.ttl or 0
+
+    @staticmethod
+    def _entry_messages(entry: Dict[str, Any]) -> List[Message]:
+        age = max(0, int(time.time() - entry["stored_at"]))
+        headers: List[Tuple[bytes, bytes]] = [(bytes(name), bytes(value)) for name, value in entry["headers"]]
+        headers.append((b"age", str(age).encode()))
+        return [
+            {"type": "http.response.start", "status": entry["status"], "headers": headers},
+            {"type": "http.response.body", "body": entry["body"], "more_body": False},
+        ]
+
+    async def _replay(self, messages: List[Message], send: Send, hit: bool) -> None:
+        for message in messages:
+            if message["type"] == "http.response.start" and self.header_name is not None:
+                headers = list(message.get("headers", []))
+                headers.append((self.header_name, b"HIT" if hit else b"MISS"))
+                message = {**message, "headers": headers}
+            await send(message)
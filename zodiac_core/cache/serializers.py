@@ -0,0 +1,290 @@
+"""
+High-speed aiocache serializers for ZodiacCache.
+
+``ZodiacSerializer`` encodes JSON-like data (dicts, lists, scalars) and Pydantic
+models with ``pydantic_core`` (default), ``orjson`` or ``msgpack``, and compresses
+payloads above a size threshold with ``zlib`` or ``zstd``. Values it cannot
+represent losslessly (tuples, sets, datetimes outside models, custom classes)
+transparently fall back to pickle, so it is a drop-in replacement for
+``PickleSerializer``. Pydantic models must be importable by ``module:qualname``;
+they are stored as their JSON dump and re-validated on load.
+
+Example:
+
+    cache.setup(
+        prefix="myapp",
+        serializer={
+            "class": "zodiac_core.cache.serializers.ZodiacSerializer",
+            "format": "orjson",
+            "compression": "zstd",
+            "compress_threshold": 2048,
+        },
+    )
+
+``orjson``, ``msgpack`` and ``zstandard`` are optional: install the ones you select.
+"""
+
+import importlib
+import math
+import pickle
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiocache.serializers import BaseSerializer
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json, to_json
+
+from zodiac_core.cache.manager import _CACHED_NONE, _BlobManifest, _CachedNoneSentinel, _CacheEntry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on optional dependency
+    zstandard = None
+
+# Frame header: one byte for the codec, one byte for the compression.
+_CODEC_JSON = b"J"
+_CODEC_ORJSON = b"O"
+_CODEC_MSGPACK = b"M"
+_CODEC_PICKLE = b"P"
+_COMPRESSION_NONE = b"-"
+_COMPRESSION_ZLIB = b"Z"
+_COMPRESSION_ZSTD = b"S"
+
+# Reserved dict key marking internal values (models, cached None, envelopes).
+_TAG = "__zc__"
+
+
+class _Unsupported(Exception):
+    """Raised while encoding when a value needs the pickle fallback."""
+
+
+_model_registry: Dict[str, Optional[type]] = {}
+_list_adapters: Dict[type, TypeAdapter] = {}
+
+
+def _model_path(cls: type) -> Optional[str]:
+    """Return an importable ``module:qualname`` for a model class, or None when it cannot be resolved."""
+    path = f"{cls.__module__}:{cls.__qualname__}"
+    if path not in _model_registry:
+        _model_registry[path] = _import_model(path)
+    return path if _model_registry[path] is cls else None
+
+
+def _require_model_path(cls: type) -> str:
+    path = _model_path(cls)
+    if path is None:
+        raise _Unsupported
+    return path
+
+
+def _import_model(path: str) -> Optional[type]:
+    module_name, _, qualname = path.partition(":")
+    try:
+        target: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            target = getattr(target, part)
+    except (ImportError, AttributeError):
+        return None
+    return target if isinstance(target, type) and issubclass(target, BaseModel) else None
+
+
+def _list_adapter(model: type) -> TypeAdapter:
+    adapter = _list_adapters.get(model)
+    if adapter is None:
+        adapter = _list_adapters[model] = TypeAdapter(List[model])
+    return adapter
+
+
+def _encode(value: Any, allow_bytes: bool, native_models: bool) -> Any:
+    """
+    Convert ``value`` into codec-native data, tagging internal types; raise ``_Unsupported`` otherwise.
+
+    With ``native_models`` the codec serializes models itself (pydantic_core);
+    otherwise they are dumped to JSON-compatible data here, by alias so that
+    ``model_validate`` accepts them back.
+    """
+    if value is None or type(value) in (str, int, bool):
+        return value
+    if type(value) is float:
+        if not math.isfinite(value):
+            raise _Unsupported  # not every codec round-trips NaN / infinity
+        return value
+    if type(value) is dict:
+        encoded = {}
+        for key, item in value.items():
+            if type(key) is not str or key == _TAG:
+                raise _Unsupported
+            encoded[key] = _encode(item, allow_bytes, native_models)
+        return encoded
+    if type(value) is list:
+        if value and isinstance(value[0], BaseModel):
+            model = type(value[0])
+            if all(type(item) is model for item in value):
+                # Homogeneous model lists: one tag, validated back in a single TypeAdapter call.
+                path = _require_model_path(model)
+                if not native_models:
+                    value = _list_adapter(model).dump_python(value, mode="json", by_alias=True, round_trip=True)
+                return {_TAG: "L", "t": path, "d": value}
+        return [_encode(item, allow_bytes, native_models) for item in value]
+    if isinstance(value, BaseModel):
+        path = _require_model_path(type(value))
+        if not native_models:
+            return {_TAG: "m", "t": path, "d": value.model_dump(mode="json", by_alias=True, round_trip=True)}
+        return {_TAG: "m", "t": path, "d": value}
+    if isinstance(value, _CachedNoneSentinel):
+        return {_TAG: "n"}
+    if isinstance(value, _CacheEntry):
+        encoded_value = _encode(value.value, allow_bytes, native_models)
+        return {_TAG: "e", "v": encoded_value, "f": value.fresh_until, "d": value.delta}
+    if isinstance(value, _BlobManifest):
+        return {_TAG: "b", "t": value.token, "p": value.parts, "s": value.size}
+    if allow_bytes and type(value) is bytes:
+        return value
+    raise _Unsupported
+
+
+def _resolve_model(path: str) -> type:
+    model = _model_registry.get(path) or _import_model(path)
+    if model is None:
+        raise ValueError(f"Cannot resolve cached model type '{path}'")
+    _model_registry[path] = model
+    return model
+
+
+def _json_dumps(value: Any) -> bytes:
+    return to_json(value, round_trip=True)
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of ``_encode``."""
+    if type(value) is list:
+        return [_decode(item) for item in value]
+    if type(value) is not dict:
+        return value
+    tag = value.get(_TAG)
+    if tag is None:
+        return {key: _decode(item) for key, item in value.items()}
+    if tag == "m":
+        return _resolve_model(value["t"]).model_validate(value["d"])
+    if tag == "L":
+        return _list_adapter(_resolve_model(value["t"])).validate_python(value["d"])
+    if tag == "n":
+        return _CACHED_NONE
+    if tag == "e":
+        return _CacheEntry(_decode(value["v"]), value["f"], value["d"])
+    if tag == "b":
+        return _BlobManifest(value["t"], value["p"], value["s"])
+    raise ValueError(f"Unknown cache payload tag '{tag}'")
+
+
+def _codec(fmt: str) -> Tuple[bytes, Callable[[Any], bytes], bool]:
+    """Return (header byte, dumps, supports bytes) for a format name."""
+    if fmt == "json":
+        return _CODEC_JSON, _json_dumps, False
+    if fmt == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is required for format='orjson'. Please install it with: pip install orjson")
+        return _CODEC_ORJSON, orjson.dumps, False
+    if fmt == "msgpack":
+        if msgpack is None:
+            raise ImportError("msgpack is required for format='msgpack'. Please install it with: pip install msgpack")
+        return _CODEC_MSGPACK, msgpack.packb, True
+    raise ValueError(f"Unsupported serializer format '{fmt}'; expected 'json', 'orjson' or 'msgpack'")
+
+
+class ZodiacSerializer(BaseSerializer):
+    """
+    Serializer producing framed ``bytes``: a codec byte, a compression byte, then the payload.
+
+    Frames are self-describing, so entries written with one format or compression
+    setting stay readable after the configuration changes.
+
+    Args:
+        format: ``"json"`` (``pydantic_core``, always available), ``"orjson"`` or ``"msgpack"``.
+        compression: ``"zlib"``, ``"zstd"`` or None.
+        compress_threshold: Payloads of at least this many bytes are compressed.
+        compress_level: Codec-specific level; None uses the library default.
+        pickle_fallback: Pickle values the codec cannot represent losslessly.
+            When False, such values raise ``TypeError``.
+    """
+
+    DEFAULT_ENCODING = None
+
+    def __init__(
+        self,
+        *args: Any,
+        format: str = "json",
+        compression: Optional[str] = "zlib",
+        compress_threshold: int = 1024,
+        compress_level: Optional[int] = None,
+        pickle_fallback: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.format = format
+        self._codec_byte, self._dumps, self._allow_bytes = _codec(format)
+        if compression not in (None, "zlib", "zstd"):
+            raise ValueError(f"Unsupported compression '{compression}'; expected 'zlib', 'zstd' or None")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError(
+                "zstandard is required for compression='zstd'. Please install it with: pip install zstandard"
+            )
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+        self.pickle_fallback = pickle_fallback
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode ``value`` into a framed, optionally compressed payload."""
+        try:
+            encoded = _encode(value, self._allow_bytes, self._codec_byte == _CODEC_JSON)
+            codec_byte, payload = self._codec_byte, self._dumps(encoded)
+        except (_Unsupported, TypeError, ValueError, OverflowError) as e:
+            if not self.pickle_fallback:
+                raise TypeError(f"{type(value).__qualname__} is not supported by format '{self.format}'") from e
+            codec_byte, payload = _CODEC_PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        compression_byte = _COMPRESSION_NONE
+        if self.compression is not None and len(payload) >= self.compress_threshold:
+            compressed = self._compress(payload)
+            if len(compressed) < len(payload):
+                compression_byte = _COMPRESSION_ZSTD if self.compression == "zstd" else _COMPRESSION_ZLIB
+                payload = compressed
+        return codec_byte + compression_byte + payload
+
+    def loads(self, value: Optional[bytes]) -> Any:
+        """Decode a payload produced by ``dumps``; None (cache miss) stays None."""
+        if value is None:
+            return None
+        codec_byte, compression_byte, payload = value[:1], value[1:2], value[2:]
+        if compression_byte == _COMPRESSION_ZLIB:
+            payload = zlib.decompress(payload)
+        elif compression_byte == _COMPRESSION_ZSTD:
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+
+        if codec_byte == _CODEC_PICKLE:
+            return pickle.loads(payload)
+        if codec_byte == _CODEC_JSON:
+            return _decode(from_json(payload))
+        if codec_byte == _CODEC_ORJSON:
+            return _decode(orjson.loads(payload))
+        if codec_byte == _CODEC_MSGPACK:
+            return _decode(msgpack.unpackb(payload))
+        raise ValueError(f"Unknown cache payload codec {codec_byte!r}")
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == "zstd":
+            level = self.compress_level if self.compress_level is not None else 3
+            return zstandard.ZstdCompressor(level=level).compress(payload)
+        level = self.compress_level if self.compress_level is not None else -1
+        return zlib.compress(payload, level)
@@ -0,0 +1,149 @@
+"""
+Cheap in-process cache instrumentation: counters and fixed-bucket histograms,
+kept per cache and per ``@cached`` function.
+
+Read them with ``cache.stats_snapshot()`` (all caches) or
+``ZodiacCache.stats_snapshot()``; the result is plain data suitable for a
+metrics endpoint or a log line.
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds (inclusive) of histogram buckets; a final +Inf bucket is implicit.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS: Tuple[float, ...] = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Label of the @cached / @cached_batch function currently calling into ZodiacCache.
+_function_label_ctx_var: ContextVar[Optional[str]] = ContextVar("zodiac_cache_function", default=None)
+
+
+class Histogram:
+    """Fixed-bucket histogram (count, sum and per-bucket counts), Prometheus-style."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts: List[int] = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return ``count``, ``sum`` and cumulative ``buckets`` keyed by upper bound (``"+Inf"`` last)."""
+        buckets: Dict[str, int] = {}
+        running = 0
+        for bound, bucket_count in zip((*self.bounds, "+Inf"), self.counts, strict=True):
+            running += bucket_count
+            buckets[str(bound)] = running
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class CacheStats:
+    """
+    Counters and histograms for one cache or one cached function.
+
+    Attributes:
+        hits: Lookups answered from the cache (including stale and cached-None hits).
+        misses: Lookups that had to compute the value.
+        none_hits: Hits on a cached None.
+        stale_hits: Stale values served while a background refresh runs.
+        lock_waits: Misses that waited for a value computed elsewhere (RedLock or
+            an in-process single-flight computation).
+        backend_errors: Backend operations that timed out or failed and were
+            answered with a fallback (``fail_open`` caches only).
+        lookup: Backend lookup latency (seconds).
+        lock_wait: RedLock acquisition time (seconds).
+        producer: Producer run time (seconds).
+        value_size: Serialized size of stored values (bytes); only recorded for
+            serializers producing ``bytes`` / ``str``.
+    """
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "none_hits",
+        "stale_hits",
+        "lock_waits",
+        "backend_errors",
+        "lookup",
+        "lock_wait",
+        "producer",
+        "value_size",
+    )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter and histogram."""
+        self.hits = 0
+        self.misses = 0
+        self.none_hits = 0
+        self.stale_hits = 0
+        self.lock_waits = 0
+        self.backend_errors = 0
+        self.lookup = Histogram(LATENCY_BUCKETS)
+        self.lock_wait = Histogram(LATENCY_BUCKETS)
+        self.producer = Histogram(LATENCY_BUCKETS)
+        self.value_size = Histogram(SIZE_BUCKETS)
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """``hits / (hits + misses)``, or None before the first lookup."""
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current values as plain data."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "none_hits": self.none_hits,
+            "stale_hits": self.stale_hits,
+            "lock_waits": self.lock_waits,
+            "backend_errors": self.backend_errors,
+            "hit_ratio": self.hit_ratio,
+            "lookup_seconds": self.lookup.snapshot(),
+            "lock_wait_seconds": self.lock_wait.snapshot(),
+            "producer_seconds": self.producer.snapshot(),
+            "value_size_bytes": self.value_size.snapshot(),
+        }
+
+
+def get_function_label() -> Optional[str]:
+    """Return the label of the cached function on whose behalf the cache is being called, if any."""
+    return _function_label_ctx_var.get()
+
+
+@contextmanager
+def function_label_scope(label: str) -> Iterator[None]:
+    """Attribute cache activity in this context to ``label`` (used by ``@cached``)."""
+    token = _function_label_ctx_var.set(label)
+    try:
+        yield
+    finally:
+        _function_label_ctx_var.reset(token)
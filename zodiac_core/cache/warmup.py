@@ -0,0 +1,155 @@
+"""
+Cache warm-up: preload hot entries at startup so a freshly deployed process does
+not serve its first minutes from cold caches.
+
+Register loaders (typically ``@cached`` functions with the argument sets worth
+preloading) and run them once during lifespan startup:
+
+    cache.register_warmup(get_config)                          # called once, no args
+    cache.register_warmup(get_user, [1, 2, 3])                 # get_user(1), get_user(2), ...
+    cache.register_warmup(search, [("books", 1), {"q": "tv"}]) # positional tuples / keyword dicts
+
+    report = await cache.warmup(concurrency=8, timeout=30)
+
+Warm-up never raises for failing loaders: errors are logged and counted in the
+report, since a cold cache is better than a process that does not start.
+"""
+
+import asyncio
+import inspect
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+
+# (positional args, keyword args) of one loader call
+_Call = Tuple[Tuple[Any, ...], Dict[str, Any]]
+
+
+class WarmupLoader(NamedTuple):
+    """A registered loader and the calls to make."""
+
+    label: str
+    fn: Callable[..., Any]
+    calls: Tuple[_Call, ...]
+
+
+class WarmupLoaderReport(NamedTuple):
+    """Outcome of one loader: calls made, failures and cumulative run time (seconds)."""
+
+    label: str
+    calls: int
+    failures: int
+    seconds: float
+
+
+class WarmupReport(NamedTuple):
+    """
+    Outcome of ``cache.warmup()``.
+
+    Attributes:
+        total: Number of calls planned.
+        completed: Calls that finished (successfully or not) before the timeout.
+        failed: Calls that raised.
+        seconds: Wall-clock duration of the warm-up.
+        loaders: Per-loader breakdown, in registration order.
+    """
+
+    total: int
+    completed: int
+    failed: int
+    seconds: float
+    loaders: List[WarmupLoaderReport]
+
+    @property
+    def skipped(self) -> int:
+        """Calls not started or not finished when the timeout expired."""
+        return self.total - self.completed
+
+
+def _to_call(item: Any) -> _Call:
+    """A tuple is positional args, a mapping keyword args, anything else a single argument."""
+    if isinstance(item, tuple):
+        return item, {}
+    if isinstance(item, Mapping):
+        return (), dict(item)
+    return (item,), {}
+
+
+def _make_loader(
+    fn: Callable[..., Any], calls: Optional[Iterable[Any]] = None, label: Optional[str] = None
+) -> WarmupLoader:
+    """Build a ``WarmupLoader``; ``calls=None`` means a single call without arguments."""
+    if not callable(fn):
+        raise TypeError("warm-up loader must be callable")
+    return WarmupLoader(
+        label=label or f"{fn.__module__}:{fn.__qualname__}",
+        fn=fn,
+        calls=(((), {}),) if calls is None else tuple(_to_call(item) for item in calls),
+    )
+
+
+async def run_warmup(
+    loaders: Iterable[WarmupLoader],
+    *,
+    concurrency: int = 8,
+    timeout: Optional[float] = None,
+    on_progress: Optional[Callable[[int, int], Any]] = None,
+) -> WarmupReport:
+    """
+    Run every call of ``loaders`` with at most ``concurrency`` in flight.
+
+    ``on_progress(completed, total)`` is called after each call. Calls still
+    pending after ``timeout`` seconds are cancelled and reported as skipped.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be positive when provided")
+
+    loaders = list(loaders)
+    total = sum(len(loader.calls) for loader in loaders)
+    stats: Dict[str, List[Any]] = {loader.label: [0, 0, 0.0] for loader in loaders}  # calls, failures, seconds
+    pending: Iterator[Tuple[WarmupLoader, _Call]] = ((loader, call) for loader in loaders for call in loader.calls)
+    completed = failed = 0
+    started = time.perf_counter()
+
+    async def worker() -> None:
+        nonlocal completed, failed
+        for loader, (args, kwargs) in pending:
+            call_started = time.perf_counter()
+            try:
+                result = loader.fn(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                failed += 1
+                stats[loader.label][1] += 1
+                logger.warning(f"Cache warm-up call {loader.label}{args or ''} failed: {e!r}")
+            entry = stats[loader.label]
+            entry[0] += 1
+            entry[2] += time.perf_counter() - call_started
+            completed += 1
+            if on_progress is not None:
+                on_progress(completed, total)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, total))]
+    if workers:
+        _, unfinished = await asyncio.wait(workers, timeout=timeout)
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+
+    report = WarmupReport(
+        total=total,
+        completed=completed,
+        failed=failed,
+        seconds=time.perf_counter() - started,
+        loaders=[WarmupLoaderReport(label, *entry) for label, entry in stats.items()],
+    )
+    logger.info(
+        f"Cache warm-up finished: {report.completed}/{report.total} calls in {report.seconds:.2f}s "
+        f"({report.failed} failed, {report.skipped} skipped)"
+    )
+    return report
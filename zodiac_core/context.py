@@ -1,11 +1,13 @@
 from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import Optional
+from typing import Any, Dict, Optional
 
 # Define the global ContextVar to hold the Request ID
 # default=None is safer than empty string for logic checks
 _request_id_ctx_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 _service_name_ctx_var: ContextVar[Optional[str]] = ContextVar("service_name", default=None)
+# Request-scoped memo store (see RequestMemoMiddleware); None outside a request
+_request_memo_ctx_var: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("request_memo", default=None)
 
 
 def get_request_id() -> Optional[str]:
@@ -26,6 +28,15 @@ def get_service_name() -> Optional[str]:
     return _service_name_ctx_var.get()
 
 
+def get_request_memo() -> Optional[Dict[Any, Any]]:
+    """
+    Retrieve the memo store of the current request, or None outside a request scope.
+
+    The dict is shared by every task of the request and dropped when it ends.
+    """
+    return _request_memo_ctx_var.get()
+
+
 def set_request_id(request_id: str):
     """
     Internal use: Set the request ID for the current context.
@@ -72,3 +83,13 @@ def service_name_scope(service_name: str):
         yield
     finally:
         reset_service_name(token)
+
+
+@contextmanager
+def request_memo_scope():
+    """Create an empty request memo store for the current context and drop it on exit."""
+    token = _request_memo_ctx_var.set({})
+    try:
+        yield
+    finally:
+        _request_memo_ctx_var.reset(token)
@@ -1,9 +1,21 @@
+import asyncio
+import hashlib
+import sqlite3
+from collections.abc import Iterable, Mapping
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Optional, Type, TypeVar
+from itertools import batched
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 try:
-    from sqlalchemy import func, select
-    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+    from pydantic_core import PydanticUndefined
+    from sqlalchemy import and_, bindparam, func, insert, inspect, or_, select, tuple_, update
+    from sqlalchemy.dialects import mysql, postgresql
+    from sqlalchemy.dialects import sqlite as sqlite_dialect
+    from sqlalchemy.engine import Dialect
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+    from sqlalchemy.pool import SingletonThreadPool, StaticPool
+    from sqlalchemy.sql import operators
+    from sqlalchemy.sql.elements import UnaryExpression
 except ImportError as e:
     raise ImportError(
         "SQLModel and SQLAlchemy[asyncio] are required to use the 'zodiac_core.db' module. "
@@ -11,10 +23,171 @@ except ImportError as e:
     ) from e
 
 from zodiac_core.db.session import DEFAULT_DB_NAME, db, manage_session
-from zodiac_core.pagination import PagedResponse, PageParams
+from zodiac_core.db.sql import SQLDateTimeMixin, utc_now
+from zodiac_core.exceptions import BadRequestException
+from zodiac_core.pagination import (
+    CountMode,
+    CursorPage,
+    CursorParams,
+    PagedResponse,
+    PageParams,
+    decode_cursor,
+    encode_cursor,
+)
 
 T = TypeVar("T")
 
+CountStrategy = Literal["sequential", "window", "concurrent"]
+
+_TOTAL_LABEL = "zodiac_total"
+
+DEFAULT_COUNT_CAP = 10_000
+DEFAULT_COUNT_TTL = 60
+
+DEFAULT_BULK_CHUNK_SIZE = 1000
+DEFAULT_STREAM_CHUNK_SIZE = 1000
+
+BulkRow = Union[Mapping[str, Any], Any]
+
+
+def _keyset_columns(statement: Any, order_by: Sequence[Any]) -> List[Tuple[Any, bool]]:
+    """
+    Resolve ``order_by`` into ``(column, descending)`` pairs, appending the
+    primary key of the selected entity (in the direction of the last column)
+    as a tie-breaker unless it is already part of the ordering.
+    """
+    columns: List[Tuple[Any, bool]] = []
+    for clause in order_by:
+        descending = False
+        if isinstance(clause, UnaryExpression) and clause.modifier in (operators.desc_op, operators.asc_op):
+            descending = clause.modifier is operators.desc_op
+            clause = clause.element
+        if hasattr(clause, "__clause_element__"):
+            clause = clause.__clause_element__()
+        columns.append((clause, descending))
+    if not columns:
+        raise ValueError("paginate_keyset requires at least one order_by column")
+
+    entity = statement.column_descriptions[0].get("entity")
+    if entity is not None:
+        tie_direction = columns[-1][1]
+        for pk in inspect(entity).primary_key:
+            if not any(pk in getattr(column, "proxy_set", ()) for column, _ in columns):
+                columns.append((pk, tie_direction))
+    return columns
+
+
+def _keyset_predicate(columns: List[Tuple[Any, bool]], values: List[Any], backward: bool) -> Any:
+    """Rows strictly after ``values`` in the ordering (before, when ``backward``)."""
+    if len(set(descending for _, descending in columns)) == 1:
+        # Uniform direction: one row-value comparison, which databases turn into an index seek.
+        after = columns[0][1] == backward
+        lhs, rhs = tuple_(*(column for column, _ in columns)), tuple_(*values)
+        return lhs > rhs if after else lhs < rhs
+    # Mixed directions: (c1 > v1) OR (c1 = v1 AND c2 < v2) OR ...
+    clauses = []
+    for index, (column, descending) in enumerate(columns):
+        equal = [prefix == value for (prefix, _), value in zip(columns[:index], values[:index], strict=True)]
+        step = column > values[index] if descending == backward else column < values[index]
+        clauses.append(and_(*equal, step))
+    return or_(*clauses)
+
+
+def _count_statement(statement: Any, limit: Optional[int] = None) -> Any:
+    """
+    ``SELECT count(*)`` over ``statement`` without its limit/offset (wrapping handles
+    joins and GROUP BY); with ``limit``, the database stops after that many rows.
+    """
+    return select(func.count()).select_from(statement.limit(limit).offset(None).subquery())
+
+
+def _count_cache_key(session: AsyncSession, count_stmt: Any) -> str:
+    """Cache key of a count query: its SQL and parameters on the session's database."""
+    bind = session.get_bind()
+    compiled = count_stmt.compile(dialect=bind.dialect)
+    source = "\n".join(
+        (bind.engine.url.render_as_string(hide_password=True), str(compiled), repr(sorted(compiled.params.items())))
+    )
+    return f"pagination:count:{hashlib.blake2b(source.encode(), digest_size=16).hexdigest()}"
+
+
+def _supports_window_count(dialect: Dialect, statement: Any) -> bool:
+    """Whether ``count(*) OVER ()`` can be added to ``statement`` on ``dialect``."""
+    if getattr(statement, "_distinct", False):
+        # The window is evaluated before DISTINCT, so it would count duplicates.
+        return False
+    if dialect.name == "sqlite":
+        return sqlite3.sqlite_version_info >= (3, 25)
+    if dialect.name in ("mysql", "mariadb"):
+        version = dialect.server_version_info
+        if version is None:
+            return False
+        return version >= ((10, 2) if getattr(dialect, "is_mariadb", False) else (8, 0))
+    return True
+
+
+def _separate_engine(session: AsyncSession) -> Optional[AsyncEngine]:
+    """The engine to open a second connection on, or None when the session cannot use one concurrently."""
+    bind = session.bind
+    if not isinstance(bind, AsyncEngine) or isinstance(bind.pool, (StaticPool, SingletonThreadPool)):
+        # Bound to a single connection (or a pool that hands out only one): nothing to run concurrently on.
+        return None
+    return bind
+
+
+def _bulk_values(model: Any, rows: Iterable[BulkRow]) -> List[Dict[str, Any]]:
+    """
+    Turn model instances and mappings into column dicts for executemany.
+
+    Model instances contribute every column attribute (an unset primary key is
+    left to the database). Mappings get the model's field defaults for missing
+    columns, as constructing the model would, so ``SQLDateTimeMixin`` timestamps
+    and ``UUIDMixin`` ids are filled in.
+    """
+    mapper = inspect(model)
+    keys = [attr.key for attr in mapper.column_attrs]
+    primary_keys = {mapper.get_property_by_column(column).key for column in mapper.primary_key}
+    defaults = []
+    for key in keys:
+        field = model.model_fields.get(key)
+        if field is not None and (field.default_factory is not None or field.default not in (None, PydanticUndefined)):
+            defaults.append((key, field))
+
+    values = []
+    for row in rows:
+        if isinstance(row, Mapping):
+            row = dict(row)
+            for key, field in defaults:
+                if key not in row:
+                    row[key] = field.default_factory() if field.default_factory is not None else field.default
+        else:
+            row = {key: getattr(row, key) for key in keys}
+            for key in primary_keys:
+                if row[key] is None:
+                    del row[key]
+        values.append(row)
+    return values
+
+
+def _upsert_statement(
+    model: Any, dialect: Dialect, conflict_columns: Sequence[str], update_columns: Sequence[str]
+) -> Any:
+    """``INSERT ... ON CONFLICT DO UPDATE`` (PostgreSQL, SQLite) or ``ON DUPLICATE KEY UPDATE`` (MySQL)."""
+    if dialect.name in ("postgresql", "sqlite"):
+        stmt = (postgresql if dialect.name == "postgresql" else sqlite_dialect).insert(model)
+        if not update_columns:
+            return stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+        return stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={name: stmt.excluded[name] for name in update_columns},
+        )
+    if dialect.name in ("mysql", "mariadb"):
+        # MySQL resolves conflicts on any unique key; a self-assignment keeps existing rows untouched.
+        stmt = mysql.insert(model)
+        names = update_columns or conflict_columns[:1]
+        return stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in names})
+    raise ValueError(f"bulk_upsert is not supported on the '{dialect.name}' dialect")
+
 
 class BaseSQLRepository:
     """
@@ -43,16 +216,20 @@ class BaseSQLRepository:
         self.options = options
 
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    async def session(self, readonly: bool = False) -> AsyncIterator[AsyncSession]:
         """
         Async context manager for obtaining a database session.
         Uses the injected factory or resolves one from the global 'db' via 'db_name'.
 
+        Args:
+            readonly: Resolve a replica of 'db_name' when it has some (see
+                ``db.setup(replicas=...)``); ignored with an injected factory.
+
         Note:
             This context manager does NOT auto-commit. You must explicitly call
             `await session.commit()` to persist changes to the database.
         """
-        factory = self._session_factory or db.get_factory(self.db_name)
+        factory = self._session_factory or db.get_factory(self.db_name, readonly=readonly)
         async with manage_session(factory) as session:
             yield session
 
@@ -62,6 +239,11 @@ class BaseSQLRepository:
         statement: Any,
         params: PageParams,
         transformer: Optional[Type[T]] = None,
+        count_strategy: CountStrategy = "sequential",
+        count_mode: CountMode = "exact",
+        count_cap: int = DEFAULT_COUNT_CAP,
+        count_ttl: int = DEFAULT_COUNT_TTL,
+        count_cache: Optional[str] = None,
     ) -> PagedResponse[T]:
         """
         Execute a paginated query with automatic count and paging.
@@ -71,54 +253,156 @@ class BaseSQLRepository:
         2. Automatic limit/offset application.
         3. Packaging results into a standardized PagedResponse.
 
+        What the total is, is chosen with ``count_mode`` (reported back in
+        ``PagedResponse.count_mode``):
+
+        - ``"exact"``: ``count(*)`` over the whole statement.
+        - ``"capped"``: counting stops after ``count_cap`` rows; ``total_capped`` is True
+          when there are more.
+        - ``"cached"``: the exact count is stored in ``ZodiacCache`` (cache ``count_cache``,
+          default cache when None) for ``count_ttl`` seconds, so it may be stale.
+        - ``"none"``: no count; ``total`` is None. Also used when ``params.include_total``
+          is false.
+
+        Except in ``"exact"`` mode, ``size + 1`` rows are fetched to set ``has_next``.
+
+        How the count query runs is chosen with ``count_strategy``:
+
+        - ``"sequential"``: a ``count(*)`` query, then the page query (two round trips).
+        - ``"window"``: one query carrying ``count(*) OVER ()`` next to each row
+          (``"exact"`` mode only). Falls back to ``"sequential"`` when the dialect has no
+          window functions (SQLite < 3.25, MySQL < 8.0) or the statement is ``DISTINCT``;
+          a page past the end costs an extra count query.
+        - ``"concurrent"``: the count runs on a second pooled connection while the page is
+          fetched. It does not see uncommitted changes of ``session``; falls back to
+          ``"sequential"`` when the session is bound to a single connection.
+
         Args:
             session: The active AsyncSession.
             statement: The SQLAlchemy select statement (without limit/offset).
             params: Standard PageParams (page, size).
             transformer: Optional Pydantic model to transform DB objects into.
+            count_strategy: ``"sequential"`` (default), ``"window"`` or ``"concurrent"``.
+            count_mode: ``"exact"`` (default), ``"capped"``, ``"cached"`` or ``"none"``.
+            count_cap: Largest total counted in ``"capped"`` mode.
+            count_ttl: Seconds a total is cached in ``"cached"`` mode.
+            count_cache: Name of the configured cache for ``"cached"`` mode.
 
         Example:
             ```python
             async with self.session() as session:
                 stmt = select(UserModel).order_by(UserModel.created_at.desc())
-                return await self.paginate(session, stmt, params)
+                return await self.paginate(session, stmt, params, count_mode="capped", count_cap=1000)
             ```
         """
-        # 1. Execute Count Query
-        # Remove limit/offset (if any) for count query, then wrap in subquery
-        # subquery() handles order_by correctly, and wrapping in subquery handles complex queries (joins, groups)
-        count_base = statement.limit(None).offset(None)
-        count_stmt = select(func.count()).select_from(count_base.subquery())
-        total = (await session.execute(count_stmt)).scalar() or 0
+        if count_strategy not in ("sequential", "window", "concurrent"):
+            raise ValueError(f"Unknown count_strategy: {count_strategy!r}")
+        if count_mode not in ("exact", "capped", "cached", "none"):
+            raise ValueError(f"Unknown count_mode: {count_mode!r}")
+        if not params.include_total:
+            count_mode = "none"
 
-        # 2. Execute Paged Query
+        # Outside exact mode one extra row tells whether a next page exists.
+        probe = count_mode != "exact"
         skip = (params.page - 1) * params.size
-        paged_stmt = statement.offset(skip).limit(params.size)
-        result = await session.execute(paged_stmt)
-        items = result.scalars().all()
+        paged_stmt = statement.offset(skip).limit(params.size + 1 if probe else params.size)
+        count_stmt = _count_statement(statement, count_cap + 1 if count_mode == "capped" else None)
+
+        async def count(count_session: AsyncSession) -> Optional[int]:
+            if count_mode == "none":
+                return None
+            if count_mode == "cached":
+                return await self._cached_count(count_session, count_stmt, count_ttl, count_cache)
+            return (await count_session.execute(count_stmt)).scalar() or 0
+
+        async def fetch() -> List[Any]:
+            return list((await session.execute(paged_stmt)).scalars().all())
+
+        if (
+            count_mode == "exact"
+            and count_strategy == "window"
+            and _supports_window_count(session.get_bind().dialect, statement)
+        ):
+            rows = (await session.execute(paged_stmt.add_columns(func.count().over().label(_TOTAL_LABEL)))).all()
+            items = [row[0] for row in rows]
+            if rows:
+                total = rows[0][-1]
+            elif params.page == 1:
+                total = 0
+            else:  # past the last page: no row to carry the window count
+                total = await count(session)
+        elif (
+            count_mode != "none"
+            and count_strategy == "concurrent"
+            and (engine := _separate_engine(session)) is not None
+        ):
+
+            async def separate_count() -> Optional[int]:
+                async with AsyncSession(engine) as count_session:
+                    return await count(count_session)
+
+            total, items = await asyncio.gather(separate_count(), fetch())
+        else:
+            total = await count(session)
+            items = await fetch()
+
+        has_next = None
+        if probe:
+            has_next = len(items) > params.size
+            items = items[: params.size]
+        total_capped = False
+        if count_mode == "capped" and total > count_cap:
+            total, total_capped = count_cap, True
 
-        # 3. Optional Transformation
         if transformer:
             items = [transformer.model_validate(item) for item in items]
 
-        return PagedResponse.create(items=list(items), total=total, params=params)
+        return PagedResponse.create(
+            items=items,
+            total=total,
+            params=params,
+            has_next=has_next,
+            count_mode=count_mode,
+            total_capped=total_capped,
+        )
+
+    async def _cached_count(self, session: AsyncSession, count_stmt: Any, ttl: int, cache_name: Optional[str]) -> int:
+        """Run ``count_stmt`` through ``ZodiacCache.get_or_set`` (concurrent misses share one count)."""
+        from zodiac_core.cache import cache
+
+        async def produce() -> int:
+            return (await session.execute(count_stmt)).scalar() or 0
+
+        zc = cache.get_cache(cache_name) if cache_name is not None else cache.cache
+        return await zc.get_or_set(_count_cache_key(session, count_stmt), produce, ttl=ttl)
 
     async def paginate_query(
         self,
         statement: Any,
         params: PageParams,
         transformer: Optional[Type[T]] = None,
+        count_strategy: CountStrategy = "sequential",
+        count_mode: CountMode = "exact",
+        count_cap: int = DEFAULT_COUNT_CAP,
+        count_ttl: int = DEFAULT_COUNT_TTL,
+        count_cache: Optional[str] = None,
     ) -> PagedResponse[T]:
         """
         Convenience method that automatically manages session for pagination.
 
         This is a wrapper around `paginate()` that handles session management,
-        making it easier to use in repository methods.
+        making it easier to use in repository methods. The session is read-only:
+        it uses a replica of 'db_name' when one is configured.
 
         Args:
             statement: The SQLAlchemy select statement (without limit/offset).
             params: Standard PageParams (page, size).
             transformer: Optional Pydantic model to transform DB objects into.
+            count_strategy: How the count query runs; see `paginate()`.
+            count_mode: What the total is; see `paginate()`.
+            count_cap: Largest total counted in ``"capped"`` mode.
+            count_ttl: Seconds a total is cached in ``"cached"`` mode.
+            count_cache: Name of the configured cache for ``"cached"`` mode.
 
         Example:
             ```python
@@ -127,5 +411,346 @@ class BaseSQLRepository:
                 return await self.paginate_query(stmt, params)
             ```
         """
-        async with self.session() as session:
-            return await self.paginate(session, statement, params, transformer)
+        async with self.session(readonly=True) as session:
+            return await self.paginate(
+                session,
+                statement,
+                params,
+                transformer,
+                count_strategy=count_strategy,
+                count_mode=count_mode,
+                count_cap=count_cap,
+                count_ttl=count_ttl,
+                count_cache=count_cache,
+            )
+
+    async def paginate_keyset(
+        self,
+        session: AsyncSession,
+        statement: Any,
+        params: CursorParams,
+        order_by: Sequence[Any],
+        transformer: Optional[Type[T]] = None,
+    ) -> CursorPage[T]:
+        """
+        Execute a keyset (cursor) paginated query.
+
+        Unlike ``paginate``, no rows are skipped with OFFSET: the cursor holds the
+        ordering values of the boundary row and the next page is fetched with a
+        ``WHERE (columns) > (values)`` seek, so every page costs the same given an
+        index on the ordering columns. Ties are broken by the primary key of the
+        selected entity, which is appended to ``order_by`` when missing.
+
+        Performs:
+        1. Replacing the statement's ORDER BY with ``order_by`` (+ primary key).
+        2. Filtering rows after (or before) the cursor and fetching ``size + 1`` rows.
+        3. Packaging results into a CursorPage with ``next_cursor`` / ``prev_cursor``.
+
+        Args:
+            session: The active AsyncSession.
+            statement: The SQLAlchemy select statement (without limit/offset).
+            params: Standard CursorParams (cursor, size).
+            order_by: Ordering columns, optionally ``.asc()`` / ``.desc()``. They
+                must be non-nullable.
+            transformer: Optional Pydantic model to transform DB objects into.
+
+        Raises:
+            BadRequestException: If the cursor is malformed or does not match ``order_by``.
+
+        Example:
+            ```python
+            async with self.session() as session:
+                stmt = select(EventModel).where(EventModel.kind == kind)
+                return await self.paginate_keyset(session, stmt, params, order_by=[EventModel.created_at.desc()])
+            ```
+        """
+        columns = _keyset_columns(statement, order_by)
+        backward = False
+        if params.cursor is not None:
+            values, backward = decode_cursor(params.cursor)
+            if len(values) != len(columns):
+                raise BadRequestException(message="Invalid pagination cursor")
+            statement = statement.where(_keyset_predicate(columns, values, backward))
+
+        # Walking backwards reads the reversed ordering, then restores the page order.
+        ordering = [column.desc() if descending != backward else column.asc() for column, descending in columns]
+        keys = [column.label(f"_keyset_{index}") for index, (column, _) in enumerate(columns)]
+        paged_stmt = statement.order_by(None).order_by(*ordering).add_columns(*keys).limit(params.size + 1)
+        rows = list((await session.execute(paged_stmt)).all())
+
+        has_more = len(rows) > params.size
+        rows = rows[: params.size]
+        if backward:
+            rows.reverse()
+
+        next_cursor = prev_cursor = None
+        if rows:
+            # Coming back from a later page implies a next one; a forward cursor implies a previous one.
+            if has_more or backward:
+                next_cursor = encode_cursor(rows[-1][-len(keys) :])
+            if (has_more and backward) or (params.cursor is not None and not backward):
+                prev_cursor = encode_cursor(rows[0][-len(keys) :], backward=True)
+
+        items = [row[0] for row in rows]
+        if transformer:
+            items = [transformer.model_validate(item) for item in items]
+
+        return CursorPage.create(items=items, params=params, next_cursor=next_cursor, prev_cursor=prev_cursor)
+
+    async def paginate_keyset_query(
+        self,
+        statement: Any,
+        params: CursorParams,
+        order_by: Sequence[Any],
+        transformer: Optional[Type[T]] = None,
+    ) -> CursorPage[T]:
+        """
+        Convenience method that automatically manages session for keyset pagination.
+
+        This is a wrapper around `paginate_keyset()` that handles session management,
+        on a read-only session (a replica of 'db_name' when one is configured).
+
+        Example:
+            ```python
+            async def list_events(self, params: CursorParams) -> CursorPage[EventModel]:
+                stmt = select(EventModel)
+                return await self.paginate_keyset_query(stmt, params, order_by=[EventModel.created_at.desc()])
+            ```
+        """
+        async with self.session(readonly=True) as session:
+            return await self.paginate_keyset(session, statement, params, order_by, transformer)
+
+    async def stream(
+        self,
+        statement: Any,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        transformer: Optional[Type[T]] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over the results of ``statement`` without loading them all.
+
+        Rows are read ``chunk_size`` at a time through ``AsyncSession.stream``
+        with ``yield_per``, which uses a server-side cursor where the driver
+        supports one (asyncpg, aiomysql), so memory use depends on ``chunk_size``,
+        not on the size of the result. As with ``paginate``, the first selected
+        column (usually the entity) is yielded.
+
+        Args:
+            statement: The SQLAlchemy select statement.
+            chunk_size: Rows fetched (and transformed) per round trip.
+            transformer: Optional Pydantic model to transform DB objects into.
+            session: An active AsyncSession to stream on; by default a read-only
+                session (a replica when configured) is opened for the iteration.
+
+        Example:
+            ```python
+            async def export_items(self) -> AsyncIterator[ItemSchema]:
+                stmt = select(ItemModel).order_by(ItemModel.id)
+                async for item in self.stream(stmt, chunk_size=500, transformer=ItemSchema):
+                    yield item
+            ```
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        if session is None:
+            async with self.session(readonly=True) as own_session:
+                async for item in self.stream(statement, chunk_size, transformer, session=own_session):
+                    yield item
+            return
+
+        result = await session.stream(statement.execution_options(yield_per=chunk_size))
+        try:
+            async for chunk in result.scalars().partitions():
+                if transformer:
+                    chunk = [transformer.model_validate(item) for item in chunk]
+                for item in chunk:
+                    yield item
+        finally:
+            # Releases the server-side cursor when the consumer stops early.
+            await result.close()
+
+    async def _bulk_execute(
+        self,
+        session: AsyncSession,
+        stmt: Any,
+        values: List[Dict[str, Any]],
+        chunk_size: int,
+        returning: Optional[Sequence[Any]],
+    ) -> Union[int, List[Any]]:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        if returning:
+            if not session.get_bind().dialect.insert_executemany_returning:
+                raise ValueError(f"RETURNING is not supported for bulk inserts on '{session.get_bind().dialect.name}'")
+            stmt = stmt.returning(*returning, sort_by_parameter_order=True)
+        if not values:
+            return [] if returning else 0
+        returned: List[Any] = []
+        for chunk in batched(values, chunk_size):
+            result = await session.execute(stmt, list(chunk))
+            if returning:
+                returned.extend(result.all())
+        return returned if returning else len(values)
+
+    async def bulk_insert(
+        self,
+        session: AsyncSession,
+        model: Any,
+        rows: Iterable[BulkRow],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        returning: Optional[Sequence[Any]] = None,
+    ) -> Union[int, List[Any]]:
+        """
+        Insert many rows with one executemany ``INSERT`` per chunk instead of
+        adding and flushing ORM objects one by one.
+
+        Rows are model instances or mappings of column values; missing columns get
+        the model's defaults, so ``SQLDateTimeMixin`` timestamps are populated.
+        The instances passed in are not attached to the session.
+
+        Args:
+            session: The active AsyncSession. Nothing is committed.
+            model: The SQLModel table class.
+            rows: Model instances or mappings.
+            chunk_size: Rows sent per statement execution.
+            returning: Columns (or the model itself) to return for every inserted
+                row, in input order. Requires RETURNING support (PostgreSQL, SQLite
+                >= 3.35, MariaDB >= 10.5).
+
+        Returns:
+            The inserted rows when ``returning`` is given, otherwise the number of rows.
+
+        Example:
+            ```python
+            async with self.session() as session:
+                ids = await self.bulk_insert(session, ItemModel, items, returning=[ItemModel.id])
+                await session.commit()
+            ```
+        """
+        values = _bulk_values(model, rows)
+        return await self._bulk_execute(session, insert(model), values, chunk_size, returning)
+
+    async def bulk_upsert(
+        self,
+        session: AsyncSession,
+        model: Any,
+        rows: Iterable[BulkRow],
+        conflict_columns: Optional[Sequence[str]] = None,
+        update_columns: Optional[Sequence[str]] = None,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        returning: Optional[Sequence[Any]] = None,
+    ) -> Union[int, List[Any]]:
+        """
+        Insert many rows, updating the ones that already exist, with
+        ``INSERT ... ON CONFLICT DO UPDATE`` (PostgreSQL, SQLite) or
+        ``INSERT ... ON DUPLICATE KEY UPDATE`` (MySQL, MariaDB), batched like
+        ``bulk_insert``.
+
+        Existing rows keep their ``created_at``; ``updated_at`` is refreshed.
+
+        Args:
+            session: The active AsyncSession. Nothing is committed.
+            model: The SQLModel table class.
+            rows: Model instances or mappings.
+            conflict_columns: Columns of the unique constraint that detects existing
+                rows; defaults to the primary key. MySQL uses any unique key.
+            update_columns: Columns overwritten on conflict; defaults to every column
+                present in all rows except the conflict columns and ``created_at``.
+                An empty list leaves existing rows untouched.
+            chunk_size: Rows sent per statement execution.
+            returning: Columns (or the model itself) to return for every row, in
+                input order (not supported on MySQL).
+
+        Returns:
+            The affected rows when ``returning`` is given, otherwise the number of rows.
+
+        Example:
+            ```python
+            async with self.session() as session:
+                await self.bulk_upsert(session, ProductModel, products, conflict_columns=["sku"])
+                await session.commit()
+            ```
+        """
+        values = _bulk_values(model, rows)
+        if conflict_columns is None:
+            mapper = inspect(model)
+            conflict_columns = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+        if update_columns is None:
+            present = set.intersection(*(set(row) for row in values)) if values else set()
+            skipped = set(conflict_columns)
+            if issubclass(model, SQLDateTimeMixin):
+                skipped.add("created_at")
+            update_columns = [key for key in values[0] if key in present and key not in skipped] if values else []
+        stmt = _upsert_statement(model, session.get_bind().dialect, conflict_columns, update_columns)
+        return await self._bulk_execute(session, stmt, values, chunk_size, returning)
+
+    async def bulk_update(
+        self,
+        session: AsyncSession,
+        model: Any,
+        rows: Iterable[Mapping[str, Any]],
+        key_columns: Optional[Sequence[str]] = None,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> Optional[int]:
+        """
+        Update many rows with one executemany ``UPDATE ... WHERE key = ?`` per
+        chunk (rows with the same set of columns share a statement).
+
+        Each mapping holds the key columns and the new values; other columns are
+        left as they are. ``updated_at`` is set to now unless given. Rows that
+        match nothing are skipped.
+
+        Args:
+            session: The active AsyncSession. Nothing is committed.
+            model: The SQLModel table class.
+            rows: Mappings of key column values and columns to set.
+            key_columns: Columns identifying each row; defaults to the primary key.
+            chunk_size: Rows sent per statement execution.
+
+        Returns:
+            The number of matched rows, or None when the driver does not report
+            row counts for executemany (e.g. asyncpg).
+
+        Example:
+            ```python
+            async with self.session() as session:
+                await self.bulk_update(session, ItemModel, [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+                await session.commit()
+            ```
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        mapper = inspect(model)
+        table = mapper.local_table
+        if key_columns is None:
+            key_columns = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+        columns = {attr.key: attr.columns[0] for attr in mapper.column_attrs}
+        stamp = issubclass(model, SQLDateTimeMixin)
+        now = utc_now()
+
+        # executemany needs one statement per set of columns.
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            row = dict(row)
+            if stamp:
+                row.setdefault("updated_at", now)
+            missing = [key for key in key_columns if key not in row]
+            if missing:
+                raise ValueError(f"bulk_update rows must include the key columns {missing}")
+            names = tuple(key for key in row if key not in key_columns)
+            groups.setdefault(names, []).append({f"_{key}": value for key, value in row.items()})
+
+        # Drivers without sane executemany rowcount (asyncpg) report -1 per execution.
+        counted = session.get_bind().dialect.supports_sane_multi_rowcount
+        matched = 0
+        for names, params in groups.items():
+            stmt = (
+                update(table)
+                .where(and_(*(columns[key] == bindparam(f"_{key}") for key in key_columns)))
+                .values({columns[name].name: bindparam(f"_{name}") for name in names})
+            )
+            for chunk in batched(params, chunk_size):
+                result = await session.execute(stmt, list(chunk))
+                matched += result.rowcount
+        return matched if counted else None
@@ -1,17 +1,20 @@
+import itertools
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from copy import deepcopy
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Dict, FrozenSet, List, Literal, Optional, Sequence
 
 from loguru import logger
 
 try:
-    from sqlalchemy import text
+    from sqlalchemy import event, text
     from sqlalchemy.ext.asyncio import (
         AsyncEngine,
         AsyncSession,
         async_sessionmaker,
         create_async_engine,
     )
+    from sqlalchemy.orm import Session
     from sqlmodel import SQLModel
 except ImportError as e:
     raise ImportError(
@@ -22,6 +25,37 @@ except ImportError as e:
 # Global constant for the default database name
 DEFAULT_DB_NAME = "default"
 
+ReplicaSelection = Literal["round_robin", "least_connections"]
+
+# Session.info key naming the primary database a session writes to.
+_PRIMARY_INFO_KEY = "zodiac_primary_db"
+
+# Primary databases written to in the current context (request); their reads stay on the primary.
+_written_databases: ContextVar[FrozenSet[str]] = ContextVar("zodiac_written_databases", default=frozenset())
+
+
+def _remember_write(name: str) -> None:
+    if name not in _written_databases.get():
+        _written_databases.set(_written_databases.get() | {name})
+
+
+def _mark_written(session: Session) -> None:
+    name = session.info.get(_PRIMARY_INFO_KEY)
+    if name is not None:
+        _remember_write(name)
+
+
+# SQLAlchemy runs these in the calling task's context, so the ContextVar update is seen by later reads.
+@event.listens_for(Session, "after_flush")
+def _receive_after_flush(session, flush_context):
+    _mark_written(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _receive_do_orm_execute(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _mark_written(orm_execute_state.session)
+
 
 @asynccontextmanager
 async def manage_session(factory: async_sessionmaker[AsyncSession]) -> AsyncGenerator[AsyncSession, None]:
@@ -50,6 +84,46 @@ async def manage_session(factory: async_sessionmaker[AsyncSession]) -> AsyncGene
         await session.close()
 
 
+class _ReplicaGroup:
+    """Read replicas of one database and the policy picking one for each read-only session."""
+
+    def __init__(
+        self,
+        engines: List[AsyncEngine],
+        factories: List[async_sessionmaker[AsyncSession]],
+        selection: ReplicaSelection,
+    ) -> None:
+        self.engines = engines
+        self.factories = factories
+        self.selection = selection
+        # Connections checked out per replica, kept by pool events (works with any pool class).
+        self.in_use = [0] * len(engines)
+        self._cursor = itertools.count()
+        for index, engine in enumerate(engines):
+            event.listen(engine.sync_engine, "checkout", self._on_checkout(index))
+            event.listen(engine.sync_engine, "checkin", self._on_checkin(index))
+
+    def _on_checkout(self, index: int):
+        def receive(dbapi_connection, connection_record, connection_proxy):
+            self.in_use[index] += 1
+
+        return receive
+
+    def _on_checkin(self, index: int):
+        def receive(dbapi_connection, connection_record):
+            self.in_use[index] = max(0, self.in_use[index] - 1)
+
+        return receive
+
+    def pick(self) -> async_sessionmaker[AsyncSession]:
+        """Factory of the next replica: rotating, or the least busy one (ties rotate)."""
+        start = next(self._cursor) % len(self.factories)
+        order = [(start + offset) % len(self.factories) for offset in range(len(self.factories))]
+        if self.selection == "least_connections":
+            return self.factories[min(order, key=lambda index: self.in_use[index])]
+        return self.factories[order[0]]
+
+
 class DatabaseManager:
     """
     Manages multiple Async Database Engines and Session Factories.
@@ -107,6 +181,7 @@ class DatabaseManager:
             cls._instance._engines: Dict[str, AsyncEngine] = {}
             cls._instance._session_factories: Dict[str, async_sessionmaker[AsyncSession]] = {}
             cls._instance._setup_configs: Dict[str, Dict[str, Any]] = {}
+            cls._instance._replica_groups: Dict[str, _ReplicaGroup] = {}
         return cls._instance
 
     def get_engine(self, name: str = DEFAULT_DB_NAME) -> AsyncEngine:
@@ -115,12 +190,37 @@ class DatabaseManager:
             raise RuntimeError(f"Database engine '{name}' is not initialized. Call db.setup(name='{name}') first.")
         return self._engines[name]
 
-    def get_factory(self, name: str = DEFAULT_DB_NAME) -> async_sessionmaker[AsyncSession]:
-        """Access a specific AsyncSession factory by name."""
+    def get_factory(self, name: str = DEFAULT_DB_NAME, readonly: bool = False) -> async_sessionmaker[AsyncSession]:
+        """
+        Access a specific AsyncSession factory by name.
+
+        With ``readonly=True`` the factory of a replica is returned (see
+        ``setup(replicas=...)``), unless there are none or the current context
+        already wrote to this database (read-your-writes).
+        """
         if name not in self._session_factories:
             raise RuntimeError(f"Session factory for '{name}' is not initialized. Call db.setup(name='{name}') first.")
+        group = self._replica_groups.get(name)
+        if readonly and group is not None and name not in _written_databases.get():
+            return group.pick()
         return self._session_factories[name]
 
+    def get_replica_engines(self, name: str = DEFAULT_DB_NAME) -> List[AsyncEngine]:
+        """The replica engines of a database (empty when it has none)."""
+        group = self._replica_groups.get(name)
+        return list(group.engines) if group is not None else []
+
+    def mark_written(self, name: str = DEFAULT_DB_NAME) -> None:
+        """
+        Send the read-only sessions of the current context (request) for ``name``
+        to the primary from now on.
+
+        Flushes and ORM/Core ``INSERT`` / ``UPDATE`` / ``DELETE`` statements on a
+        primary session do this automatically; call it after writes the session
+        cannot see, such as ``text()`` statements.
+        """
+        _remember_write(name)
+
     @property
     def engine(self) -> AsyncEngine:
         """Access the default SQLAlchemy AsyncEngine."""
@@ -140,9 +240,23 @@ class DatabaseManager:
         max_overflow: int = 20,
         pool_pre_ping: bool = True,
         connect_args: Optional[dict] = None,
+        replicas: Optional[Sequence[str]] = None,
+        replica_selection: ReplicaSelection = "round_robin",
         **kwargs,
     ) -> None:
-        """Initialize an Async Engine and Session Factory with a specific name."""
+        """
+        Initialize an Async Engine and Session Factory with a specific name.
+
+        Args:
+            replicas: URLs of read replicas of ``database_url``. Read-only sessions
+                (``db.session(readonly=True)``, repository reads) use them, except
+                after a write in the same context (read-your-writes). Engines are
+                created with the same options as the primary.
+            replica_selection: ``"round_robin"`` or ``"least_connections"`` (fewest
+                checked-out connections).
+        """
+        if replica_selection not in ("round_robin", "least_connections"):
+            raise ValueError(f"Unknown replica_selection: {replica_selection!r}")
         engine_args = {
             "echo": echo,
             "pool_pre_ping": pool_pre_ping,
@@ -158,6 +272,9 @@ class DatabaseManager:
             "database_url": database_url,
             "engine_args": deepcopy(engine_args),
         }
+        if replicas:
+            current["replicas"] = list(replicas)
+            current["replica_selection"] = replica_selection
 
         if name in self._engines:
             existing = self._setup_configs.get(name)
@@ -172,11 +289,21 @@ class DatabaseManager:
             class_=AsyncSession,
             expire_on_commit=False,
             autoflush=False,
+            info={_PRIMARY_INFO_KEY: name},
         )
 
         self._engines[name] = engine
         self._session_factories[name] = factory
         self._setup_configs[name] = current
+        if replicas:
+            replica_engines = [create_async_engine(url, **engine_args) for url in replicas]
+            replica_factories = [
+                async_sessionmaker(bind=replica, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+                for replica in replica_engines
+            ]
+            self._replica_groups[name] = _ReplicaGroup(replica_engines, replica_factories, replica_selection)
+            logger.info(f"Database '{name}' initialized successfully with {len(replicas)} replica(s).")
+            return
         logger.info(f"Database '{name}' initialized successfully.")
 
     async def shutdown(self, name: str | None = None) -> None:
@@ -191,21 +318,33 @@ class DatabaseManager:
             engine = self._engines.pop(name, None)
             self._session_factories.pop(name, None)
             self._setup_configs.pop(name, None)
+            group = self._replica_groups.pop(name, None)
             if engine is not None:
                 await engine.dispose()
+            for replica in group.engines if group is not None else ():
+                await replica.dispose()
             return
 
         for engine in self._engines.values():
             await engine.dispose()
+        for group in self._replica_groups.values():
+            for replica in group.engines:
+                await replica.dispose()
         self._engines.clear()
         self._session_factories.clear()
         self._setup_configs.clear()
+        self._replica_groups.clear()
 
     @asynccontextmanager
-    async def session(self, name: str = DEFAULT_DB_NAME) -> AsyncGenerator[AsyncSession, None]:
+    async def session(self, name: str = DEFAULT_DB_NAME, readonly: bool = False) -> AsyncGenerator[AsyncSession, None]:
         """
         Context Manager for obtaining a NEW database session from a specific engine.
 
+        Args:
+            name: The database name.
+            readonly: Use a replica when the database has some and the current
+                context has not written to it (see ``get_factory``).
+
         Note:
             This context manager does NOT auto-commit. You must explicitly call
             `await session.commit()` to persist changes to the database.
@@ -215,9 +354,12 @@ class DatabaseManager:
             async with db.session() as session:
                 session.add(user)
                 await session.commit()  # Required to persist changes
+
+            async with db.session(readonly=True) as session:
+                users = (await session.execute(select(User))).scalars().all()
             ```
         """
-        async with manage_session(self.get_factory(name)) as session:
+        async with manage_session(self.get_factory(name, readonly=readonly)) as session:
             yield session
 
     async def verify(self, name: str = DEFAULT_DB_NAME) -> bool:
@@ -236,6 +378,9 @@ class DatabaseManager:
         """
         async with self.session(name) as session:
             await session.execute(text("SELECT 1"))
+        for replica in self.get_replica_engines(name):
+            async with replica.connect() as conn:
+                await conn.execute(text("SELECT 1"))
         logger.info(f"Database '{name}' connection verified.")
         return True
 
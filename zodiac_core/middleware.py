@@ -1,5 +1,5 @@
 """
-Middleware stack: Trace ID and Access Log.
+Middleware stack: Trace ID, Access Log and request memo.
 
 Implemented as Pure ASGI middleware (no BaseHTTPMiddleware).
 
@@ -16,7 +16,7 @@ from loguru import logger
 from starlette.datastructures import MutableHeaders
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from zodiac_core.context import request_id_scope, service_name_scope
+from zodiac_core.context import request_id_scope, request_memo_scope, service_name_scope
 
 
 def default_id_generator() -> str:
@@ -143,13 +143,35 @@ class ServiceNameMiddleware:
         await self.app(scope, receive, send)
 
 
+class RequestMemoMiddleware:
+    """
+    Request memo middleware (Pure ASGI).
+
+    Opens a request-scoped memo store (zodiac_core.context) for every HTTP
+    request and WebSocket connection, used by ``@memoize_request`` and
+    ``@cached(request_scope=True)``. The store is dropped when the request ends.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in {"http", "websocket"}:
+            with request_memo_scope():
+                await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
 def register_middleware(app: ASGIApp, service_name: str | None = None) -> None:
     """
-    Register TraceID and AccessLog middlewares in the correct order.
+    Register TraceID, AccessLog and RequestMemo middlewares in the correct order.
 
-    Order: TraceID (outer) then ServiceName (optional) then AccessLog (inner),
-    so the access log can include request_id and service from context.
+    Order: TraceID (outer) then ServiceName (optional) then AccessLog then
+    RequestMemo (inner), so the access log can include request_id and service
+    from context.
     """
+    app.add_middleware(RequestMemoMiddleware)
     app.add_middleware(AccessLogMiddleware)
     if service_name is not None:
         app.add_middleware(ServiceNameMiddleware, service_name=service_name)
@@ -1,9 +1,29 @@
-from typing import Generic, List, TypeVar
+import base64
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Generic, List, Literal, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from zodiac_core.exceptions import BadRequestException
+
 T = TypeVar("T")
 
+# How ``PagedResponse.total`` was obtained (see ``BaseSQLRepository.paginate``).
+CountMode = Literal["exact", "capped", "cached", "none"]
+
+# Type tags for cursor values JSON cannot represent natively.
+_CURSOR_DECODERS = {
+    "dt": datetime.fromisoformat,
+    "d": date.fromisoformat,
+    "t": time.fromisoformat,
+    "dec": Decimal,
+    "uuid": UUID,
+}
+
 
 class PageParams(BaseModel):
     """
@@ -25,6 +45,7 @@ class PageParams(BaseModel):
 
     page: int = Field(1, ge=1, description="Page number (1-based)")
     size: int = Field(20, ge=1, le=100, description="Page size")
+    include_total: bool = Field(True, description="Count the total; false only reports whether a next page exists")
 
 
 class PagedResponse(BaseModel, Generic[T]):
@@ -47,28 +68,160 @@ class PagedResponse(BaseModel, Generic[T]):
     model_config = ConfigDict(populate_by_name=True)
 
     items: List[T] = Field(description="List of items for the current page")
-    total: int = Field(description="Total number of items")
+    total: Optional[int] = Field(description="Total number of items; null when it was not counted")
     page: int = Field(description="Current page number")
     size: int = Field(description="Current page size")
+    has_next: Optional[bool] = Field(None, description="Whether a next page exists")
+    count_mode: CountMode = Field(
+        "exact",
+        description="How total was obtained: exact, capped (at most the cap), cached (may be stale) or none",
+    )
+    total_capped: bool = Field(False, description="True when there are more items than total (capped count)")
 
     @classmethod
     def create(
         cls,
         items: List[T],
-        total: int,
+        total: Optional[int],
         params: PageParams,
+        has_next: Optional[bool] = None,
+        count_mode: CountMode = "exact",
+        total_capped: bool = False,
     ) -> "PagedResponse[T]":
         """
         Factory method to create a PagedResponse from items, total count, and PageParams.
 
         Args:
             items: The list of data objects (Pydantic models or dicts).
-            total: The total number of records in the database matching the query.
+            total: The total number of records in the database matching the query,
+                or None when it was not counted.
             params: The PageParams object from the request.
+            has_next: Whether a next page exists; derived from ``total`` when omitted.
+            count_mode: How ``total`` was obtained.
+            total_capped: True when ``total`` is a cap below the real count.
         """
+        if has_next is None and total is not None:
+            if params.page * params.size < total:
+                has_next = True
+            elif not total_capped:  # past a capped total it is unknown
+                has_next = False
         return cls(
             items=items,
             total=total,
             page=params.page,
             size=params.size,
+            has_next=has_next,
+            count_mode=count_mode,
+            total_capped=total_capped,
         )
+
+
+class CursorParams(BaseModel):
+    """
+    Keyset (cursor) pagination query parameters.
+
+    ``cursor`` is an opaque token taken from ``next_cursor`` / ``prev_cursor``
+    of a previous ``CursorPage``; omit it to fetch the first page.
+
+    Usage:
+        ```python
+        from typing import Annotated
+        from fastapi import Query
+        from zodiac_core.pagination import CursorPage, CursorParams
+
+        @app.get("/events", response_model=CursorPage[EventSchema])
+        async def list_events(params: Annotated[CursorParams, Query()]):
+            return await repo.list_events(params)
+        ```
+    """
+
+    cursor: Optional[str] = Field(None, description="Opaque cursor of the page to fetch")
+    size: int = Field(20, ge=1, le=100, description="Page size")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    Standard generic keyset-paginated response model.
+
+    ``next_cursor`` / ``prev_cursor`` are None when there is no page in that
+    direction. There is deliberately no total: counting would reintroduce the
+    full scan keyset pagination avoids.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    items: List[T] = Field(description="List of items for the current page")
+    size: int = Field(description="Requested page size")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, if any")
+    prev_cursor: Optional[str] = Field(None, description="Cursor of the previous page, if any")
+
+    @classmethod
+    def create(
+        cls,
+        items: List[T],
+        params: CursorParams,
+        next_cursor: Optional[str] = None,
+        prev_cursor: Optional[str] = None,
+    ) -> "CursorPage[T]":
+        """
+        Factory method to create a CursorPage from items, CursorParams and the neighbouring cursors.
+
+        Args:
+            items: The list of data objects (Pydantic models or dicts).
+            params: The CursorParams object from the request.
+            next_cursor: Cursor of the following page (see ``encode_cursor``).
+            prev_cursor: Cursor of the preceding page.
+        """
+        return cls(items=items, size=params.size, next_cursor=next_cursor, prev_cursor=prev_cursor)
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        value = value.value
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    for tag, kind in (("dt", datetime), ("d", date), ("t", time)):
+        if isinstance(value, kind):
+            return {tag: value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    raise TypeError(f"Cannot encode {type(value).__qualname__} in a pagination cursor")
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        ((tag, raw),) = value.items()
+        return _CURSOR_DECODERS[tag](raw)
+    return value
+
+
+def encode_cursor(values: Sequence[Any], backward: bool = False) -> str:
+    """
+    Encode the ordering values of a boundary row into an opaque, URL-safe cursor.
+
+    Args:
+        values: Values of the ordering columns (JSON scalars, datetimes, dates,
+            times, Decimals, UUIDs or Enums).
+        backward: True for a cursor pointing to the rows before ``values``.
+    """
+    payload = {"v": [_encode_cursor_value(value) for value in values], "b": backward}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[List[Any], bool]:
+    """
+    Decode a cursor produced by ``encode_cursor`` into ``(values, backward)``.
+
+    Raises:
+        BadRequestException: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [_decode_cursor_value(value) for value in payload["v"]]
+        return values, bool(payload["b"])
+    except (ValueError, TypeError, KeyError, AttributeError, ArithmeticError) as e:
+        raise BadRequestException(message="Invalid pagination cursor") from e
@@ -1,11 +1,19 @@
-from typing import Any, Generic, Optional, TypeVar
+from collections.abc import AsyncIterable, AsyncIterator
+from http import HTTPStatus
+from typing import Any, Generic, Literal, Mapping, Optional, TypeVar
 
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
+
+from .exceptions import ZodiacException
 
 T = TypeVar("T")
 
+StreamFormat = Literal["json", "ndjson"]
+
 
 class Response(BaseModel, Generic[T]):
     """Standard API response model."""
@@ -121,3 +129,96 @@ def response_server_error(
 ) -> JSONResponse:
     """Create a server error response (500 Internal Server Error)"""
     return create_response(status.HTTP_500_INTERNAL_SERVER_ERROR, code=code, data=data, message=message)
+
+
+class StreamingDataResponse(StreamingResponse):
+    """
+    Streams items from an async iterator (e.g. ``BaseSQLRepository.stream``) as
+    they are produced, so time-to-first-byte and memory do not grow with the
+    number of items.
+
+    Two formats:
+
+    - ``"json"`` (default): the standard envelope, with ``data`` as a JSON array
+      written incrementally: ``{"data":[{...},{...}],"code":0,"message":"Success"}``.
+      ``code`` and ``message`` come last so that an error raised while iterating
+      can still be reported: the array is closed and the envelope ends with the
+      error code and message (the HTTP status, already sent, stays 200).
+    - ``"ndjson"``: one JSON document per line (``application/x-ndjson``), no
+      envelope. An error while iterating aborts the response.
+
+    Items are serialized with pydantic (models, dataclasses, dicts, datetimes,
+    ...). ``ZodiacRoute`` passes this response through unchanged, and wraps async
+    iterators returned by endpoints in it.
+
+    Args:
+        items: Async iterable of items to emit.
+        format: ``"json"`` or ``"ndjson"``.
+        code: Business status code of the envelope (``"json"`` only).
+        message: Message of the envelope (``"json"`` only).
+        status_code: HTTP status code.
+        headers: Extra response headers.
+        flush_size: Serialized bytes buffered before a chunk is sent.
+
+    Example:
+        ```python
+        @router.get("/items/export")
+        async def export_items(format: StreamFormat = "json"):
+            return StreamingDataResponse(repo.stream(select(ItemModel), transformer=ItemSchema), format=format)
+        ```
+    """
+
+    def __init__(
+        self,
+        items: AsyncIterable[Any],
+        format: StreamFormat = "json",
+        code: int = 0,
+        message: str = "Success",
+        status_code: int = status.HTTP_200_OK,
+        headers: Optional[Mapping[str, str]] = None,
+        flush_size: int = 64 * 1024,
+    ) -> None:
+        if format not in ("json", "ndjson"):
+            raise ValueError(f"Unknown stream format: {format!r}")
+        self.items = items
+        self.format = format
+        self.code = code
+        self.message = message
+        self.flush_size = flush_size
+        media_type = "application/json" if format == "json" else "application/x-ndjson"
+        super().__init__(self._body(), status_code=status_code, headers=headers, media_type=media_type)
+
+    async def _body(self) -> AsyncIterator[bytes]:
+        envelope = self.format == "json"
+        if envelope:
+            # The opening is sent right away, before the first item is produced.
+            yield b'{"data":['
+        buffer = bytearray()
+        code, message = self.code, self.message
+        first = True
+        try:
+            async for item in self.items:
+                if envelope and not first:
+                    buffer += b","
+                first = False
+                buffer += to_json(item)
+                if not envelope:
+                    buffer += b"\n"
+                if len(buffer) >= self.flush_size:
+                    yield bytes(buffer)
+                    buffer.clear()
+        except Exception as exc:
+            if not envelope:
+                if buffer:
+                    yield bytes(buffer)
+                raise
+            logger.exception(f"Streaming response aborted: {exc!r}")
+            if isinstance(exc, ZodiacException):
+                code, message = exc.code, getattr(exc, "message", HTTPStatus(exc.http_code).phrase)
+            else:
+                code, message = status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal Server Error"
+        if envelope:
+            # ``code`` / ``message`` close the envelope: '],"code":0,"message":"Success"}'.
+            buffer += b"]," + to_json({"code": code, "message": message})[1:]
+        if buffer:
+            yield bytes(buffer)
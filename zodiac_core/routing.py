@@ -1,4 +1,5 @@
 import inspect
+from collections.abc import AsyncIterator
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, Union, get_origin
 
@@ -7,7 +8,7 @@ from fastapi import Response as FastAPIResponse
 from fastapi.datastructures import DefaultPlaceholder  # FastAPI internal, requires >=0.128.0
 from fastapi.routing import APIRoute
 
-from zodiac_core.response import Response
+from zodiac_core.response import Response, StreamingDataResponse
 
 
 class ZodiacRoute(APIRoute):
@@ -74,9 +75,11 @@ class ZodiacRoute(APIRoute):
 
     @staticmethod
     def _maybe_wrap_result(result: Any) -> Any:
-        """Wrap result in Response if not already a Response type."""
+        """Wrap result in Response if not already a Response type; stream async iterators."""
         if isinstance(result, (Response, FastAPIResponse)):
             return result
+        if isinstance(result, AsyncIterator):
+            return StreamingDataResponse(result)
         return Response(data=result)
 
     @staticmethod